@@ -0,0 +1,12 @@
+from ..http_cache import cache_validators
+
+# Terms, courses, and sections are returned with each other, their staff, and their rooms.
+academics_cache_validators = cache_validators(
+    "academics__term",
+    "academics__course",
+    "academics__section",
+    "academics__user_section",
+    "academics__section_room",
+    "room",
+    "section_member",
+)
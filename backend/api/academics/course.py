@@ -4,6 +4,7 @@ This API is used to access course data."""
 
 from fastapi import APIRouter, Depends
 from ..authentication import registered_user
+from . import academics_cache_validators
 from ...services.academics import CourseService
 from ...models import User
 from ...models.academics import Course, CourseDetails
@@ -20,7 +21,12 @@ openapi_tags = {
 }
 
 
-@api.get("", response_model=list[CourseDetails], tags=["Academics"])
+@api.get(
+    "",
+    response_model=list[CourseDetails],
+    tags=["Academics"],
+    dependencies=[Depends(academics_cache_validators)],
+)
 def get_courses(course_service: CourseService = Depends()) -> list[CourseDetails]:
     """
     Get all courses
@@ -31,7 +37,12 @@ def get_courses(course_service: CourseService = Depends()) -> list[CourseDetails
     return course_service.all()
 
 
-@api.get("/{id}", response_model=CourseDetails, tags=["Academics"])
+@api.get(
+    "/{id}",
+    response_model=CourseDetails,
+    tags=["Academics"],
+    dependencies=[Depends(academics_cache_validators)],
+)
 def get_course_by_id(
     id: str, course_service: CourseService = Depends()
 ) -> CourseDetails:
@@ -44,7 +55,12 @@ def get_course_by_id(
     return course_service.get_by_id(id)
 
 
-@api.get("/{subject_code}/{number}", response_model=CourseDetails, tags=["Academics"])
+@api.get(
+    "/{subject_code}/{number}",
+    response_model=CourseDetails,
+    tags=["Academics"],
+    dependencies=[Depends(academics_cache_validators)],
+)
 def get_course_by_subject_code(
     subject_code: str, number: str, course_service: CourseService = Depends()
 ) -> CourseDetails:
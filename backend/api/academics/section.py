@@ -4,6 +4,7 @@ This API is used to access course data."""
 
 from fastapi import APIRouter, Depends
 from ..authentication import registered_user
+from . import academics_cache_validators
 from ...services.academics import SectionService
 from ...models import User
 from ...models.academics import Section, SectionDetails
@@ -16,7 +17,12 @@ __license__ = "MIT"
 api = APIRouter(prefix="/api/academics/section")
 
 
-@api.get("", response_model=list[SectionDetails], tags=["Academics"])
+@api.get(
+    "",
+    response_model=list[SectionDetails],
+    tags=["Academics"],
+    dependencies=[Depends(academics_cache_validators)],
+)
 def get_sections(section_service: SectionService = Depends()) -> list[SectionDetails]:
     """
     Get all sections
@@ -27,7 +33,12 @@ def get_sections(section_service: SectionService = Depends()) -> list[SectionDet
     return section_service.all()
 
 
-@api.get("/{id}", response_model=SectionDetails, tags=["Academics"])
+@api.get(
+    "/{id}",
+    response_model=SectionDetails,
+    tags=["Academics"],
+    dependencies=[Depends(academics_cache_validators)],
+)
 def get_section_by_id(
     id: int, section_service: SectionService = Depends()
 ) -> SectionDetails:
@@ -40,7 +51,12 @@ def get_section_by_id(
     return section_service.get_by_id(id)
 
 
-@api.get("/term/{term_id}", response_model=list[SectionDetails], tags=["Academics"])
+@api.get(
+    "/term/{term_id}",
+    response_model=list[SectionDetails],
+    tags=["Academics"],
+    dependencies=[Depends(academics_cache_validators)],
+)
 def get_section_by_term_id(
     term_id: str, section_service: SectionService = Depends()
 ) -> list[SectionDetails]:
@@ -53,7 +69,12 @@ def get_section_by_term_id(
     return section_service.get_by_term(term_id)
 
 
-@api.get("/subject/{subject}", response_model=list[SectionDetails], tags=["Academics"])
+@api.get(
+    "/subject/{subject}",
+    response_model=list[SectionDetails],
+    tags=["Academics"],
+    dependencies=[Depends(academics_cache_validators)],
+)
 def get_section_by_subject(
     subject: str, section_service: SectionService = Depends()
 ) -> list[SectionDetails]:
@@ -70,6 +91,7 @@ def get_section_by_subject(
     "/{subject_code}/{course_number}/{section_number}",
     response_model=SectionDetails,
     tags=["Academics"],
+    dependencies=[Depends(academics_cache_validators)],
 )
 def get_section_by_subject_code(
     subject_code: str,
@@ -4,6 +4,7 @@ This API is used to access term data."""
 
 from fastapi import APIRouter, Depends
 from ..authentication import registered_user
+from . import academics_cache_validators
 from ...services.academics import TermService
 from ...models import User
 from ...models.academics import Term, TermDetails
@@ -17,7 +18,12 @@ __license__ = "MIT"
 api = APIRouter(prefix="/api/academics/term")
 
 
-@api.get("", response_model=list[TermDetails], tags=["Academics"])
+@api.get(
+    "",
+    response_model=list[TermDetails],
+    tags=["Academics"],
+    dependencies=[Depends(academics_cache_validators)],
+)
 def get_terms(term_service: TermService = Depends()) -> list[TermDetails]:
     """
     Get all terms
@@ -39,7 +45,12 @@ def get_current_term(term_service: TermService = Depends()) -> TermDetails:
     return term_service.get_by_date(datetime.today())
 
 
-@api.get("/{id}", response_model=TermDetails, tags=["Academics"])
+@api.get(
+    "/{id}",
+    response_model=TermDetails,
+    tags=["Academics"],
+    dependencies=[Depends(academics_cache_validators)],
+)
 def get_term_by_id(id: str, term_service: TermService = Depends()) -> TermDetails:
     """
     Gets one term by its id
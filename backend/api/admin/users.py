@@ -26,11 +26,16 @@ def list_users(
     page_size: int = 10,
     order_by: str = "first_name",
     filter: str = "",
+    cursor: str = "",
 ) -> Paginated[User]:
     """List users via standard backend pagination query parameters."""
     try:
         pagination_params = PaginationParams(
-            page=page, page_size=page_size, order_by=order_by, filter=filter
+            page=page,
+            page_size=page_size,
+            order_by=order_by,
+            filter=filter,
+            cursor=cursor,
         )
         return user_service.list(subject, pagination_params)
     except UserPermissionException as e:
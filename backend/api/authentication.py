@@ -59,16 +59,20 @@ for routes used in the process of registering a user.
 """
 
 import jwt
-import requests
+import time
 from datetime import datetime, timedelta
 from fastapi import APIRouter, Header, HTTPException, Request, Response, Depends
 from fastapi.exceptions import HTTPException
 from fastapi.security import HTTPBearer
 from fastapi.security.http import HTTPAuthorizationCredentials
 from fastapi.responses import RedirectResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+from ..database import async_db_session
 from ..env import getenv
-from ..services import UserService, GitHubService
-from ..models import User
+from ..services import UserService, GitHubService, PermissionService
+from ..services import user_cache
+from ..services.user_cache import registered_users
+from ..models import User, UserDetails
 
 
 __authors__ = ["Kris Jordan"]
@@ -87,20 +91,82 @@ def registered_user(
     user_service: UserService = Depends(),
     token: HTTPAuthorizationCredentials | None = Depends(HTTPBearer()),
 ) -> User:
-    """Returns the authenticated user or raises a 401 HTTPException if the user is not authenticated."""
+    """Returns the authenticated user or raises a 401 HTTPException if the user is not authenticated.
+
+    Verified tokens and their resolved users are cached briefly, so that the hot path of an
+    authenticated request is a dictionary lookup rather than JWT verification plus user and
+    permission queries. A copy of the cached user is returned so that callers may modify it.
+    """
     if token:
+        cached = registered_users.get(token.credentials)
+        if cached is not None:
+            return cached[1].model_copy()
         try:
             auth_info = jwt.decode(
                 token.credentials, _JWT_SECRET, algorithms=[_JST_ALGORITHM]
             )
+            generation = user_cache.generation()
             user = user_service.get(auth_info["pid"])
             if user:
-                return user
+                return _cache_registered_user(token, auth_info, user, generation)
+        except:
+            ...
+    raise HTTPException(status_code=401, detail="Unauthorized")
+
+
+async def registered_user_async(
+    session: AsyncSession = Depends(async_db_session),
+    token: HTTPAuthorizationCredentials | None = Depends(HTTPBearer()),
+) -> User:
+    """Async variant of `registered_user` for async endpoints.
+
+    Resolving the user on a cache miss runs through the request's AsyncSession, so the
+    dependency never occupies a threadpool worker."""
+    if token:
+        cached = registered_users.get(token.credentials)
+        if cached is not None:
+            return cached[1].model_copy()
+        try:
+            auth_info = jwt.decode(
+                token.credentials, _JWT_SECRET, algorithms=[_JST_ALGORITHM]
+            )
+            generation = user_cache.generation()
+            user = await session.run_sync(
+                lambda sync_session: UserService(
+                    sync_session, PermissionService(sync_session)
+                ).get(auth_info["pid"])
+            )
+            if user:
+                return _cache_registered_user(token, auth_info, user, generation)
         except:
             ...
     raise HTTPException(status_code=401, detail="Unauthorized")
 
 
+def _cache_registered_user(
+    token: HTTPAuthorizationCredentials,
+    auth_info: dict,
+    user: UserDetails,
+    generation: int,
+) -> User:
+    """Cache a verified token's user unless invalidated since `generation`, and return a copy."""
+    user_cache.cache_user(
+        token.credentials,
+        auth_info,
+        user,
+        generation,
+        _time_until_expiration(auth_info),
+    )
+    return user.model_copy()
+
+
+def _time_until_expiration(auth_info: dict) -> timedelta | None:
+    """Time remaining before a decoded token's `exp` claim, so it is never cached past expiry."""
+    if "exp" not in auth_info:
+        return None
+    return timedelta(seconds=auth_info["exp"] - time.time())
+
+
 def authenticated_pid(
     token: HTTPAuthorizationCredentials | None = Depends(HTTPBearer()),
 ) -> tuple[int, str]:
@@ -226,6 +292,9 @@ def _delegate_to_auth_server(continue_to: str):
 
 
 def _verify_delegated_auth_token(continue_to: str, token: str):
+    # Only used in development, so requests is not imported at startup.
+    import requests
+
     params = {"token": token}
     response = requests.get(f"https://{AUTH_SERVER_HOST}/verify", params=params)
     if response.status_code == requests.codes.ok:
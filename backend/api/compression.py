@@ -0,0 +1,41 @@
+"""Compression of API responses.
+
+Static files are compressed when the front-end is built (see `api/static_files.py`), so only
+API responses are compressed as they are sent. Responses smaller than a minimum size are sent
+as-is, since compressing them saves little and costs a round of CPU work per request.
+"""
+
+from starlette.middleware.gzip import GZipMiddleware
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+__authors__ = ["Kris Jordan"]
+__copyright__ = "Copyright 2023"
+__license__ = "MIT"
+
+
+class APIGZipMiddleware(GZipMiddleware):
+    """GZip compression of responses to requests under a path prefix."""
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        prefix: str = "/api/",
+        minimum_size: int = 1024,
+        compresslevel: int = 6,
+    ) -> None:
+        """Initializes the middleware.
+
+        Args:
+            app (ASGIApp): The application whose responses are compressed.
+            prefix (str): The path prefix of requests whose responses are compressed.
+            minimum_size (int): The size in bytes below which responses are not compressed.
+            compresslevel (int): The gzip compression level, trading size for CPU time.
+        """
+        super().__init__(app, minimum_size=minimum_size, compresslevel=compresslevel)
+        self.prefix = prefix
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "http" and scope["path"].startswith(self.prefix):
+            await super().__call__(scope, receive, send)
+        else:
+            await self.app(scope, receive, send)
@@ -4,10 +4,14 @@ This API is used to make and manage reservations."""
 
 from typing import Sequence
 from fastapi import APIRouter, Depends
-from ..authentication import registered_user
+from ..authentication import registered_user, registered_user_async
 from ...services.coworking.reservation import ReservationService
+from ...services.coworking.async_coworking import (
+    AsyncCoworkingService,
+    async_coworking_svc,
+)
 from ...models import User
-from ...models.coworking import Reservation, ReservationPartial, ReservationRequest, ReservationState
+from ...models.coworking import Reservation, ReservationPartial, ReservationRequest, ReservationState, SeatProximity
 
 __authors__ = ["Kris Jordan"]
 __copyright__ = "Copyright 2023 - 2024"
@@ -18,25 +22,25 @@ api = APIRouter(prefix="/api/coworking/ambassador")
 
 
 @api.get("/xl", tags=["Coworking"])
-def active_and_upcoming_reservations_for_xl(
-    subject: User = Depends(registered_user),
-    reservation_svc: ReservationService = Depends(),
+async def active_and_upcoming_reservations_for_xl(
+    subject: User = Depends(registered_user_async),
+    coworking_svc: AsyncCoworkingService = Depends(async_coworking_svc),
 ) -> Sequence[Reservation]:
     """List active and upcoming reservations for the XL.
 
     This list drives the ambassador's checkin UI."""
-    return reservation_svc.list_all_active_and_upcoming_for_xl(subject)
+    return await coworking_svc.list_all_active_and_upcoming_for_xl(subject)
 
 
 @api.get("/rooms", tags=["Coworking"])
-def active_and_upcoming_reservations_for_rooms(
-    subject: User = Depends(registered_user),
-    reservation_svc: ReservationService = Depends(),
+async def active_and_upcoming_reservations_for_rooms(
+    subject: User = Depends(registered_user_async),
+    coworking_svc: AsyncCoworkingService = Depends(async_coworking_svc),
 ) -> Sequence[Reservation]:
     """List active and upcoming reservations for the rooms.
 
     This list drives the ambassador's checkin UI."""
-    return reservation_svc.list_all_active_and_upcoming_for_rooms(subject)
+    return await coworking_svc.list_all_active_and_upcoming_for_rooms(subject)
 
 
 @api.put("/checkin", tags=["Coworking"])
@@ -52,6 +56,7 @@ def checkin_reservation(
 @api.post("/reservation", tags=["Coworking"])
 def create_walkin_reservation(
     reservation_request: ReservationRequest,
+    near: int | SeatProximity | None = None,
     subject: User = Depends(registered_user),
     reservation_svc: ReservationService = Depends(),
 ) -> Reservation:
@@ -60,7 +65,7 @@ def create_walkin_reservation(
     # TODO: The efficiency of this operation could be improved with a custom method, but since this
     # happens at the speed of an ambassador manually checking someone in (and is the sequence of steps
     # that normally take place otherwise), reusing existing methods here is fine for now.
-    reservation_draft = reservation_svc.draft_reservation(subject, reservation_request)
+    reservation_draft = reservation_svc.draft_reservation(subject, reservation_request, near)
     # Confirm the Draft Reservation
     reservation_partial = ReservationPartial(id=reservation_draft.id, state=ReservationState.CONFIRMED)
     reservation_confirmed = reservation_svc.change_reservation(subject, reservation_partial)
@@ -7,15 +7,21 @@ from typing import Sequence
 from datetime import datetime
 
 from backend.models.room import Room
-from ..authentication import registered_user
+from ..authentication import registered_user, registered_user_async
 from ...services.coworking.reservation import ReservationException, ReservationService
+from ...services.coworking.async_coworking import (
+    AsyncCoworkingService,
+    async_coworking_svc,
+)
 from ...models import User
 from ...models.coworking import (
     Reservation,
     ReservationRequest,
     ReservationPartial,
     ReservationState,
-    ReservationMapDetails
+    ReservationMapDetails,
+    ReservationDetails,
+    SeatProximity,
 )
 
 __authors__ = ["Kris Jordan, Yuvraj Jain"]
@@ -31,13 +37,17 @@ openapi_tags = {
 
 
 @api.post("/reservation", tags=["Coworking"])
-def draft_reservation(
+async def draft_reservation(
     reservation_request: ReservationRequest,
-    subject: User = Depends(registered_user),
-    reservation_svc: ReservationService = Depends(),
+    near: int | SeatProximity | None = None,
+    subject: User = Depends(registered_user_async),
+    coworking_svc: AsyncCoworkingService = Depends(async_coworking_svc),
 ) -> Reservation:
-    """Draft a reservation request."""
-    return reservation_svc.draft_reservation(subject, reservation_request)
+    """Draft a reservation request.
+
+    The `near` query parameter prefers a seat near the seat with the given id (e.g. a friend's),
+    near the monitors (`monitor`), or away from occupied seats (`apart`)."""
+    return await coworking_svc.draft_reservation(subject, reservation_request, near)
 
 
 @api.get("/reservation/{id}", tags=["Coworking"])
@@ -73,6 +83,26 @@ def update_reservation(
     return reservation_svc.change_reservation(subject, reservation)
 
 
+@api.get("/reservation/{id}/extension", tags=["Coworking"])
+def get_reservation_extension(
+    id: int,
+    subject: User = Depends(registered_user),
+    reservation_svc: ReservationService = Depends(),
+) -> ReservationDetails:
+    """See whether, from when, and until when a reservation can be extended."""
+    return reservation_svc.get_reservation_extension(subject, id)
+
+
+@api.post("/reservation/{id}/extension", tags=["Coworking"])
+def extend_reservation(
+    id: int,
+    subject: User = Depends(registered_user),
+    reservation_svc: ReservationService = Depends(),
+) -> Reservation:
+    """Extend a reservation for as long as it can be extended."""
+    return reservation_svc.extend_reservation(subject, id)
+
+
 @api.delete("/reservation/{id}", tags=["Coworking"])
 def cancel_reservation(
     id: int,
@@ -3,8 +3,11 @@
 This API is used to retrieve and update a user's profile."""
 
 from fastapi import APIRouter, Depends
-from ..authentication import registered_user
-from ...services.coworking import StatusService
+from ..authentication import registered_user_async
+from ...services.coworking.async_coworking import (
+    AsyncCoworkingService,
+    async_coworking_svc,
+)
 from ...models import User
 from ...models.coworking import Status
 
@@ -21,13 +24,16 @@ openapi_tags = {
 
 
 @api.get("", response_model=Status, tags=["Coworking"])
-def get_coworking_status(
-    subject: User = Depends(registered_user), status_svc: StatusService = Depends()
+async def get_coworking_status(
+    subject: User = Depends(registered_user_async),
+    coworking_svc: AsyncCoworkingService = Depends(async_coworking_svc),
 ):
     """Status endpoint supports the primary screen of the coworking features.
 
     It returns information about upcoming, active reservations the subject holds.
     It also fetches the current seat availability of the XL during operating hours.
     Finally, it provides a list of upcoming hours.
+
+    Clients poll this endpoint, so it runs asynchronously rather than on the threadpool.
     """
-    return status_svc.get_coworking_status(subject)
+    return await coworking_svc.get_coworking_status(subject)
@@ -17,6 +17,7 @@ from ...models.event import DraftEvent
 from ...models.event_details import EventDetails
 from ...models.coworking.time_range import TimeRange
 from ...api.authentication import registered_user
+from ...api.http_cache import cache_validators
 from ...models.user import User
 
 __authors__ = [
@@ -35,6 +36,11 @@ openapi_tags = {
     "description": "Create, update, delete, and retrieve CS Events.",
 }
 
+# Unauthenticated event details include their organization, organizers, and registration count.
+public_event_cache_validators = cache_validators(
+    "event", "event_registration", "event_organizer", "organization"
+)
+
 
 @api.get("/paginate", tags=["Events"])
 def list_events(
@@ -45,6 +51,8 @@ def list_events(
     filter: str = "",
     range_start: str = "",
     range_end: str = "",
+    page_size: int = 10,
+    cursor: str = "",
 ) -> Paginated[EventDetails]:
     """List events in time range via standard backend pagination query parameters."""
 
@@ -54,11 +62,17 @@ def list_events(
         filter=filter,
         range_start=range_start,
         range_end=range_end,
+        page_size=page_size,
+        cursor=cursor,
     )
     return event_service.get_paginated_events(pagination_params, subject)
 
 
-@api.get("/paginate/unauthenticated", tags=["Events"])
+@api.get(
+    "/paginate/unauthenticated",
+    tags=["Events"],
+    dependencies=[Depends(public_event_cache_validators)],
+)
 def list_events_unauthenticated(
     event_service: EventService = Depends(),
     order_by: str = "time",
@@ -66,6 +80,8 @@ def list_events_unauthenticated(
     filter: str = "",
     range_start: str = "",
     range_end: str = "",
+    page_size: int = 10,
+    cursor: str = "",
 ) -> Paginated[EventDetails]:
     """List events in time range via standard backend pagination query parameters for unauthenticated users."""
 
@@ -75,24 +91,32 @@ def list_events_unauthenticated(
         filter=filter,
         range_start=range_start,
         range_end=range_end,
+        page_size=page_size,
+        cursor=cursor,
     )
     return event_service.get_paginated_events(pagination_params)
 
 
 @api.get("", response_model=list[EventDetails], tags=["Events"])
 def get_events(
-    subject: User = Depends(registered_user), event_service: EventService = Depends()
+    subject: User = Depends(registered_user),
+    event_service: EventService = Depends(),
+    q: str = "",
 ) -> list[EventDetails]:
     """
-    Get all events
+    Get all events, or search events when a query is given
 
     Args:
         subject: a valid User model representing the currently logged in User
         event_service: a valid EventService
+        q (optional): a search string matched against event and organization names and descriptions
 
     Returns:
-        list[EventDetails]: All `EventDetails`s in the `Event` database table
+        list[EventDetails]: All `EventDetails`s in the `Event` database table, or the
+            events matching `q`, most relevant first
     """
+    if q != "":
+        return event_service.search(q, subject)
     return event_service.all(subject)
 
 
@@ -198,6 +222,7 @@ def get_events_in_time_range_unauthenticated(
     "/organization/{slug}/unauthenticated",
     response_model=list[EventDetails],
     tags=["Events"],
+    dependencies=[Depends(public_event_cache_validators)],
 )
 def get_events_by_organization_unauthenticated(
     slug: str,
@@ -224,6 +249,7 @@ def get_events_by_organization_unauthenticated(
     responses={404: {"model": None}},
     response_model=EventDetails,
     tags=["Events"],
+    dependencies=[Depends(public_event_cache_validators)],
 )
 def get_event_by_id_unauthenticated(
     id: int, event_service: EventService = Depends()
@@ -413,6 +439,7 @@ def get_registered_users_of_event(
     page_size: int = 10,
     order_by: str = "first_name",
     filter: str = "",
+    cursor: str = "",
 ) -> Paginated[User]:
     """
         List registered users for an event via standard backend pagination query parameters.
@@ -427,7 +454,11 @@ def get_registered_users_of_event(
     """
     try:
         pagination_params = PaginationParams(
-            page=page, page_size=page_size, order_by=order_by, filter=filter
+            page=page,
+            page_size=page_size,
+            order_by=order_by,
+            filter=filter,
+            cursor=cursor,
         )
         return event_service.get_registered_users_of_event(
             subject, event_id, pagination_params
@@ -6,6 +6,10 @@ Production systems monitor these end points upon deployment, and at regular inte
 
 from fastapi import APIRouter, Depends
 from ..services.health import HealthService
+from ..models import User
+from ..models.pool_statistics import DatabasePoolStatistics
+from ..models.coworking import ReservationSweepStatistics
+from .authentication import registered_user
 
 
 __authors__ = ["Kris Jordan"]
@@ -23,3 +27,17 @@ api = APIRouter(prefix="/api/health")
 @api.get("", tags=["System Health"])
 def health_check(health_svc: HealthService = Depends()) -> str:
     return health_svc.check()
+
+
+@api.get("/pool", tags=["System Health"])
+def database_pool_statistics(
+    subject: User = Depends(registered_user), health_svc: HealthService = Depends()
+) -> DatabasePoolStatistics:
+    return health_svc.pool(subject)
+
+
+@api.get("/reservation-sweeper", tags=["System Health"])
+def reservation_sweeper_statistics(
+    subject: User = Depends(registered_user), health_svc: HealthService = Depends()
+) -> ReservationSweepStatistics:
+    return health_svc.reservation_sweeper(subject)
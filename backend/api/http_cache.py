@@ -0,0 +1,113 @@
+"""Conditional responses for public, rarely changing API endpoints.
+
+An endpoint lists the tables its response is built from:
+
+    @api.get("", dependencies=[Depends(cache_validators("organization"))])
+
+The dependency runs before the endpoint. It derives an ETag and Last-Modified time from the
+version counters of those tables, which any mutation of them increments. Data of unversioned
+tables is named by its fingerprint instead (see `services.table_version`), which only
+contributes to the ETag, so responses built from it carry no Last-Modified time. When the request's
+If-None-Match (or, lacking one, If-Modified-Since) header shows the client already holds the
+current response, a 304 Not Modified is returned without running the endpoint. Otherwise the
+validators are added to the endpoint's response with a Cache-Control header allowing shared
+caches to store it, provided they revalidate it first.
+"""
+
+import hashlib
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Callable
+
+from fastapi import Depends, HTTPException, Request, Response, status
+
+from ..entities.table_version_table import VERSIONED_TABLES
+from ..models.table_version import TableVersion
+from ..services.table_version import FINGERPRINTS, TableVersionService
+
+__authors__ = ["Kris Jordan"]
+__copyright__ = "Copyright 2023"
+__license__ = "MIT"
+
+
+def etag(versions: list[TableVersion]) -> str:
+    """A weak entity tag identifying the state of a set of tables.
+
+    The modification times are included so that tags do not repeat if a database is
+    recreated and its counters restart."""
+    state = ";".join(
+        f"{version.table_name}:{version.version}:"
+        + (f"{version.modified_at.timestamp()}" if version.modified_at else "")
+        for version in versions
+    )
+    return f'W/"{hashlib.sha1(state.encode()).hexdigest()[:20]}"'
+
+
+def _matches_etag(if_none_match: str, current: str) -> bool:
+    """Weak comparison of an If-None-Match header with the current entity tag."""
+    if if_none_match.strip() == "*":
+        return True
+    current = current.removeprefix("W/")
+    return any(
+        tag.strip().removeprefix("W/") == current for tag in if_none_match.split(",")
+    )
+
+
+def _unmodified_since(if_modified_since: str, last_modified: datetime) -> bool:
+    try:
+        since = parsedate_to_datetime(if_modified_since)
+    except (TypeError, ValueError):
+        return False
+    # HTTP dates have a resolution of one second.
+    return since.tzinfo is not None and last_modified.replace(microsecond=0) <= since
+
+
+def cache_validators(*tables: str, max_age: int = 0) -> Callable[..., None]:
+    """Create a dependency validating cached responses built from the given tables.
+
+    Args:
+        *tables (str): The versioned tables, or fingerprints, the endpoint's response is
+            built from.
+        max_age (int): Seconds a client may reuse the response before revalidating it.
+
+    Returns:
+        Callable[..., None]: The dependency.
+
+    Raises:
+        ValueError: If a table is not versioned."""
+    unversioned = set(tables).difference(VERSIONED_TABLES, FINGERPRINTS)
+    if unversioned:
+        raise ValueError(f"Tables are not versioned: {sorted(unversioned)}")
+
+    cache_control = f"public, max-age={max_age}" if max_age > 0 else "public, no-cache"
+
+    def validate(
+        request: Request,
+        response: Response,
+        table_version_svc: TableVersionService = Depends(),
+    ) -> None:
+        versions = table_version_svc.get(tables)
+        headers = {"ETag": etag(versions), "Cache-Control": cache_control}
+        modified_at = [version.modified_at for version in versions]
+        last_modified = (
+            max(modified_at, default=None) if None not in modified_at else None
+        )
+        if last_modified is not None:
+            headers["Last-Modified"] = format_datetime(
+                last_modified.astimezone(timezone.utc), usegmt=True
+            )
+
+        if_none_match = request.headers.get("if-none-match")
+        if_modified_since = request.headers.get("if-modified-since")
+        if if_none_match is not None:
+            not_modified = _matches_etag(if_none_match, headers["ETag"])
+        elif if_modified_since is not None and last_modified is not None:
+            not_modified = _unmodified_since(if_modified_since, last_modified)
+        else:
+            not_modified = False
+
+        if not_modified:
+            raise HTTPException(status.HTTP_304_NOT_MODIFIED, headers=headers)
+        response.headers.update(headers)
+
+    return validate
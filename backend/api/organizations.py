@@ -8,6 +8,7 @@ from ..services import OrganizationService
 from ..models.organization import Organization
 from ..models.organization_details import OrganizationDetails
 from ..api.authentication import registered_user
+from ..api.http_cache import cache_validators
 from ..models.user import User
 
 __authors__ = ["Ajay Gandecha", "Jade Keegan", "Brianna Ta", "Audrey Toney"]
@@ -21,20 +22,32 @@ openapi_tags = {
 }
 
 
-@api.get("", response_model=list[Organization], tags=["Organizations"])
+@api.get(
+    "",
+    response_model=list[Organization],
+    tags=["Organizations"],
+    dependencies=[Depends(cache_validators("organization"))],
+)
 def get_organizations(
     organization_service: OrganizationService = Depends(),
+    q: str = "",
 ) -> list[Organization]:
     """
-    Get all organizations
+    Get all organizations, or search organizations when a query is given
 
     Parameters:
         organization_service: a valid OrganizationService
+        q (optional): a search string matched against organization names and descriptions
 
     Returns:
-        list[Organization]: All `Organization`s in the `Organization` database table
+        list[Organization]: All `Organization`s in the `Organization` database table, or
+            the organizations matching `q`, most relevant first
     """
 
+    # Return matching organizations, ranked by relevance
+    if q != "":
+        return organization_service.search(q)
+
     # Return all organizations
     return organization_service.all()
 
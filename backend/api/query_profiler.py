@@ -0,0 +1,157 @@
+"""Opt-in SQL query profiling of API requests.
+
+Entity `to_model` methods lazily load relationships, so a single list endpoint can
+silently issue one query per row (the N+1 pattern). When enabled by setting the
+QUERY_PROFILER environment variable to true, this middleware records every SQL statement
+executed while serving a request and reports:
+
+    Server-Timing   `db;dur=<ms>;desc="<n> queries"`, shown by browser developer tools.
+    X-Query-Count   The number of statements executed.
+
+Statements are fingerprinted by their parameterized SQL. When one fingerprint executes at
+least QUERY_PROFILER_N_PLUS_ONE_THRESHOLD times (default 5) in a request, a warning naming
+the endpoint and statement is logged.
+"""
+
+import logging
+import re
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from threading import Lock
+from time import perf_counter
+from typing import Iterator
+from sqlalchemy import Engine, event
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+__authors__ = ["Kris Jordan"]
+__copyright__ = "Copyright 2023"
+__license__ = "MIT"
+
+logger = logging.getLogger(__name__)
+
+_PARAMETER = re.compile(r"%\(\w+\)s|\$\d+|\?")
+_PARAMETER_LIST = re.compile(r"\?(?:\s*,\s*\?)+")
+_WHITESPACE = re.compile(r"\s+")
+
+
+def fingerprint(statement: str) -> str:
+    """Normalize a SQL statement so that executions differing only in parameters match.
+
+    Args:
+        statement (str): The SQL statement as sent to the database driver.
+
+    Returns:
+        str: The statement with parameters, and lists of them, replaced by `?`."""
+    statement = _PARAMETER.sub("?", statement)
+    statement = _PARAMETER_LIST.sub("?", statement)
+    return _WHITESPACE.sub(" ", statement).strip()
+
+
+class QueryProfile:
+    """SQL statements executed within a profiled scope, such as one request."""
+
+    def __init__(self):
+        self.count = 0
+        self.total_ms = 0.0
+        self.fingerprints: Counter[str] = Counter()
+        self._lock = Lock()
+
+    def record(self, statement: str, elapsed_ms: float) -> None:
+        """Record the execution of a statement."""
+        with self._lock:
+            self.count += 1
+            self.total_ms += elapsed_ms
+            self.fingerprints[fingerprint(statement)] += 1
+
+    def repeated(self, threshold: int) -> list[tuple[str, int]]:
+        """Statements executed at least `threshold` times, most frequent first."""
+        return [
+            (statement, count)
+            for statement, count in self.fingerprints.most_common()
+            if count >= threshold
+        ]
+
+    def server_timing(self) -> str:
+        """The profile formatted as a `Server-Timing` header value."""
+        return f'db;dur={self.total_ms:.1f};desc="{self.count} queries"'
+
+
+_current_profile: ContextVar[QueryProfile | None] = ContextVar(
+    "query_profile", default=None
+)
+_install_lock = Lock()
+_installed = False
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if _current_profile.get() is not None and context is not None:
+        context._query_profiler_started = perf_counter()
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    profile = _current_profile.get()
+    started = getattr(context, "_query_profiler_started", None)
+    if profile is not None and started is not None:
+        profile.record(statement, (perf_counter() - started) * 1000.0)
+
+
+def _install() -> None:
+    """Listen to statement execution on every engine, once per process."""
+    global _installed
+    with _install_lock:
+        if not _installed:
+            event.listen(Engine, "before_cursor_execute", _before_cursor_execute)
+            event.listen(Engine, "after_cursor_execute", _after_cursor_execute)
+            _installed = True
+
+
+@contextmanager
+def profile_queries() -> Iterator[QueryProfile]:
+    """Profile the SQL statements executed within the context.
+
+    The profile follows the context into threadpool workers and into `AsyncSession.run_sync`,
+    so statements are attributed to the request that caused them."""
+    _install()
+    profile = QueryProfile()
+    token = _current_profile.set(profile)
+    try:
+        yield profile
+    finally:
+        _current_profile.reset(token)
+
+
+class QueryProfilerMiddleware:
+    """ASGI middleware reporting the SQL statements each HTTP request executed."""
+
+    def __init__(self, app: ASGIApp, n_plus_one_threshold: int = 5):
+        self.app = app
+        self.n_plus_one_threshold = n_plus_one_threshold
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        with profile_queries() as profile:
+
+            async def send_with_profile(message: Message) -> None:
+                if message["type"] == "http.response.start":
+                    headers = MutableHeaders(scope=message)
+                    headers.append("Server-Timing", profile.server_timing())
+                    headers.append("X-Query-Count", str(profile.count))
+                    self._log_repeated_statements(scope, profile)
+                await send(message)
+
+            await self.app(scope, receive, send_with_profile)
+
+    def _log_repeated_statements(self, scope: Scope, profile: QueryProfile) -> None:
+        for statement, count in profile.repeated(self.n_plus_one_threshold):
+            logger.warning(
+                "Possible N+1 query in %s %s: executed %d times: %s",
+                scope["method"],
+                scope["path"],
+                count,
+                statement,
+            )
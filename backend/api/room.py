@@ -8,6 +8,7 @@ from ..services import RoomService
 from ..models import Room
 from ..models import RoomDetails
 from ..api.authentication import registered_user
+from ..api.http_cache import cache_validators
 from ..models.user import User
 
 __authors__ = ["Ajay Gandecha"]
@@ -20,8 +21,15 @@ openapi_tags = {
     "description": "Create, update, delete, and retrieve rooms.",
 }
 
+room_cache_validators = cache_validators("room", "coworking__seat")
 
-@api.get("", response_model=list[RoomDetails], tags=["Rooms"])
+
+@api.get(
+    "",
+    response_model=list[RoomDetails],
+    tags=["Rooms"],
+    dependencies=[Depends(room_cache_validators)],
+)
 def get_rooms(
     room_service: RoomService = Depends(),
 ) -> list[RoomDetails]:
@@ -41,6 +49,7 @@ def get_rooms(
     "/{id}",
     response_model=RoomDetails,
     tags=["Rooms"],
+    dependencies=[Depends(room_cache_validators)],
 )
 def get_room_by_id(id: str, room_service: RoomService = Depends()) -> RoomDetails:
     """
@@ -1,22 +1,77 @@
 """Single-page application middleware.
 
 Our application is organized as a single-page application (SPA). This middleware class
-extends the functionality of the StaticFiles middleware and was inspired by: 
+extends the functionality of the StaticFiles middleware and was inspired by:
 <https://stackoverflow.com/questions/63069190/how-to-capture-arbitrary-paths-at-one-route-in-fastapi>
+
+Files are served from a directory built once per deployment, so lookups are cached:
+
+    * Paths that match no file are routed to the index, resolved once rather than per request.
+    * A file with a precompressed `.br` or `.gz` sibling is served in the encoding the client
+      prefers, compressed at build time rather than on every request.
+    * Angular bundles with a content hash in their name never change, so they are cached by
+      clients for a year. Every other file, including the index, is revalidated on each use.
 """
 
 __authors__ = ["Kris Jordan"]
 __copyright__ = "Copyright 2023"
 __license__ = "MIT"
 
+import mimetypes
 import os
+import re
 
 from fastapi.staticfiles import StaticFiles
+from starlette.datastructures import Headers
+from starlette.responses import FileResponse, Response
+from starlette.staticfiles import NotModifiedResponse
+from starlette.types import Scope
+
+# Precompressed siblings in order of preference, by content coding.
+PRECOMPRESSED_SUFFIXES = {"br": ".br", "gzip": ".gz"}
+
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+REVALIDATE_CACHE_CONTROL = "no-cache"
+
+# Angular names bundles and assets `<name>.<16 hex digit content hash>.<extension>`.
+_HASHED_FILENAME = re.compile(r"\.[0-9a-f]{16,}\.[0-9A-Za-z]+$")
+
+
+def accepted_encodings(accept_encoding: str) -> set[str]:
+    """The content codings an Accept-Encoding header accepts.
+
+    Args:
+        accept_encoding (str): The header's value.
+
+    Returns:
+        set[str]: The accepted codings, excluding those given a quality of zero."""
+    accepted = set()
+    for item in accept_encoding.split(","):
+        coding, _, parameters = item.partition(";")
+        quality = 1.0
+        for parameter in parameters.split(";"):
+            name, _, value = parameter.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        coding = coding.strip().lower()
+        if coding and quality > 0:
+            accepted.add(coding)
+    return accepted
+
+
+def is_hashed(path: str) -> bool:
+    """Whether a file's name includes a content hash, so that it never changes."""
+    return _HASHED_FILENAME.search(os.path.basename(path)) is not None
 
 
 class StaticFileMiddleware(StaticFiles):
     def __init__(self, directory: os.PathLike, index: str = "index.html") -> None:
         self.index = index
+        self._index_lookup: tuple[str, os.stat_result | None] | None = None
+        self._precompressed: dict[str, dict[str, tuple[str, os.stat_result]]] = {}
         super().__init__(directory=directory, packages=None, html=True, check_dir=True)
 
     def lookup_path(self, path: str) -> tuple[str, os.stat_result | None]:
@@ -31,7 +86,74 @@ class StaticFileMiddleware(StaticFiles):
         full_path, stat_result = super().lookup_path(path)
 
         if stat_result is None:
-            full_path, stat_result = super().lookup_path(self.index)
-            return (full_path, stat_result)
+            return self._lookup_index()
         else:
             return (full_path, stat_result)
+
+    def _lookup_index(self) -> tuple[str, os.stat_result | None]:
+        if self._index_lookup is None or self._index_lookup[1] is None:
+            self._index_lookup = super().lookup_path(self.index)
+        return self._index_lookup
+
+    def file_response(
+        self,
+        full_path: os.PathLike,
+        stat_result: os.stat_result,
+        scope: Scope,
+        status_code: int = 200,
+    ) -> Response:
+        """Serves a file, preferring a precompressed sibling the client accepts.
+
+        Args:
+            full_path (os.PathLike): The path of the file.
+            stat_result (os.stat_result): The stat result of the file.
+            scope (Scope): The ASGI scope of the request.
+            status_code (int): The status code of the response.
+
+        Returns:
+            Response: The file response, or Not Modified if the client's copy is current.
+        """
+        request_headers = Headers(scope=scope)
+        path = str(full_path)
+        headers = {
+            "Vary": "Accept-Encoding",
+            "Cache-Control": (
+                IMMUTABLE_CACHE_CONTROL if is_hashed(path) else REVALIDATE_CACHE_CONTROL
+            ),
+        }
+
+        served_path, served_stat = path, stat_result
+        accepted = accepted_encodings(request_headers.get("accept-encoding", ""))
+        siblings = self._precompressed_siblings(path)
+        for encoding in PRECOMPRESSED_SUFFIXES:
+            if encoding in accepted and encoding in siblings:
+                served_path, served_stat = siblings[encoding]
+                headers["Content-Encoding"] = encoding
+                break
+
+        response = FileResponse(
+            served_path,
+            status_code=status_code,
+            headers=headers,
+            media_type=mimetypes.guess_type(path)[0] or "text/plain",
+            stat_result=served_stat,
+            method=scope["method"],
+        )
+        if self.is_not_modified(response.headers, request_headers):
+            return NotModifiedResponse(response.headers)
+        return response
+
+    def _precompressed_siblings(
+        self, path: str
+    ) -> dict[str, tuple[str, os.stat_result]]:
+        """The precompressed siblings of a file and their stat results, by content coding."""
+        siblings = self._precompressed.get(path)
+        if siblings is None:
+            siblings = {}
+            for encoding, suffix in PRECOMPRESSED_SUFFIXES.items():
+                try:
+                    siblings[encoding] = (path + suffix, os.stat(path + suffix))
+                except (FileNotFoundError, NotADirectoryError):
+                    continue
+            self._precompressed[path] = siblings
+        return siblings
@@ -1,17 +1,38 @@
-"""SQLAlchemy DB Engine and Session niceties for FastAPI dependency injection."""
+"""SQLAlchemy DB Engine and Session niceties for FastAPI dependency injection.
+
+The engine's connection pool is tuned by optional environment variables:
+
+    POSTGRES_POOL_SIZE          Connections kept open in the pool (default 5).
+    POSTGRES_MAX_OVERFLOW       Connections opened beyond the pool size under load (default 10).
+    POSTGRES_POOL_TIMEOUT       Seconds to wait for a connection before erroring (default 30).
+    POSTGRES_POOL_RECYCLE       Seconds after which a connection is replaced (default 1800).
+    POSTGRES_POOL_PRE_PING      Test connections for liveness on checkout (default true).
+    POSTGRES_STATEMENT_TIMEOUT  Milliseconds before a statement is cancelled, 0 to disable (default 0).
+    POSTGRES_ECHO               Log every SQL statement (default false).
+
+An asyncio engine backed by asyncpg shares the same settings. Async endpoints inject an
+`AsyncSession` via `async_db_session` so they never occupy a worker thread while waiting
+on the database.
+"""
 
 import sqlalchemy
+from threading import Lock
+from time import perf_counter
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 from sqlalchemy.orm import Session
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
 from .env import getenv
+from .models.pool_statistics import DatabasePoolStatistics, PoolStatistics
 
 __authors__ = ["Kris Jordan"]
 __copyright__ = "Copyright 2023"
 __license__ = "MIT"
 
 
-def _engine_str(database: str = getenv("POSTGRES_DATABASE")) -> str:
+def _engine_str(
+    database: str = getenv("POSTGRES_DATABASE"), dialect: str = "postgresql+psycopg2"
+) -> str:
     """Helper function for reading settings from environment variables to produce connection string."""
-    dialect = "postgresql+psycopg2"
     user = getenv("POSTGRES_USER")
     password = getenv("POSTGRES_PASSWORD")
     host = getenv("POSTGRES_HOST")
@@ -19,14 +40,117 @@ def _engine_str(database: str = getenv("POSTGRES_DATABASE")) -> str:
     return f"{dialect}://{user}:{password}@{host}:{port}/{database}"
 
 
-engine = sqlalchemy.create_engine(_engine_str(), echo=True)
+def _engine_options(asynchronous: bool = False) -> dict:
+    """Helper function for reading engine and pool settings from environment variables."""
+    options = {
+        "echo": getenv("POSTGRES_ECHO", "false").lower() == "true",
+        "pool_size": int(getenv("POSTGRES_POOL_SIZE", "5")),
+        "max_overflow": int(getenv("POSTGRES_MAX_OVERFLOW", "10")),
+        "pool_timeout": float(getenv("POSTGRES_POOL_TIMEOUT", "30")),
+        "pool_recycle": int(getenv("POSTGRES_POOL_RECYCLE", "1800")),
+        "pool_pre_ping": getenv("POSTGRES_POOL_PRE_PING", "true").lower() == "true",
+    }
+    statement_timeout = int(getenv("POSTGRES_STATEMENT_TIMEOUT", "0"))
+    if asynchronous:
+        options["poolclass"] = InstrumentedAsyncAdaptedQueuePool
+        if statement_timeout > 0:
+            options["connect_args"] = {
+                "server_settings": {"statement_timeout": str(statement_timeout)}
+            }
+    else:
+        options["poolclass"] = InstrumentedQueuePool
+        if statement_timeout > 0:
+            options["connect_args"] = {
+                "options": f"-c statement_timeout={statement_timeout}"
+            }
+    return options
+
+
+class _CheckoutTiming:
+    """Pool mixin that records how long checkouts wait for a connection."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._wait_lock = Lock()
+        self._checkouts = 0
+        self._total_wait = 0.0
+        self._max_wait = 0.0
+
+    def _do_get(self):
+        start = perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            wait = perf_counter() - start
+            with self._wait_lock:
+                self._checkouts += 1
+                self._total_wait += wait
+                self._max_wait = max(self._max_wait, wait)
+
+    def statistics(self) -> PoolStatistics:
+        """Snapshot the pool's current usage and cumulative checkout wait times."""
+        with self._wait_lock:
+            checkouts = self._checkouts
+            total_wait = self._total_wait
+            max_wait = self._max_wait
+        return PoolStatistics(
+            size=self.size(),
+            checked_in=self.checkedin(),
+            checked_out=self.checkedout(),
+            overflow=max(self.overflow(), 0),
+            max_overflow=self._max_overflow,
+            checkouts=checkouts,
+            total_wait_ms=total_wait * 1000,
+            average_wait_ms=total_wait * 1000 / checkouts if checkouts else 0.0,
+            max_wait_ms=max_wait * 1000,
+        )
+
+
+class InstrumentedQueuePool(_CheckoutTiming, QueuePool):
+    """QueuePool that records how long checkouts wait for a connection."""
+
+
+class InstrumentedAsyncAdaptedQueuePool(_CheckoutTiming, AsyncAdaptedQueuePool):
+    """AsyncAdaptedQueuePool that records how long checkouts wait for a connection."""
+
+
+engine = sqlalchemy.create_engine(_engine_str(), **_engine_options())
 """Application-level SQLAlchemy database engine."""
 
 
 def db_session():
-    """Generator function offering dependency injection of SQLAlchemy Sessions."""
+    """Generator function offering dependency injection of SQLAlchemy Sessions.
+
+    FastAPI caches a dependency's value for the duration of a request, so every service
+    injected into the same request with `Depends(db_session)` shares a single Session, and
+    therefore at most one pooled connection, which is returned when the request completes.
+    """
     session = Session(engine)
     try:
         yield session
     finally:
         session.close()
+
+
+async_engine = create_async_engine(
+    _engine_str(dialect="postgresql+asyncpg"), **_engine_options(asynchronous=True)
+)
+"""Application-level SQLAlchemy asyncio database engine."""
+
+
+async def async_db_session():
+    """Async generator function offering dependency injection of SQLAlchemy AsyncSessions.
+
+    Synchronous service code runs against an AsyncSession via `AsyncSession.run_sync`, which
+    executes it in a greenlet on the event loop rather than on FastAPI's threadpool.
+    """
+    async with AsyncSession(async_engine) as session:
+        yield session
+
+
+def pool_statistics() -> DatabasePoolStatistics:
+    """Current statistics of the application engines' connection pools."""
+    return DatabasePoolStatistics(
+        sync_pool=engine.pool.statistics(),  # type: ignore
+        async_pool=async_engine.pool.statistics(),  # type: ignore
+    )
@@ -22,6 +22,7 @@ from .user_role_table import user_role_table
 from .organization_entity import OrganizationEntity
 from .event_entity import EventEntity
 from .event_registration_entity import EventRegistrationEntity
+from .table_version_table import table_version_table
 
 __authors__ = ["Kris Jordan"]
 __copyright__ = "Copyright 2023"
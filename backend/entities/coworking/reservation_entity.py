@@ -1,7 +1,16 @@
 """Entity for Reservations."""
 
 from datetime import datetime
-from sqlalchemy import Integer, String, Boolean, ForeignKey, DateTime, Index
+from sqlalchemy import (
+    Integer,
+    String,
+    Boolean,
+    ForeignKey,
+    DateTime,
+    Index,
+    bindparam,
+    text,
+)
 from sqlalchemy.orm import Mapped, mapped_column, relationship, Session
 from ..entity_base import EntityBase
 from ...models.coworking import Reservation, ReservationState
@@ -16,10 +25,33 @@ __copyright__ = "Copyright 2023"
 __license__ = "MIT"
 
 
+# Reservations which are neither cancelled nor checked out. Queries for reservations that
+# occupy a seat or room filter with `ACTIVE_RESERVATION` below, so partial indexes over this
+# predicate apply.
+ACTIVE_RESERVATION_PREDICATE = text(
+    f"state NOT IN ('{ReservationState.CANCELLED.value}', '{ReservationState.CHECKED_OUT.value}')"
+)
+
+
 class ReservationEntity(EntityBase):
     __tablename__ = "coworking__reservation"
     __table_args__ = (
         Index("coworking__reservation_time_idx", "start", "end", "state", unique=False),
+        Index("coworking__reservation_room_start_idx", "room_id", "start"),
+        # Active reservations overlapping a time range: `end` leads because nearly all
+        # historical reservations ended before the ranges queried.
+        Index(
+            "coworking__reservation_active_end_idx",
+            "end",
+            "start",
+            postgresql_where=ACTIVE_RESERVATION_PREDICATE,
+        ),
+        # Drafts awaiting expiration by the reservation sweeper.
+        Index(
+            "coworking__reservation_draft_created_at_idx",
+            "created_at",
+            postgresql_where=text(f"state = '{ReservationState.DRAFT.value}'"),
+        ),
     )
 
     # Reservation Model Fields
@@ -85,3 +117,18 @@ class ReservationEntity(EntityBase):
             created_at=model.created_at,
             updated_at=model.updated_at,
         )
+
+
+ACTIVE_RESERVATION = ReservationEntity.state.not_in(
+    bindparam(
+        "inactive_reservation_states",
+        [ReservationState.CANCELLED.value, ReservationState.CHECKED_OUT.value],
+        expanding=True,
+        literal_execute=True,
+    )
+)
+"""Filters reservations to those matching `ACTIVE_RESERVATION_PREDICATE`.
+
+The states are rendered into the SQL as literals rather than bound as parameters. A plan
+generic over parameters, such as asyncpg's prepared statements may use, cannot prove that
+`state NOT IN ($1, $2)` implies the predicate, and would skip the partial indexes over it."""
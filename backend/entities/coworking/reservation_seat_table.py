@@ -1,6 +1,6 @@
 """Join table between Reservation and Seat entities."""
 
-from sqlalchemy import Table, Column, ForeignKey
+from sqlalchemy import Table, Column, ForeignKey, Index
 from ..entity_base import EntityBase
 
 __authors__ = ["Kris Jordan"]
@@ -12,4 +12,6 @@ reservation_seat_table = Table(
     EntityBase.metadata,
     Column("reservation_id", ForeignKey("coworking__reservation.id"), primary_key=True),
     Column("seat_id", ForeignKey("coworking__seat.id"), primary_key=True),
+    # The primary key leads with reservation_id; this index serves lookups by seat.
+    Index("coworking__reservation_seat_seat_idx", "seat_id", "reservation_id"),
 )
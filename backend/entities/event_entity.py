@@ -1,6 +1,7 @@
 """Definition of SQLAlchemy table-backed object mapping entity for Events."""
 
-from sqlalchemy import Integer, String, Boolean, DateTime, ForeignKey
+from sqlalchemy import DDL, Integer, String, Boolean, DateTime, ForeignKey, Index, event
+from sqlalchemy.dialects.postgresql import TSVECTOR
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from ..models.event_details import EventDetails
 from .entity_base import EntityBase
@@ -8,6 +9,7 @@ from typing import Self
 from ..models.event import DraftEvent, Event
 from ..models.registration_type import RegistrationType
 from ..models.user import User
+from ..models.public_user import PublicUser
 
 from datetime import datetime
 
@@ -21,6 +23,11 @@ class EventEntity(EntityBase):
 
     # Name for the events table in the PostgreSQL database
     __tablename__ = "event"
+    __table_args__ = (
+        # Keyset pagination of events by time, the default ordering
+        Index("event_time_id_idx", "time", "id"),
+        Index("event_search_vector_idx", "search_vector", postgresql_using="gin"),
+    )
 
     # Event properties (columns in the database table)
 
@@ -44,10 +51,18 @@ class EventEntity(EntityBase):
     organization_id: Mapped[int] = mapped_column(ForeignKey("organization.id"))
     organization: Mapped["OrganizationEntity"] = relationship(back_populates="events")
 
-    # Registrations for the event
+    # Registrations for the event, ordered by user so that organizers are listed consistently
     # NOTE: This is part of a many-to-many relationship between events and users, via the event registration table.
     registrations: Mapped[list["EventRegistrationEntity"]] = relationship(
-        back_populates="event", cascade="all,delete"
+        back_populates="event",
+        cascade="all,delete",
+        order_by="EventRegistrationEntity.user_id",
+    )
+
+    # Full-text search document of the event's name and description, and its organization's
+    # name and slug. Maintained by the `event_search_vector_update` trigger.
+    search_vector: Mapped[str | None] = mapped_column(
+        TSVECTOR, nullable=True, deferred=True
     )
 
     @classmethod
@@ -162,3 +177,73 @@ class EventEntity(EntityBase):
             is_organizer=event.is_organizer,
             organizers=event.organizers,
         )
+
+    def to_summarized_details_model(
+        self,
+        organizers: list[PublicUser],
+        registration_count: int,
+        is_attendee: bool,
+        subject: User | None = None,
+    ) -> EventDetails:
+        """Create an EventDetails model from registration information computed in bulk.
+
+        Unlike `to_details_model`, this does not load the event's registrations, so lists
+        of events can be converted with a constant number of queries.
+
+        Args:
+            organizers (list[PublicUser]): The event's organizers.
+            registration_count (int): The number of attendees registered.
+            is_attendee (bool): Whether the subject is registered as an attendee.
+            subject (User | None): The user making the request.
+
+        Returns:
+            EventDetails: An EventDetails model for API usage.
+        """
+        return EventDetails(
+            id=self.id,
+            name=self.name,
+            time=self.time,
+            location=self.location,
+            description=self.description,
+            public=self.public,
+            registration_limit=self.registration_limit,
+            registration_count=registration_count,
+            organization_id=self.organization_id,
+            organization=self.organization.to_model(),
+            is_attendee=is_attendee,
+            is_organizer=subject is not None
+            and any(organizer.id == subject.id for organizer in organizers),
+            organizers=organizers,
+        )
+
+
+# The search vector spans the event and organization tables, so a generated column cannot
+# compute it; a trigger recomputes it whenever an event is written.
+event.listen(
+    EventEntity.__table__,
+    "after_create",
+    DDL(
+        """
+        CREATE OR REPLACE FUNCTION event_search_vector_update() RETURNS trigger AS $$
+        BEGIN
+            NEW.search_vector :=
+                setweight(to_tsvector('english', coalesce(NEW.name, '')), 'A') ||
+                setweight(to_tsvector('english', coalesce(NEW.description, '')), 'B') ||
+                coalesce((
+                    SELECT setweight(
+                        to_tsvector('english', organization.name || ' ' || organization.slug),
+                        'C'
+                    )
+                    FROM organization
+                    WHERE organization.id = NEW.organization_id
+                ), ''::tsvector);
+            RETURN NEW;
+        END
+        $$ LANGUAGE plpgsql;
+
+        CREATE TRIGGER event_search_vector_update
+            BEFORE INSERT OR UPDATE ON event
+            FOR EACH ROW EXECUTE FUNCTION event_search_vector_update();
+        """
+    ).execute_if(dialect="postgresql"),
+)
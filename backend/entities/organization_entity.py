@@ -1,6 +1,7 @@
 """Definition of SQLAlchemy table-backed object mapping entity for Organizations."""
 
-from sqlalchemy import Integer, String, Boolean
+from sqlalchemy import DDL, Computed, Index, Integer, String, Boolean, event
+from sqlalchemy.dialects.postgresql import TSVECTOR
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from .entity_base import EntityBase
 from typing import Self
@@ -17,6 +18,11 @@ class OrganizationEntity(EntityBase):
 
     # Name for the organizations table in the PostgreSQL database
     __tablename__ = "organization"
+    __table_args__ = (
+        Index(
+            "organization_search_vector_idx", "search_vector", postgresql_using="gin"
+        ),
+    )
 
     # Organization properties (columns in the database table)
 
@@ -48,6 +54,17 @@ class OrganizationEntity(EntityBase):
     heel_life: Mapped[str] = mapped_column(String)
     # Whether the organization can be joined by anyone or not
     public: Mapped[bool] = mapped_column(Boolean, nullable=False, default=True)
+    # Full-text search document of the organization's names and descriptions
+    search_vector: Mapped[str] = mapped_column(
+        TSVECTOR,
+        Computed(
+            "setweight(to_tsvector('english', name || ' ' || shorthand || ' ' || slug), 'A') || "
+            "setweight(to_tsvector('english', coalesce(short_description, '')), 'B') || "
+            "setweight(to_tsvector('english', coalesce(long_description, '')), 'C')",
+            persisted=True,
+        ),
+        deferred=True,
+    )
 
     # NOTE: This field establishes a one-to-many relationship between the organizations and events table.
     events: Mapped[list["EventEntity"]] = relationship(
@@ -129,3 +146,25 @@ class OrganizationEntity(EntityBase):
             public=self.public,
             events=[event.to_model() for event in self.events],
         )
+
+
+# Events include their organization's name and slug in their search vector, so renaming an
+# organization rewrites its events, recomputing their vectors via their own trigger.
+event.listen(
+    OrganizationEntity.__table__,
+    "after_create",
+    DDL(
+        """
+        CREATE OR REPLACE FUNCTION organization_search_vector_propagate() RETURNS trigger AS $$
+        BEGIN
+            UPDATE event SET search_vector = NULL WHERE organization_id = NEW.id;
+            RETURN NULL;
+        END
+        $$ LANGUAGE plpgsql;
+
+        CREATE TRIGGER organization_search_vector_propagate
+            AFTER UPDATE OF name, slug ON organization
+            FOR EACH ROW EXECUTE FUNCTION organization_search_vector_propagate();
+        """
+    ).execute_if(dialect="postgresql"),
+)
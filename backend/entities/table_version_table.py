@@ -0,0 +1,75 @@
+"""Version counters of tables backing publicly cached API responses.
+
+Each versioned table has a statement-level trigger which increments its counter, and records
+the time, whenever rows are inserted, updated, deleted, or truncated. API endpoints derive
+their ETag and Last-Modified validators from the counters of the tables they read, so that
+any mutation, whether through a service, a script, or SQL, invalidates cached responses.
+
+Every statement on a versioned table updates that table's single counter row, so writers of
+the table serialize on the row's lock until they commit. Tables with concurrent writers, such
+as `event_registration` and `user`, are therefore not versioned. Responses built from them are
+validated by fingerprints of their rows instead (see `services.table_version`).
+"""
+
+from sqlalchemy import DDL, Column, DateTime, Integer, String, Table, event
+from .entity_base import EntityBase
+
+__authors__ = ["Kris Jordan"]
+__copyright__ = "Copyright 2023"
+__license__ = "MIT"
+
+# Tables whose mutations are counted. Adding a table here requires a migration creating its
+# trigger with `table_version_trigger`.
+VERSIONED_TABLES = (
+    "organization",
+    "event",
+    "room",
+    "coworking__seat",
+    "academics__term",
+    "academics__course",
+    "academics__section",
+    "academics__user_section",
+    "academics__section_room",
+)
+
+table_version_table = Table(
+    "table_version",
+    EntityBase.metadata,
+    Column("table_name", String, primary_key=True),
+    Column("version", Integer, nullable=False, default=0),
+    Column("modified_at", DateTime(timezone=True), nullable=False),
+)
+
+TABLE_VERSION_BUMP_FUNCTION = """
+CREATE OR REPLACE FUNCTION table_version_bump() RETURNS trigger AS $$
+BEGIN
+    INSERT INTO table_version (table_name, version, modified_at)
+    VALUES (TG_TABLE_NAME, 1, clock_timestamp())
+    ON CONFLICT (table_name) DO UPDATE
+    SET version = table_version.version + 1, modified_at = clock_timestamp();
+    RETURN NULL;
+END
+$$ LANGUAGE plpgsql
+"""
+
+
+def table_version_trigger(table_name: str) -> str:
+    """The statement creating the trigger that counts mutations of a table."""
+    return (
+        f'CREATE TRIGGER "{table_name}_table_version" '
+        f'AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON "{table_name}" '
+        "FOR EACH STATEMENT EXECUTE FUNCTION table_version_bump()"
+    )
+
+
+@event.listens_for(EntityBase.metadata, "after_create")
+def _create_table_version_triggers(target, connection, tables=None, **kw) -> None:
+    if connection.dialect.name != "postgresql":
+        return
+    created = {table.name for table in tables or target.sorted_tables}
+    if table_version_table.name not in created:
+        return
+    connection.execute(DDL(TABLE_VERSION_BUMP_FUNCTION))
+    for table_name in VERSIONED_TABLES:
+        if table_name in created:
+            connection.execute(DDL(table_version_trigger(table_name)))
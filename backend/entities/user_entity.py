@@ -1,6 +1,6 @@
 """Definition of SQLAlchemy table-backed object mapping entity for Users."""
 
-from sqlalchemy import Integer, String, Boolean
+from sqlalchemy import DDL, Integer, String, Boolean, Index, cast, event, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from typing import Self
 
@@ -20,6 +20,8 @@ class UserEntity(EntityBase):
 
     # Name for the user table in the PostgreSQL database
     __tablename__ = "user"
+    # Keyset pagination of users by first name, the default ordering
+    __table_args__ = (Index("user_first_name_id_idx", "first_name", "id"),)
 
     # Unique ID for the user entry
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
@@ -126,3 +128,39 @@ class UserEntity(EntityBase):
         self.github_id = model.github_id or None
         self.github_avatar = model.github_avatar or ""
         self.accepted_community_agreement = model.accepted_community_agreement
+
+
+def _trigram_available(ddl, target, bind, **kw) -> bool:
+    """Whether the database server provides the `pg_trgm` extension."""
+    return bind is not None and bool(
+        bind.scalar(
+            text(
+                "SELECT EXISTS "
+                "(SELECT 1 FROM pg_available_extensions WHERE name = 'pg_trgm')"
+            )
+        )
+    )
+
+
+# Trigram indexes serve the `ILIKE '%query%'` user search, which a btree index cannot. They
+# require the `pg_trgm` extension, so they are only created where the server provides it.
+event.listen(
+    UserEntity.__table__,
+    "before_create",
+    DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm").execute_if(
+        callable_=_trigram_available
+    ),
+)
+for _column in ("first_name", "last_name", "onyen", "email"):
+    Index(
+        f"user_{_column}_trgm_idx",
+        getattr(UserEntity, _column),
+        postgresql_using="gin",
+        postgresql_ops={_column: "gin_trgm_ops"},
+    ).ddl_if(callable_=_trigram_available)
+Index(
+    "user_pid_trgm_idx",
+    cast(UserEntity.pid, String).label("pid_text"),
+    postgresql_using="gin",
+    postgresql_ops={"pid_text": "gin_trgm_ops"},
+).ddl_if(callable_=_trigram_available)
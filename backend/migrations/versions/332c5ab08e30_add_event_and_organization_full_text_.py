@@ -0,0 +1,105 @@
+"""Add event and organization full-text search
+
+Revision ID: 332c5ab08e30
+Revises: d3c030c8257f
+Create Date: 2024-03-02 11:26:48.903517
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = "332c5ab08e30"
+down_revision = "d3c030c8257f"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "organization",
+        sa.Column(
+            "search_vector",
+            postgresql.TSVECTOR(),
+            sa.Computed(
+                "setweight(to_tsvector('english', name || ' ' || shorthand || ' ' || slug), 'A') || "
+                "setweight(to_tsvector('english', coalesce(short_description, '')), 'B') || "
+                "setweight(to_tsvector('english', coalesce(long_description, '')), 'C')",
+                persisted=True,
+            ),
+            nullable=False,
+        ),
+    )
+    op.create_index(
+        "organization_search_vector_idx",
+        "organization",
+        ["search_vector"],
+        unique=False,
+        postgresql_using="gin",
+    )
+
+    op.add_column(
+        "event", sa.Column("search_vector", postgresql.TSVECTOR(), nullable=True)
+    )
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION event_search_vector_update() RETURNS trigger AS $$
+        BEGIN
+            NEW.search_vector :=
+                setweight(to_tsvector('english', coalesce(NEW.name, '')), 'A') ||
+                setweight(to_tsvector('english', coalesce(NEW.description, '')), 'B') ||
+                coalesce((
+                    SELECT setweight(
+                        to_tsvector('english', organization.name || ' ' || organization.slug),
+                        'C'
+                    )
+                    FROM organization
+                    WHERE organization.id = NEW.organization_id
+                ), ''::tsvector);
+            RETURN NEW;
+        END
+        $$ LANGUAGE plpgsql;
+
+        CREATE TRIGGER event_search_vector_update
+            BEFORE INSERT OR UPDATE ON event
+            FOR EACH ROW EXECUTE FUNCTION event_search_vector_update();
+
+        CREATE OR REPLACE FUNCTION organization_search_vector_propagate() RETURNS trigger AS $$
+        BEGIN
+            UPDATE event SET search_vector = NULL WHERE organization_id = NEW.id;
+            RETURN NULL;
+        END
+        $$ LANGUAGE plpgsql;
+
+        CREATE TRIGGER organization_search_vector_propagate
+            AFTER UPDATE OF name, slug ON organization
+            FOR EACH ROW EXECUTE FUNCTION organization_search_vector_propagate();
+        """
+    )
+    # Compute the search vectors of existing events through the trigger.
+    op.execute("UPDATE event SET search_vector = NULL")
+    op.create_index(
+        "event_search_vector_idx",
+        "event",
+        ["search_vector"],
+        unique=False,
+        postgresql_using="gin",
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("event_search_vector_idx", table_name="event")
+    op.execute(
+        """
+        DROP TRIGGER organization_search_vector_propagate ON organization;
+        DROP FUNCTION organization_search_vector_propagate();
+        DROP TRIGGER event_search_vector_update ON event;
+        DROP FUNCTION event_search_vector_update();
+        """
+    )
+    op.drop_column("event", "search_vector")
+    op.drop_index("organization_search_vector_idx", table_name="organization")
+    op.drop_column("organization", "search_vector")
@@ -0,0 +1,75 @@
+"""Add table version counters
+
+Revision ID: 8dbb13025b6d
+Revises: 332c5ab08e30
+Create Date: 2024-03-05 16:47:09.284113
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "8dbb13025b6d"
+down_revision = "332c5ab08e30"
+branch_labels = None
+depends_on = None
+
+VERSIONED_TABLES = [
+    "organization",
+    "event",
+    "room",
+    "coworking__seat",
+    "academics__term",
+    "academics__course",
+    "academics__section",
+    "academics__user_section",
+    "academics__section_room",
+]
+
+
+def upgrade() -> None:
+    table_version = op.create_table(
+        "table_version",
+        sa.Column("table_name", sa.String(), nullable=False),
+        sa.Column("version", sa.Integer(), nullable=False),
+        sa.Column("modified_at", sa.DateTime(timezone=True), nullable=False),
+        sa.PrimaryKeyConstraint("table_name"),
+    )
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION table_version_bump() RETURNS trigger AS $$
+        BEGIN
+            INSERT INTO table_version (table_name, version, modified_at)
+            VALUES (TG_TABLE_NAME, 1, clock_timestamp())
+            ON CONFLICT (table_name) DO UPDATE
+            SET version = table_version.version + 1, modified_at = clock_timestamp();
+            RETURN NULL;
+        END
+        $$ LANGUAGE plpgsql
+        """
+    )
+    for table_name in VERSIONED_TABLES:
+        op.execute(
+            f'CREATE TRIGGER "{table_name}_table_version" '
+            f'AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON "{table_name}" '
+            "FOR EACH STATEMENT EXECUTE FUNCTION table_version_bump()"
+        )
+
+    # Existing data has no modification history; it is dated to the migration.
+    op.execute(
+        table_version.insert().values(
+            [
+                {"table_name": table_name, "version": 0, "modified_at": sa.func.now()}
+                for table_name in VERSIONED_TABLES
+            ]
+        )
+    )
+
+
+def downgrade() -> None:
+    for table_name in VERSIONED_TABLES:
+        op.execute(f'DROP TRIGGER "{table_name}_table_version" ON "{table_name}"')
+    op.execute("DROP FUNCTION table_version_bump()")
+    op.drop_table("table_version")
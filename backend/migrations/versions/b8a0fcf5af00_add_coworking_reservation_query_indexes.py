@@ -0,0 +1,71 @@
+"""Add coworking reservation query indexes
+
+Revision ID: b8a0fcf5af00
+Revises: 90c56e5464ff
+Create Date: 2024-02-17 10:14:08.412573
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "b8a0fcf5af00"
+down_revision = "90c56e5464ff"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "coworking__reservation_user_user_idx",
+        "coworking__reservation_user",
+        ["user_id", "reservation_id"],
+        unique=False,
+    )
+    op.create_index(
+        "coworking__reservation_seat_seat_idx",
+        "coworking__reservation_seat",
+        ["seat_id", "reservation_id"],
+        unique=False,
+    )
+    op.create_index(
+        "coworking__reservation_room_start_idx",
+        "coworking__reservation",
+        ["room_id", "start"],
+        unique=False,
+    )
+    op.create_index(
+        "coworking__reservation_active_end_idx",
+        "coworking__reservation",
+        ["end", "start"],
+        unique=False,
+        postgresql_where=sa.text("state NOT IN ('CANCELLED', 'CHECKED_OUT')"),
+    )
+    op.create_index(
+        "coworking__reservation_draft_created_at_idx",
+        "coworking__reservation",
+        ["created_at"],
+        unique=False,
+        postgresql_where=sa.text("state = 'DRAFT'"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "coworking__reservation_draft_created_at_idx",
+        table_name="coworking__reservation",
+    )
+    op.drop_index(
+        "coworking__reservation_active_end_idx", table_name="coworking__reservation"
+    )
+    op.drop_index(
+        "coworking__reservation_room_start_idx", table_name="coworking__reservation"
+    )
+    op.drop_index(
+        "coworking__reservation_seat_seat_idx", table_name="coworking__reservation_seat"
+    )
+    op.drop_index(
+        "coworking__reservation_user_user_idx", table_name="coworking__reservation_user"
+    )
@@ -0,0 +1,29 @@
+"""Add keyset pagination indexes
+
+Revision ID: c961b665b8fc
+Revises: b8a0fcf5af00
+Create Date: 2024-02-24 09:41:52.117406
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "c961b665b8fc"
+down_revision = "b8a0fcf5af00"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index("event_time_id_idx", "event", ["time", "id"], unique=False)
+    op.create_index(
+        "user_first_name_id_idx", "user", ["first_name", "id"], unique=False
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("user_first_name_id_idx", table_name="user")
+    op.drop_index("event_time_id_idx", table_name="event")
@@ -0,0 +1,57 @@
+"""Add user search trigram indexes
+
+Revision ID: d3c030c8257f
+Revises: c961b665b8fc
+Create Date: 2024-02-26 14:02:37.560192
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "d3c030c8257f"
+down_revision = "c961b665b8fc"
+branch_labels = None
+depends_on = None
+
+COLUMNS = ["first_name", "last_name", "onyen", "email"]
+
+
+def upgrade() -> None:
+    # Servers built without the contrib extensions cannot provide trigram indexes; user
+    # search then falls back to sequential scans.
+    available = op.get_bind().scalar(
+        sa.text(
+            "SELECT EXISTS "
+            "(SELECT 1 FROM pg_available_extensions WHERE name = 'pg_trgm')"
+        )
+    )
+    if not available:
+        return
+
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    for column in COLUMNS:
+        op.create_index(
+            f"user_{column}_trgm_idx",
+            "user",
+            [column],
+            unique=False,
+            postgresql_using="gin",
+            postgresql_ops={column: "gin_trgm_ops"},
+        )
+    op.create_index(
+        "user_pid_trgm_idx",
+        "user",
+        [sa.text("CAST(pid AS VARCHAR) gin_trgm_ops")],
+        unique=False,
+        postgresql_using="gin",
+    )
+
+
+def downgrade() -> None:
+    # The indexes only exist where the upgrade found pg_trgm available.
+    op.execute("DROP INDEX IF EXISTS user_pid_trgm_idx")
+    for column in reversed(COLUMNS):
+        op.execute(f"DROP INDEX IF EXISTS user_{column}_trgm_idx")
@@ -1,4 +1,4 @@
-from .seat import Seat
+from .seat import Seat, SeatProximity
 from .seat_details import SeatDetails
 
 from .time_range import TimeRange
@@ -12,6 +12,7 @@ from .reservation import (
     ReservationPartial,
     ReservationMapDetails,
     ReservationIdentity,
+    ReservationDetails,
 )
 
 from .availability_list import AvailabilityList
@@ -19,8 +20,11 @@ from .availability import RoomState, SeatAvailability, RoomAvailability
 
 from .status import Status
 
+from .reservation_sweep import ReservationSweep, ReservationSweepStatistics
+
 __all__ = [
     "Seat",
+    "SeatProximity",
     "SeatDetails",
     "TimeRange",
     "OperatingHours",
@@ -29,8 +33,11 @@ __all__ = [
     "ReservationRequest",
     "ReservationPartial",
     "ReservationIdentity",
+    "ReservationDetails",
     "AvailabilityList",
     "RoomAvailability",
     "SeatAvailability",
     "Status",
+    "ReservationSweep",
+    "ReservationSweepStatistics",
 ]
@@ -0,0 +1,32 @@
+"""Results and running statistics of the reservation state transition sweeper."""
+
+from datetime import datetime
+from pydantic import BaseModel
+
+__authors__ = ["Kris Jordan"]
+__copyright__ = "Copyright 2023"
+__license__ = "MIT"
+
+
+class ReservationSweep(BaseModel):
+    """The number of reservations transitioned by a single sweep."""
+
+    expired_drafts: int = 0
+    no_shows: int = 0
+    checked_out: int = 0
+
+    @property
+    def total(self) -> int:
+        return self.expired_drafts + self.no_shows + self.checked_out
+
+
+class ReservationSweepStatistics(BaseModel):
+    """Running statistics of the reservation sweeper since the process started."""
+
+    interval_seconds: float
+    ticks: int = 0
+    failures: int = 0
+    last_swept_at: datetime | None = None
+    last_duration_ms: float = 0.0
+    last_sweep: ReservationSweep = ReservationSweep()
+    totals: ReservationSweep = ReservationSweep()
@@ -1,5 +1,6 @@
 """Seat models a physical working space in the coworking space."""
 
+from enum import Enum
 from pydantic import BaseModel
 
 __authors__ = ["Kris Jordan"]
@@ -23,3 +24,13 @@ class Seat(SeatIdentity, BaseModel):
 
 class NewSeat(Seat, BaseModel):
     id: int | None = None
+
+
+class SeatProximity(str, Enum):
+    """Where a seat is preferred to be, when not near a given seat."""
+
+    MONITOR = "monitor"
+    """Near the seats with monitors."""
+
+    APART = "apart"
+    """Away from occupied seats."""
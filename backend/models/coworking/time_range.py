@@ -29,7 +29,9 @@ class TimeRange(BaseModel):
     @field_validator("end")
     @classmethod
     def check_end_greater_than_start(cls, v: datetime, info: ValidationInfo):
-        if v <= info.data["start"]:
+        # Partial models, e.g. ReservationPartial, may change the end alone.
+        start = info.data.get("start")
+        if start is not None and v <= start:
             raise ValueError("end must be greater than start")
         return v
 
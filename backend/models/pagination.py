@@ -11,12 +11,16 @@ T = TypeVar("T")
 
 
 class PaginationParams(BaseModel):
-    """Parameters passed from the client to paginate results."""
+    """Parameters passed from the client to paginate results.
+
+    A `cursor` taken from the `next_cursor` of a previous page takes precedence over `page`.
+    """
 
     page: int = 0
     page_size: int = 10
     order_by: str = ""
     filter: str = ""
+    cursor: str = ""
 
 
 class EventPaginationParams(PaginationParams):
@@ -33,5 +37,7 @@ class Paginated(BaseModel, Generic[T]):
     """Generic class for returning paginating results to the client."""
 
     items: list[T]
-    length: int
+    # Total number of results; omitted (None) for pages fetched with a cursor.
+    length: int | None
     params: PaginationParams | EventPaginationParams
+    next_cursor: str | None = None
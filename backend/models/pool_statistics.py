@@ -0,0 +1,30 @@
+"""Statistics of the database connection pools for monitoring purposes."""
+
+from pydantic import BaseModel
+
+__authors__ = ["Kris Jordan"]
+__copyright__ = "Copyright 2023"
+__license__ = "MIT"
+
+
+class PoolStatistics(BaseModel):
+    """Usage of the application's database connection pool.
+
+    Wait times are cumulative since the process started."""
+
+    size: int
+    checked_in: int
+    checked_out: int
+    overflow: int
+    max_overflow: int
+    checkouts: int
+    total_wait_ms: float
+    average_wait_ms: float
+    max_wait_ms: float
+
+
+class DatabasePoolStatistics(BaseModel):
+    """Usage of the connection pools of the application's sync and asyncio engines."""
+
+    sync_pool: PoolStatistics
+    async_pool: PoolStatistics
@@ -0,0 +1,19 @@
+"""Version counter of a database table, used to validate cached API responses."""
+
+from datetime import datetime
+from pydantic import BaseModel
+
+__authors__ = ["Kris Jordan"]
+__copyright__ = "Copyright 2023"
+__license__ = "MIT"
+
+
+class TableVersion(BaseModel):
+    """The number of mutating statements executed on a table, and when the last one was.
+
+    Fingerprints of unversioned tables have a `version` that changes with their rows, but no
+    modification time."""
+
+    table_name: str
+    version: int
+    modified_at: datetime | None = None
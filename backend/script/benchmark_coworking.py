@@ -0,0 +1,418 @@
+"""Benchmark the coworking services against a semester of synthetic data.
+
+This script builds a dedicated `<POSTGRES_DATABASE>_benchmark` database populated with a
+semester's worth of seats, users, operating hours and reservations, then times the hot
+coworking service methods against it. For each method it reports the median (p50) and 95th
+percentile (p95) latency along with the number of SQL statements issued per call.
+
+Every measured call runs inside a transaction which is rolled back afterwards, so methods
+which write, such as drafting a reservation, measure the same state on every iteration.
+
+Usage: python3 -m backend.script.benchmark_coworking [--help]
+"""
+
+import argparse
+import json
+import random
+import statistics
+import sys
+from dataclasses import dataclass, asdict
+from datetime import datetime, timedelta
+from time import perf_counter
+from typing import Callable
+from sqlalchemy import Engine, create_engine, event, insert, text
+from sqlalchemy.orm import Session
+
+from ..env import getenv
+from .. import entities
+from ..entities import UserEntity
+from ..entities.coworking import (
+    OperatingHoursEntity,
+    ReservationEntity,
+    SeatEntity,
+    reservation_seat_table,
+)
+from ..entities.coworking.reservation_user_table import reservation_user_table
+from ..models import User
+from ..models.coworking import ReservationRequest, ReservationState, TimeRange
+from ..models.coworking.seat import SeatIdentity
+from ..models.user import UserIdentity
+from ..services.coworking import PolicyService, SeatService
+from ..services.coworking.async_coworking import (
+    sync_reservation_svc,
+    sync_status_svc,
+)
+from .database_server import (
+    create_database,
+    database_url,
+    drop_database,
+    server_connection,
+)
+from ..test.services import permission_data, role_data, room_data, user_data
+from ..test.services.reset_table_id_seq import reset_table_id_seq
+
+__authors__ = ["Kris Jordan"]
+__copyright__ = "Copyright 2023"
+__license__ = "MIT"
+
+BENCHMARK_DATABASE = f'{getenv("POSTGRES_DATABASE")}_benchmark'
+XL_ROOM_ID = room_data.the_xl.id
+OPEN_HOUR = 10
+CLOSE_HOUR = 20
+
+
+@dataclass
+class Measurement:
+    """Latency and query count statistics of one benchmarked method."""
+
+    method: str
+    runs: int
+    p50_ms: float
+    p95_ms: float
+    queries: float
+
+
+class QueryCounter:
+    """Counts the SQL statements an engine executes."""
+
+    def __init__(self, engine: Engine):
+        self.count = 0
+        event.listen(engine, "before_cursor_execute", self._increment)
+
+    def _increment(self, *args) -> None:
+        self.count += 1
+
+
+def create_benchmark_database() -> Engine:
+    """Drop and recreate the benchmark database and its tables."""
+    with server_connection() as connection:
+        drop_database(connection, BENCHMARK_DATABASE, if_exists=True)
+        create_database(connection, BENCHMARK_DATABASE)
+
+    engine = create_engine(database_url(BENCHMARK_DATABASE))
+    entities.EntityBase.metadata.create_all(engine)
+    return engine
+
+
+def insert_synthetic_data(
+    session: Session, users: int, seats: int, weeks: int, occupancy: float
+) -> int:
+    """Populate the benchmark database with a semester of synthetic data.
+
+    The semester ends one week from now, so that it includes the upcoming reservations a
+    student may make, and extends `weeks` weeks into the past.
+
+    Args:
+        session (Session): A session bound to the benchmark database.
+        users (int): The number of synthetic users to create.
+        seats (int): The number of XL seats to create.
+        weeks (int): The length of the semester in weeks.
+        occupancy (float): The probability a seat is reserved at any open half hour.
+
+    Returns:
+        int: The number of reservations inserted."""
+    role_data.insert_fake_data(session)
+    user_data.insert_fake_data(session)
+    permission_data.insert_fake_data(session)
+    room_data.insert_fake_data(session)
+
+    first_user_id = len(user_data.users) + 1
+    session.execute(
+        insert(UserEntity),
+        [
+            {
+                "id": id,
+                "pid": 800000000 + id,
+                "onyen": f"student{id}",
+                "email": f"student{id}@unc.edu",
+                "first_name": "Student",
+                "last_name": str(id),
+                "accepted_community_agreement": True,
+            }
+            for id in range(first_user_id, first_user_id + users)
+        ],
+    )
+    reset_table_id_seq(session, UserEntity, UserEntity.id, first_user_id + users)
+
+    columns = max(1, int(seats**0.5))
+    session.execute(
+        insert(SeatEntity),
+        [
+            {
+                "id": id,
+                "title": f"Seat {id}",
+                "shorthand": f"S{id}",
+                "reservable": id % 4 == 0,
+                "has_monitor": id % 2 == 0,
+                "sit_stand": id % 3 == 0,
+                "x": (id - 1) % columns,
+                "y": (id - 1) // columns,
+                "room_id": XL_ROOM_ID,
+            }
+            for id in range(1, seats + 1)
+        ],
+    )
+    reset_table_id_seq(session, SeatEntity, SeatEntity.id, seats + 1)
+
+    now = datetime.now()
+    today = now.replace(hour=0, minute=0, second=0, microsecond=0)
+    days = [today + timedelta(days=offset) for offset in range(-7 * weeks + 7, 8)]
+    operating_hours = [
+        (day.replace(hour=OPEN_HOUR), day.replace(hour=CLOSE_HOUR))
+        for day in days
+        if day.weekday() < 5 or day == today
+    ]
+    # Ensure the XL is open right now so walk-in drafts are measurable at any hour.
+    operating_hours = [
+        (min(start, now - timedelta(hours=1)), max(end, now + timedelta(hours=8)))
+        if start.date() == today.date()
+        else (start, end)
+        for start, end in operating_hours
+    ]
+    session.execute(
+        insert(OperatingHoursEntity),
+        [
+            {"id": id, "start": start, "end": end}
+            for id, (start, end) in enumerate(operating_hours, start=1)
+        ],
+    )
+    reset_table_id_seq(
+        session,
+        OperatingHoursEntity,
+        OperatingHoursEntity.id,
+        len(operating_hours) + 1,
+    )
+
+    reservations: list[dict] = []
+    reservation_users: list[dict] = []
+    reservation_seats: list[dict] = []
+    reservable_rooms = [room.id for room in room_data.rooms if room.reservable]
+
+    def add(start: datetime, end: datetime, seat_id: int | None, room_id: str | None):
+        id = len(reservations) + 1
+        if end <= now:
+            state = (
+                ReservationState.CHECKED_OUT
+                if random.random() < 0.85
+                else ReservationState.CANCELLED
+            )
+        elif start <= now:
+            state = ReservationState.CHECKED_IN
+        else:
+            state = ReservationState.CONFIRMED
+        created_at = min(start, now) - timedelta(hours=random.randint(0, 48))
+        reservations.append(
+            {
+                "id": id,
+                "start": start,
+                "end": end,
+                "state": state,
+                "walkin": seat_id is not None and random.random() < 0.5,
+                "room_id": room_id,
+                "created_at": created_at,
+                "updated_at": created_at,
+            }
+        )
+        # The last synthetic user is left without reservations to draft them in benchmarks.
+        reservation_users.append(
+            {
+                "reservation_id": id,
+                "user_id": random.randrange(first_user_id, first_user_id + users - 1),
+            }
+        )
+        if seat_id is not None:
+            reservation_seats.append({"reservation_id": id, "seat_id": seat_id})
+
+    half_hour = timedelta(minutes=30)
+    for opens_at, closes_at in operating_hours:
+        for location in [*range(1, seats + 1), *reservable_rooms]:
+            seat_id, room_id = (
+                (location, None) if isinstance(location, int) else (None, location)
+            )
+            start = opens_at
+            while start < closes_at:
+                if random.random() < occupancy:
+                    end = min(closes_at, start + half_hour * random.randint(2, 6))
+                    add(start, end, seat_id, room_id)
+                    start = end
+                start += half_hour
+
+    for table, rows in (
+        (ReservationEntity.__table__, reservations),
+        (reservation_user_table, reservation_users),
+        (reservation_seat_table, reservation_seats),
+    ):
+        for batch in range(0, len(rows), 10000):
+            session.execute(insert(table), rows[batch : batch + 10000])
+    reset_table_id_seq(
+        session, ReservationEntity, ReservationEntity.id, len(reservations) + 1
+    )
+    session.commit()
+    return len(reservations)
+
+
+def measure(
+    engine: Engine, counter: QueryCounter, name: str, runs: int, call: Callable
+) -> Measurement:
+    """Time a service call, each run in its own rolled back transaction.
+
+    Args:
+        engine (Engine): The benchmark database engine.
+        counter (QueryCounter): The engine's statement counter.
+        name (str): The name of the measured method.
+        runs (int): The number of timed runs, following one untimed warm up run.
+        call (Callable[[Session], Any]): Invokes the measured method with a session.
+
+    Returns:
+        Measurement: Latency percentiles and mean statements per call."""
+    latencies: list[float] = []
+    queries: list[int] = []
+    for run in range(runs + 1):
+        with engine.connect() as connection:
+            transaction = connection.begin()
+            session = Session(bind=connection, join_transaction_mode="create_savepoint")
+            counter.count = 0
+            started = perf_counter()
+            call(session)
+            elapsed = perf_counter() - started
+            session.close()
+            transaction.rollback()
+        if run > 0:
+            latencies.append(elapsed * 1000.0)
+            queries.append(counter.count)
+
+    percentiles = statistics.quantiles(latencies, n=20, method="inclusive")
+    return Measurement(
+        method=name,
+        runs=runs,
+        p50_ms=round(statistics.median(latencies), 2),
+        p95_ms=round(percentiles[18], 2),
+        queries=round(statistics.mean(queries), 1),
+    )
+
+
+def timed_runs(value: str) -> int:
+    """Parse the number of timed runs, at least two of which are needed for percentiles."""
+    runs = int(value)
+    if runs < 2:
+        raise argparse.ArgumentTypeError("at least 2 runs are needed to compute p95")
+    return runs
+
+
+def run_benchmarks(engine: Engine, runs: int, users: int) -> list[Measurement]:
+    """Time each hot coworking service method against the benchmark database."""
+    counter = QueryCounter(engine)
+    with Session(engine) as session:
+        student = session.get(UserEntity, len(user_data.users) + users).to_model()
+        seats = SeatService(session).list()
+    ambassador: User = user_data.ambassador
+    root: User = user_data.root
+    policy = PolicyService()
+
+    def seat_availability(session: Session):
+        now = datetime.now()
+        bounds = TimeRange(start=now, end=now + policy.reservation_window(student))
+        sync_reservation_svc(session).seat_availability(seats, bounds)
+
+    def draft_reservation(session: Session):
+        now = datetime.now()
+        request = ReservationRequest(
+            start=now,
+            end=now + timedelta(hours=2),
+            users=[UserIdentity(id=student.id)],
+            seats=[SeatIdentity(id=seat.id) for seat in seats[:20]],
+        )
+        sync_reservation_svc(session).draft_reservation(student, request)
+
+    benchmarks: list[tuple[str, Callable[[Session], object]]] = [
+        ("seat_availability", seat_availability),
+        (
+            "get_map_reserved_times_by_date",
+            lambda session: sync_reservation_svc(
+                session
+            ).get_map_reserved_times_by_date(datetime.now(), student),
+        ),
+        ("draft_reservation", draft_reservation),
+        (
+            "list_all_active_and_upcoming_for_xl",
+            lambda session: sync_reservation_svc(
+                session
+            ).list_all_active_and_upcoming_for_xl(root),
+        ),
+        (
+            "get_coworking_status",
+            lambda session: sync_status_svc(session).get_coworking_status(ambassador),
+        ),
+    ]
+    return [measure(engine, counter, name, runs, call) for name, call in benchmarks]
+
+
+def print_report(measurements: list[Measurement]) -> None:
+    print(f"{'method':<40}{'runs':>6}{'p50 ms':>10}{'p95 ms':>10}{'queries':>9}")
+    for m in measurements:
+        print(
+            f"{m.method:<40}{m.runs:>6}{m.p50_ms:>10.2f}{m.p95_ms:>10.2f}{m.queries:>9.1f}"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--users", type=int, default=3000)
+    parser.add_argument("--seats", type=int, default=240)
+    parser.add_argument("--weeks", type=int, default=16)
+    parser.add_argument(
+        "--occupancy",
+        type=float,
+        default=0.1,
+        help="Probability a seat or room is reserved at any open half hour.",
+    )
+    parser.add_argument(
+        "--runs",
+        type=timed_runs,
+        default=50,
+        help="Timed runs of each method, at least 2.",
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--reuse",
+        action="store_true",
+        help="Benchmark the existing benchmark database rather than regenerating it.",
+    )
+    parser.add_argument("--json", help="Also write the measurements to this file.")
+    args = parser.parse_args()
+
+    if getenv("MODE") != "development":
+        print("This script can only be run in development mode.", file=sys.stderr)
+        print(
+            "Add MODE=development to your .env file in workspace's `backend/` directory"
+        )
+        sys.exit(1)
+
+    if args.reuse:
+        engine = create_engine(database_url(BENCHMARK_DATABASE))
+    else:
+        random.seed(args.seed)
+        engine = create_benchmark_database()
+        started = perf_counter()
+        with Session(engine) as session:
+            count = insert_synthetic_data(
+                session, args.users, args.seats, args.weeks, args.occupancy
+            )
+        with engine.connect() as connection:
+            connection.execution_options(isolation_level="AUTOCOMMIT").execute(
+                text("ANALYZE")
+            )
+        print(
+            f"Generated {count} reservations in {perf_counter() - started:.1f}s",
+            file=sys.stderr,
+        )
+
+    measurements = run_benchmarks(engine, args.runs, args.users)
+    print_report(measurements)
+    if args.json:
+        with open(args.json, "w") as file:
+            json.dump([asdict(m) for m in measurements], file, indent=2)
+
+
+if __name__ == "__main__":
+    main()
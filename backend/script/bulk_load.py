@@ -0,0 +1,287 @@
+"""Bulk load coworking seats, operating hours and reservations from CSV or JSON files.
+
+Loading a semester of data one ORM object at a time issues a statement, and a round trip, per
+row. This pipeline instead validates every record up front and inserts each table with a
+single multi-row `INSERT ... VALUES` executemany, which SQLAlchemy sends in pages of many
+rows per statement. Records without an `id` are numbered after the largest existing id, so
+that every table's id sequence is reset just once, after all of the data is loaded.
+
+Each file holds one record per CSV row or per object of a JSON array. Record fields:
+
+    seats               id?, title, shorthand, reservable, has_monitor, sit_stand, x, y, room_id
+    operating hours     id?, start, end
+    reservations        id?, start, end, state, walkin?, room_id?, user_ids?, seat_ids?,
+                        created_at?
+
+Times are ISO 8601 local times. In CSV files, `user_ids` and `seat_ids` are separated by
+semicolons, e.g. `4;7`.
+
+Usage: python3 -m backend.script.bulk_load [--seats FILE] [--operating-hours FILE]
+           [--reservations FILE]
+"""
+
+import argparse
+import csv
+import json
+from datetime import datetime
+from pathlib import Path
+from time import perf_counter
+from typing import Any, Iterable, Sequence, TypeVar
+from pydantic import BaseModel, ConfigDict, field_validator, model_validator
+from sqlalchemy import Table, func, insert, select, text
+from sqlalchemy.orm import Session
+
+from ..database import engine
+from ..entities.coworking import (
+    OperatingHoursEntity,
+    ReservationEntity,
+    SeatEntity,
+    reservation_seat_table,
+)
+from ..entities.coworking.reservation_user_table import reservation_user_table
+from ..models.coworking import ReservationState
+
+__authors__ = ["Kris Jordan"]
+__copyright__ = "Copyright 2023"
+__license__ = "MIT"
+
+
+class _Record(BaseModel):
+    """A record read from a file, where CSV leaves optional fields as empty strings."""
+
+    id: int | None = None
+
+    @model_validator(mode="before")
+    @classmethod
+    def omit_empty_fields(cls, data: Any) -> Any:
+        if isinstance(data, dict):
+            return {key: value for key, value in data.items() if value != ""}
+        return data
+
+
+class SeatRecord(_Record):
+    title: str
+    shorthand: str
+    reservable: bool
+    has_monitor: bool
+    sit_stand: bool
+    x: int
+    y: int
+    room_id: str
+
+
+class OperatingHoursRecord(_Record):
+    start: datetime
+    end: datetime
+
+
+class ReservationRecord(_Record):
+    model_config = ConfigDict(use_enum_values=True)
+
+    start: datetime
+    end: datetime
+    state: ReservationState
+    walkin: bool = False
+    room_id: str | None = None
+    user_ids: list[int] = []
+    seat_ids: list[int] = []
+    created_at: datetime | None = None
+
+    @field_validator("user_ids", "seat_ids", mode="before")
+    @classmethod
+    def split_ids(cls, value: Any) -> Any:
+        if isinstance(value, str):
+            return [id for id in value.split(";") if id.strip() != ""]
+        return value
+
+
+R = TypeVar("R", bound=_Record)
+
+
+def read_records(path: Path, record_type: type[R]) -> list[R]:
+    """Read and validate the records of a CSV or JSON file.
+
+    Args:
+        path (Path): A `.csv` file with a header row, or a `.json` file holding an array.
+        record_type (type[R]): The record model each row or object is validated as.
+
+    Returns:
+        list[R]: The records, in file order.
+
+    Raises:
+        ValueError: If the file is neither CSV nor JSON.
+        pydantic.ValidationError: If a record is invalid."""
+    with open(path, newline="") as file:
+        if path.suffix == ".csv":
+            rows = list(csv.DictReader(file))
+        elif path.suffix == ".json":
+            rows = json.load(file)
+        else:
+            raise ValueError(f"Expected a .csv or .json file: {path}")
+    return [record_type.model_validate(row) for row in rows]
+
+
+def _assign_ids(session: Session, table: Table, records: Iterable[_Record]) -> None:
+    """Number records without an id after the largest id in the table or the records."""
+    records = list(records)
+    next_id = 1 + max(
+        session.scalar(select(func.coalesce(func.max(table.c.id), 0))) or 0,
+        max((record.id for record in records if record.id is not None), default=0),
+    )
+    for record in records:
+        if record.id is None:
+            record.id = next_id
+            next_id += 1
+
+
+def load_seats(session: Session, seats: Sequence[SeatRecord]) -> None:
+    """Insert seats in bulk.
+
+    Args:
+        session (Session): The session to insert with; the caller commits.
+        seats (Sequence[SeatRecord]): The seats to insert.
+
+    Returns:
+        None"""
+    if len(seats) == 0:
+        return
+    _assign_ids(session, SeatEntity.__table__, seats)
+    session.execute(insert(SeatEntity), [seat.model_dump() for seat in seats])
+
+
+def load_operating_hours(
+    session: Session, operating_hours: Sequence[OperatingHoursRecord]
+) -> None:
+    """Insert operating hours in bulk.
+
+    Args:
+        session (Session): The session to insert with; the caller commits.
+        operating_hours (Sequence[OperatingHoursRecord]): The operating hours to insert.
+
+    Returns:
+        None"""
+    if len(operating_hours) == 0:
+        return
+    _assign_ids(session, OperatingHoursEntity.__table__, operating_hours)
+    session.execute(
+        insert(OperatingHoursEntity),
+        [entry.model_dump() for entry in operating_hours],
+    )
+
+
+def load_reservations(
+    session: Session, reservations: Sequence[ReservationRecord]
+) -> None:
+    """Insert reservations, and their users and seats, in bulk.
+
+    Args:
+        session (Session): The session to insert with; the caller commits.
+        reservations (Sequence[ReservationRecord]): The reservations to insert.
+
+    Returns:
+        None"""
+    if len(reservations) == 0:
+        return
+    _assign_ids(session, ReservationEntity.__table__, reservations)
+    now = datetime.now()
+    rows = []
+    for reservation in reservations:
+        row = reservation.model_dump(exclude={"user_ids", "seat_ids"})
+        row["created_at"] = row["updated_at"] = reservation.created_at or now
+        rows.append(row)
+    session.execute(insert(ReservationEntity), rows)
+    reservation_users = [
+        {"reservation_id": reservation.id, "user_id": user_id}
+        for reservation in reservations
+        for user_id in reservation.user_ids
+    ]
+    if reservation_users:
+        session.execute(insert(reservation_user_table), reservation_users)
+    reservation_seats = [
+        {"reservation_id": reservation.id, "seat_id": seat_id}
+        for reservation in reservations
+        for seat_id in reservation.seat_ids
+    ]
+    if reservation_seats:
+        session.execute(insert(reservation_seat_table), reservation_seats)
+
+
+def reset_sequences(session: Session, tables: Iterable[Table]) -> None:
+    """Restart the id sequences of tables after the largest id each holds.
+
+    Args:
+        session (Session): The session to reset the sequences with.
+        tables (Iterable[Table]): Tables with a serial `id` primary key.
+
+    Returns:
+        None"""
+    for table in tables:
+        session.execute(
+            text(
+                f"SELECT setval(pg_get_serial_sequence('\"{table.name}\"', 'id'), "
+                f'coalesce(max(id), 0) + 1, false) FROM "{table.name}"'
+            )
+        )
+
+
+def bulk_load(
+    session: Session,
+    seats: Sequence[SeatRecord] = (),
+    operating_hours: Sequence[OperatingHoursRecord] = (),
+    reservations: Sequence[ReservationRecord] = (),
+) -> None:
+    """Insert seats, operating hours and reservations, then reset their id sequences.
+
+    Seats are inserted first, so that reservations may refer to them.
+
+    Args:
+        session (Session): The session to insert with; the caller commits.
+        seats (Sequence[SeatRecord]): The seats to insert.
+        operating_hours (Sequence[OperatingHoursRecord]): The operating hours to insert.
+        reservations (Sequence[ReservationRecord]): The reservations to insert.
+
+    Returns:
+        None"""
+    load_seats(session, seats)
+    load_operating_hours(session, operating_hours)
+    load_reservations(session, reservations)
+    reset_sequences(
+        session,
+        [
+            SeatEntity.__table__,
+            OperatingHoursEntity.__table__,
+            ReservationEntity.__table__,
+        ],
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Bulk load coworking data from CSV or JSON files."
+    )
+    parser.add_argument("--seats", type=Path, help="seat map file")
+    parser.add_argument("--operating-hours", type=Path, help="operating hours file")
+    parser.add_argument("--reservations", type=Path, help="reservations file")
+    args = parser.parse_args()
+
+    started = perf_counter()
+    seats = read_records(args.seats, SeatRecord) if args.seats else []
+    operating_hours = (
+        read_records(args.operating_hours, OperatingHoursRecord)
+        if args.operating_hours
+        else []
+    )
+    reservations = (
+        read_records(args.reservations, ReservationRecord) if args.reservations else []
+    )
+    with Session(engine) as session:
+        bulk_load(session, seats, operating_hours, reservations)
+        session.commit()
+    print(
+        f"Loaded {len(seats)} seats, {len(operating_hours)} operating hours and "
+        f"{len(reservations)} reservations in {perf_counter() - started:.2f}s"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""Create and drop databases on the Postgres server configured by environment variables.
+
+The scripts which set up development databases share these helpers. `CREATE DATABASE` and
+`DROP DATABASE` cannot run inside a transaction, so they are issued on an autocommitting
+connection to the server rather than to the application's database. Database names are
+quoted, since they cannot be passed as bound parameters.
+"""
+
+from contextlib import contextmanager
+from typing import Iterator
+from sqlalchemy import Connection, create_engine, text
+from ..env import getenv
+
+__authors__ = ["Kris Jordan"]
+__copyright__ = "Copyright 2023"
+__license__ = "MIT"
+
+
+def database_url(database: str = "") -> str:
+    """Connection string of a database on the server, or of the server's default database.
+
+    Args:
+        database (str): The name of the database.
+
+    Returns:
+        str: The connection string."""
+    dialect = "postgresql+psycopg2"
+    user = getenv("POSTGRES_USER")
+    password = getenv("POSTGRES_PASSWORD")
+    host = getenv("POSTGRES_HOST")
+    port = getenv("POSTGRES_PORT")
+    return f"{dialect}://{user}:{password}@{host}:{port}/{database}"
+
+
+@contextmanager
+def server_connection(echo: bool = False) -> Iterator[Connection]:
+    """Connect to the server to create or drop databases.
+
+    Args:
+        echo (bool): Whether to log the statements issued.
+
+    Returns:
+        Iterator[Connection]: An autocommitting connection, closed on exit."""
+    engine = create_engine(database_url(), isolation_level="AUTOCOMMIT", echo=echo)
+    try:
+        with engine.connect() as connection:
+            yield connection
+    finally:
+        engine.dispose()
+
+
+def create_database(connection: Connection, database: str) -> None:
+    """Create an empty database.
+
+    Args:
+        connection (Connection): A connection from `server_connection`.
+        database (str): The name of the database."""
+    name = connection.dialect.identifier_preparer.quote_identifier(database)
+    connection.execute(text(f"CREATE DATABASE {name}"))
+
+
+def drop_database(
+    connection: Connection, database: str, if_exists: bool = False
+) -> None:
+    """Drop a database.
+
+    Args:
+        connection (Connection): A connection from `server_connection`.
+        database (str): The name of the database.
+        if_exists (bool): Whether to ignore a database which does not exist."""
+    name = connection.dialect.identifier_preparer.quote_identifier(database)
+    connection.execute(text(f"DROP DATABASE {'IF EXISTS ' if if_exists else ''}{name}"))
@@ -12,8 +12,8 @@ from sqlalchemy.orm import Session
 from ...database import engine
 from ...env import getenv
 from ... import entities
-from ...entities.coworking import SeatEntity, OperatingHoursEntity, RoomEntity
-from ...test.services.reset_table_id_seq import reset_table_id_seq
+from ...entities import RoomEntity
+from ..bulk_load import OperatingHoursRecord, SeatRecord, bulk_load
 
 from ...test.services import role_data, user_data, permission_data, room_data
 from ...test.services.coworking import (
@@ -21,7 +21,6 @@ from ...test.services.coworking import (
     operating_hours_data,
     time,
 )
-from ...models.coworking import SeatDetails
 from ...test.services.coworking.reservation import reservation_data
 
 if getenv("MODE") != "development":
@@ -36,11 +35,11 @@ with Session(engine) as session:
     seat_data.delete_all(session)
     operating_hours_data.delete_all(session)
 
-    seats: list[SeatDetails] = []
+    seats: list[SeatRecord] = []
     # Sit Desks w/ Monitor
     for i in range(12):
         seats.append(
-            SeatDetails(
+            SeatRecord(
                 id=i,
                 title="Sitting Desk with Monitor",
                 shorthand="Sit",
@@ -49,14 +48,14 @@ with Session(engine) as session:
                 sit_stand=False,
                 x=0,
                 y=0,
-                room=room_data.the_xl.to_room(),
+                room_id=room_data.the_xl.id,
             )
         )
 
     # Sit/Stand Desks w/ Monitor
     for i in range(12, 18):
         seats.append(
-            SeatDetails(
+            SeatRecord(
                 id=i,
                 title="Standing Desk with Monitor",
                 shorthand="Stand",
@@ -65,14 +64,14 @@ with Session(engine) as session:
                 sit_stand=True,
                 x=0,
                 y=0,
-                room=room_data.the_xl.to_room(),
+                room_id=room_data.the_xl.id,
             )
         )
 
     # Collab Area
     for i in range(18, 42):
         seats.append(
-            SeatDetails(
+            SeatRecord(
                 id=i,
                 title="Communal Area Seat",
                 shorthand="Communal",
@@ -81,16 +80,12 @@ with Session(engine) as session:
                 sit_stand=False,
                 x=0,
                 y=0,
-                room=room_data.the_xl.to_room(),
+                room_id=room_data.the_xl.id,
             )
         )
 
     session.add(RoomEntity.from_model(room_data.the_xl))
-
-    for seat in seats:
-        entity = SeatEntity.from_model(seat)
-        session.add(entity)
-    reset_table_id_seq(session, SeatEntity, SeatEntity.id, len(seats) + 1)
+    session.flush()
 
     from datetime import datetime
 
@@ -104,14 +99,13 @@ with Session(engine) as session:
         "10/27/2023",
     ]
     date_list = [datetime.strptime(date, "%m/%d/%Y") for date in dates_as_strings]
-    start_datetimes = [
-        date.replace(hour=10, minute=0, second=0, microsecond=0) for date in date_list
-    ]
-    end_datetimes = [
-        date.replace(hour=18, minute=0, second=0, microsecond=0) for date in date_list
+    operating_hours = [
+        OperatingHoursRecord(
+            start=date.replace(hour=10, minute=0, second=0, microsecond=0),
+            end=date.replace(hour=18, minute=0, second=0, microsecond=0),
+        )
+        for date in date_list
     ]
-    for start, end in zip(start_datetimes, end_datetimes):
-        entity = OperatingHoursEntity(start=start, end=end)
-        session.add(entity)
 
+    bulk_load(session, seats=seats, operating_hours=operating_hours)
     session.commit()
@@ -0,0 +1,174 @@
+"""Report where the time to import the application goes.
+
+Containers are started on demand, and test collection imports the application, so the time
+spent importing `backend.main` is paid before the first request is served and before the first
+test runs. This script imports a module in a fresh interpreter with `python -X importtime`,
+repeating the import and keeping the fastest run to reduce noise, then prints:
+
+    * Top-level packages ranked by the time spent in their own modules.
+    * Modules ranked by their cumulative import time, including their imports.
+
+The script exits with status 1 if the import takes longer than the budget, so it can guard
+against regressions such as importing a heavy optional dependency at module load. Import
+dependencies used only by rarely called functions within those functions instead.
+
+Usage: python3 -m backend.script.import_time [--help]
+"""
+
+import argparse
+import subprocess
+import sys
+from collections import Counter
+from dataclasses import dataclass
+
+__authors__ = ["Kris Jordan"]
+__copyright__ = "Copyright 2023"
+__license__ = "MIT"
+
+BUDGET_MS = 1500
+"""Target time to import `backend.main`, which precedes the first request a container serves.
+
+The fastest of five imports measured 1020 to 1170 ms across repeated runs on a development
+machine, so the budget leaves a margin of about 30% over the slowest of them for noise."""
+
+RUNS = 5
+"""Imports measured by default, keeping the fastest."""
+
+
+@dataclass(frozen=True)
+class ImportTime:
+    """The time taken to import one module, as reported by `python -X importtime`."""
+
+    module: str
+    self_us: int
+    cumulative_us: int
+    depth: int
+
+    @property
+    def package(self) -> str:
+        return self.module.split(".")[0]
+
+
+def parse_importtime(output: str) -> list[ImportTime]:
+    """Parse the `-X importtime` lines written to standard error.
+
+    Args:
+        output (str): The interpreter's standard error.
+
+    Returns:
+        list[ImportTime]: The imported modules, in the order their imports completed."""
+    imports = []
+    for line in output.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        fields = line.removeprefix("import time:").split("|")
+        if len(fields) != 3 or not fields[0].strip().isdigit():
+            continue  # The header line
+        name = fields[2].rstrip()
+        module = name.lstrip()
+        imports.append(
+            ImportTime(
+                module=module,
+                self_us=int(fields[0]),
+                cumulative_us=int(fields[1]),
+                depth=(len(name) - len(module) - 1) // 2,
+            )
+        )
+    return imports
+
+
+def measure(module: str) -> list[ImportTime]:
+    """Import a module in a fresh interpreter and collect its import times.
+
+    Args:
+        module (str): The module to import.
+
+    Returns:
+        list[ImportTime]: The imported modules.
+
+    Raises:
+        RuntimeError: If the module fails to import."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"Importing {module} failed:\n{result.stderr}")
+    return parse_importtime(result.stderr)
+
+
+def total_us(imports: list[ImportTime]) -> int:
+    """The time taken by the outermost imports, which include every other import."""
+    return sum(entry.cumulative_us for entry in imports if entry.depth == 0)
+
+
+def report(
+    module: str, imports: list[ImportTime], runs: int, top: int, budget_ms: float
+) -> str:
+    """Format the ranked tables of a measured import.
+
+    Args:
+        module (str): The module that was imported.
+        imports (list[ImportTime]): The import times of the fastest run.
+        runs (int): The number of runs measured.
+        top (int): The number of rows in each table.
+        budget_ms (float): The target import time in milliseconds.
+
+    Returns:
+        str: The report."""
+    total_ms = total_us(imports) / 1000
+    lines = [
+        f"Import time of {module}: {total_ms:.1f} ms, best of {runs} "
+        f"(budget {budget_ms:.0f} ms)"
+    ]
+
+    packages = Counter[str]()
+    for entry in imports:
+        packages[entry.package] += entry.self_us
+    lines += ["", "Packages by self time", f"{'ms':>9}  {'share':>6}  package"]
+    for package, self_us in packages.most_common(top):
+        share = self_us / total_us(imports) if total_us(imports) else 0
+        lines.append(f"{self_us / 1000:>9.1f}  {share:>6.1%}  {package}")
+
+    lines += [
+        "",
+        "Modules by cumulative time",
+        f"{'self ms':>9}  {'cum. ms':>9}  module",
+    ]
+    ranked = sorted(imports, key=lambda entry: entry.cumulative_us, reverse=True)
+    for entry in ranked[:top]:
+        lines.append(
+            f"{entry.self_us / 1000:>9.1f}  {entry.cumulative_us / 1000:>9.1f}  "
+            f"{entry.module}"
+        )
+    return "\n".join(lines)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Report the time spent importing the application, ranked by module."
+    )
+    parser.add_argument("--module", default="backend.main", help="the module to import")
+    parser.add_argument(
+        "--runs", type=int, default=RUNS, help="imports to measure, keeping the fastest"
+    )
+    parser.add_argument("--top", type=int, default=25, help="rows in each table")
+    parser.add_argument(
+        "--budget-ms",
+        type=float,
+        default=BUDGET_MS,
+        help="exit with status 1 if the import takes longer",
+    )
+    args = parser.parse_args()
+
+    runs = max(args.runs, 1)
+    imports = min((measure(args.module) for _ in range(runs)), key=total_us)
+    print(report(args.module, imports, runs, args.top, args.budget_ms))
+    if total_us(imports) / 1000 > args.budget_ms:
+        print(f"\nOver budget by {total_us(imports) / 1000 - args.budget_ms:.1f} ms")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
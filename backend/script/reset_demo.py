@@ -11,12 +11,18 @@ Usage: python3 -m script.reset_demo
 """
 
 import sys
-import subprocess
-from sqlalchemy import text
+from sqlalchemy.exc import OperationalError
 from sqlalchemy.orm import Session
 from ..database import engine
 from ..env import getenv
 from .. import entities
+from .database_server import create_database, drop_database, server_connection
+from .bulk_load import (
+    OperatingHoursRecord,
+    ReservationRecord,
+    SeatRecord,
+    bulk_load,
+)
 
 from ..test.services import role_data, user_data, permission_data, room_data
 from ..test.services.organization import organization_demo_data
@@ -35,9 +41,20 @@ if getenv("MODE") != "development":
     print("Add MODE=development to your .env file in workspace's `backend/` directory")
     exit(1)
 
-# Run Delete and Create Database Scripts
-subprocess.run(["python3", "-m", "backend.script.delete_database"])
-subprocess.run(["python3", "-m", "backend.script.create_database"])
+# Delete and create the database in this process rather than running the scripts that do so.
+# When the database is in use (e.g. by a running backend), it is kept and its tables reset.
+database = getenv("POSTGRES_DATABASE")
+with server_connection() as connection:
+    try:
+        drop_database(connection, database, if_exists=True)
+        create_database(connection, database)
+    except OperationalError as e:
+        if "is being accessed by other users" not in str(e.orig):
+            raise
+        print(
+            "Could not drop database because it's being accessed by others (psql open?), "
+            "resetting its tables instead."
+        )
 
 # Reset Tables
 entities.EntityBase.metadata.drop_all(engine)
@@ -52,10 +69,34 @@ with Session(engine) as session:
     permission_data.insert_fake_data(session)
     organization_demo_data.insert_fake_data(session)
     event_demo_data.insert_fake_data(session)
-    operating_hours_data.insert_fake_data(session, time)
-    seat_data.insert_fake_data(session)
     room_data.insert_fake_data(session)
-    reservation_data.insert_fake_data(session, time)
+    # Rooms and users are flushed so that the bulk loaded coworking data may refer to them.
+    session.flush()
+
+    operating_hours_data.instantiate_global_models(time)
+    reservation_data.instantiate_global_models(time)
+    bulk_load(
+        session,
+        seats=[
+            SeatRecord(**seat.model_dump(exclude={"room"}), room_id=seat.room.id)
+            for seat in seat_data.seats
+        ],
+        operating_hours=[
+            OperatingHoursRecord(**operating_hours.model_dump())
+            for operating_hours in operating_hours_data.all
+        ],
+        reservations=[
+            ReservationRecord(
+                **reservation.model_dump(
+                    include={"id", "start", "end", "state", "walkin", "created_at"}
+                ),
+                room_id=reservation.room.id if reservation.room else None,
+                user_ids=[user.id for user in reservation.users],
+                seat_ids=[seat.id for seat in reservation.seats],
+            )
+            for reservation in reservation_data.reservations
+        ],
+    )
     course_data.insert_fake_data(session)
     term_data.insert_fake_data(session)
     section_data.insert_fake_data(session)
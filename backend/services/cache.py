@@ -0,0 +1,116 @@
+"""Bounded, thread-safe, in-process caches with time-to-live expiration.
+
+Caches are process-local. With several application workers, an explicit invalidation only
+reaches the worker that performed the change, so every cache entry also expires after its
+time-to-live as a safety net.
+"""
+
+from collections import OrderedDict
+from datetime import timedelta
+from threading import Lock
+from time import monotonic
+from typing import Callable, Generic, TypeVar
+
+__authors__ = ["Kris Jordan"]
+__copyright__ = "Copyright 2023"
+__license__ = "MIT"
+
+K = TypeVar("K")
+V = TypeVar("V")
+
+
+class TTLCache(Generic[K, V]):
+    """A least-recently-used cache whose entries expire after a time-to-live."""
+
+    def __init__(self, maxsize: int, ttl: timedelta):
+        """Initializes an empty cache.
+
+        Args:
+            maxsize (int): The maximum number of entries; least recently used entries are evicted first.
+            ttl (timedelta): The default amount of time an entry remains valid.
+        """
+        self._maxsize = maxsize
+        self._ttl = ttl.total_seconds()
+        self._entries: OrderedDict[K, tuple[float, V]] = OrderedDict()
+        self._lock = Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: K) -> V | None:
+        """Get the unexpired value for a key.
+
+        Args:
+            key (K): The key to look up.
+
+        Returns:
+            V | None: The cached value, or None if absent or expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at <= monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: K, value: V, ttl: timedelta | None = None) -> None:
+        """Store a value for a key.
+
+        Args:
+            key (K): The key to store the value under.
+            value (V): The value to store.
+            ttl (timedelta | None): Overrides the cache's time-to-live for this entry when given.
+
+        Returns:
+            None"""
+        seconds = self._ttl if ttl is None else min(ttl.total_seconds(), self._ttl)
+        with self._lock:
+            self._entries[key] = (monotonic() + seconds, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._maxsize:
+                self._entries.popitem(last=False)
+
+    def get_or_load(self, key: K, load: Callable[[], V]) -> V:
+        """Get the value for a key, loading and storing it on a miss.
+
+        Args:
+            key (K): The key to look up.
+            load (Callable[[], V]): Produces the value when it is not cached.
+
+        Returns:
+            V: The cached or newly loaded value."""
+        value = self.get(key)
+        if value is None:
+            value = load()
+            self.set(key, value)
+        return value
+
+    def pop(self, key: K) -> None:
+        """Remove the entry for a key if present."""
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def discard_if(self, predicate: Callable[[K, V], bool]) -> None:
+        """Remove every entry whose key and value satisfy a predicate.
+
+        Args:
+            predicate (Callable[[K, V], bool]): Returns True for entries to remove.
+
+        Returns:
+            None"""
+        with self._lock:
+            stale = [
+                key
+                for key, (_, value) in self._entries.items()
+                if predicate(key, value)
+            ]
+            for key in stale:
+                del self._entries[key]
+
+    def clear(self) -> None:
+        """Remove every entry."""
+        with self._lock:
+            self._entries.clear()
@@ -0,0 +1,115 @@
+"""Asynchronous facade over the coworking services used by the hottest endpoints.
+
+The coworking services are written against a synchronous `Session`. Rather than duplicate
+them, each call here runs the existing service code through `AsyncSession.run_sync`, which
+executes it in a greenlet on the event loop with an asyncpg connection. Endpoints built on
+this facade never wait on FastAPI's bounded worker threadpool, so a burst of status polling
+cannot starve other requests of threads.
+"""
+
+from typing import Callable, Sequence, TypeVar
+from fastapi import Depends
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from ...database import async_db_session
+from ...models import User
+from ...models.coworking import (
+    Reservation,
+    ReservationRequest,
+    SeatProximity,
+    Status,
+)
+from ..permission import PermissionService
+from .operating_hours import OperatingHoursService
+from .policy import PolicyService
+from .reservation import ReservationService
+from .seat import SeatService
+from .status import StatusService
+
+__authors__ = ["Kris Jordan"]
+__copyright__ = "Copyright 2023"
+__license__ = "MIT"
+
+T = TypeVar("T")
+
+
+def sync_status_svc(session: Session) -> StatusService:
+    """Wire up a StatusService and its dependencies over a synchronous session."""
+    permission_svc = PermissionService(session)
+    policy_svc = PolicyService()
+    operating_hours_svc = OperatingHoursService(session, permission_svc)
+    seat_svc = SeatService(session)
+    reservation_svc = ReservationService(
+        session, permission_svc, policy_svc, operating_hours_svc, seat_svc
+    )
+    return StatusService(policy_svc, operating_hours_svc, seat_svc, reservation_svc)
+
+
+def sync_reservation_svc(session: Session) -> ReservationService:
+    """Wire up a ReservationService and its dependencies over a synchronous session."""
+    return sync_status_svc(session)._reservation_svc
+
+
+class AsyncCoworkingService:
+    """Async variants of the coworking operations on the request hot path."""
+
+    def __init__(self, session: AsyncSession):
+        """Initializes the facade with an AsyncSession.
+
+        Args:
+            session (AsyncSession): The asyncio database session to run service code with.
+        """
+        self._session = session
+
+    async def _run(self, operation: Callable[[Session], T]) -> T:
+        return await self._session.run_sync(operation)
+
+    async def get_coworking_status(self, subject: User) -> Status:
+        """Async variant of `StatusService.get_coworking_status`."""
+        return await self._run(
+            lambda session: sync_status_svc(session).get_coworking_status(subject)
+        )
+
+    async def draft_reservation(
+        self,
+        subject: User,
+        request: ReservationRequest,
+        near: int | SeatProximity | None = None,
+    ) -> Reservation:
+        """Async variant of `ReservationService.draft_reservation`."""
+        return await self._run(
+            lambda session: sync_reservation_svc(session).draft_reservation(
+                subject, request, near
+            )
+        )
+
+    async def list_all_active_and_upcoming_for_xl(
+        self, subject: User
+    ) -> Sequence[Reservation]:
+        """Async variant of `ReservationService.list_all_active_and_upcoming_for_xl`."""
+        return await self._run(
+            lambda session: sync_reservation_svc(
+                session
+            ).list_all_active_and_upcoming_for_xl(subject)
+        )
+
+    async def list_all_active_and_upcoming_for_rooms(
+        self, subject: User
+    ) -> Sequence[Reservation]:
+        """Async variant of `ReservationService.list_all_active_and_upcoming_for_rooms`."""
+        return await self._run(
+            lambda session: sync_reservation_svc(
+                session
+            ).list_all_active_and_upcoming_for_rooms(subject)
+        )
+
+
+async def async_coworking_svc(
+    session: AsyncSession = Depends(async_db_session),
+) -> AsyncCoworkingService:
+    """Dependency providing an AsyncCoworkingService.
+
+    This is an async function, rather than injecting the class directly, because FastAPI
+    constructs class dependencies on its threadpool."""
+    return AsyncCoworkingService(session)
@@ -0,0 +1,232 @@
+"""In-memory interval engine for computing seat availability.
+
+The engine works on plain `(start, end)` datetime tuples rather than pydantic models so
+that subtracting many reservations from many seats does not allocate and validate a
+new model for every split. Results are converted to `SeatAvailability` models by the
+caller at the API edge.
+"""
+
+from collections import defaultdict, deque
+from datetime import datetime, timedelta
+from heapq import heappop, heappush
+from typing import Iterable, Sequence, TypeVar
+
+__authors__ = ["Kris Jordan"]
+__copyright__ = "Copyright 2023"
+__license__ = "MIT"
+
+
+Interval = tuple[datetime, datetime]
+"""A half-open `[start, end)` span of time."""
+
+SeatInterval = tuple[int, datetime, datetime]
+"""A reserved `[start, end)` span of time for the seat with the given id."""
+
+T = TypeVar("T")
+
+
+def merge_intervals(intervals: Iterable[Interval]) -> list[Interval]:
+    """Sort and coalesce overlapping intervals.
+
+    Args:
+        intervals (Iterable[Interval]): Intervals in any order, possibly overlapping.
+
+    Returns:
+        list[Interval]: Disjoint intervals sorted by start."""
+    merged: list[Interval] = []
+    for start, end in sorted(intervals):
+        if merged and start <= merged[-1][1]:
+            if end > merged[-1][1]:
+                merged[-1] = (merged[-1][0], end)
+        else:
+            merged.append((start, end))
+    return merged
+
+
+def subtract_intervals(
+    windows: Sequence[Interval], blocks: Sequence[Interval]
+) -> list[Interval]:
+    """Remove blocked time from a list of windows in a single linear sweep.
+
+    Args:
+        windows (Sequence[Interval]): Disjoint windows sorted by start.
+        blocks (Sequence[Interval]): Disjoint blocks sorted by start (see `merge_intervals`).
+
+    Returns:
+        list[Interval]: The portions of `windows` not covered by any block, sorted by start.
+    """
+    free: list[Interval] = []
+    b = 0
+    for window_start, window_end in windows:
+        # Skip blocks that end before this window begins
+        while b < len(blocks) and blocks[b][1] <= window_start:
+            b += 1
+
+        cursor = window_start
+        i = b
+        while i < len(blocks) and blocks[i][0] < window_end:
+            block_start, block_end = blocks[i]
+            if block_start > cursor:
+                free.append((cursor, block_start))
+            if block_end > cursor:
+                cursor = block_end
+            i += 1
+
+        if cursor < window_end:
+            free.append((cursor, window_end))
+    return free
+
+
+def seat_free_windows(
+    seat_ids: Iterable[int],
+    open_windows: Sequence[Interval],
+    reservations: Iterable[SeatInterval],
+    minimum: timedelta,
+) -> dict[int, list[Interval]]:
+    """Compute the free windows of every seat in one pass over the reservations.
+
+    Args:
+        seat_ids (Iterable[int]): The seats of interest.
+        open_windows (Sequence[Interval]): Disjoint, sorted windows the XL is open.
+        reservations (Iterable[SeatInterval]): Reserved intervals keyed by seat id. Seats
+            not among `seat_ids` are ignored.
+        minimum (timedelta): Free windows shorter than this are discarded.
+
+    Returns:
+        dict[int, list[Interval]]: Free windows by seat id. Seats with no window of at least
+            `minimum` are omitted."""
+    seat_ids = list(seat_ids)
+    blocks_by_seat: dict[int, list[Interval]] = defaultdict(list)
+    wanted = set(seat_ids)
+    for seat_id, start, end in reservations:
+        if seat_id in wanted:
+            blocks_by_seat[seat_id].append((start, end))
+
+    free_by_seat: dict[int, list[Interval]] = {}
+    for seat_id in seat_ids:
+        blocks = blocks_by_seat.get(seat_id)
+        if blocks:
+            free = subtract_intervals(open_windows, merge_intervals(blocks))
+        else:
+            free = list(open_windows)
+        free = [(start, end) for start, end in free if end - start >= minimum]
+        if len(free) > 0:
+            free_by_seat[seat_id] = free
+    return free_by_seat
+
+
+def group_free_window(
+    free_windows: dict[int, list[Interval]],
+    positions: dict[int, tuple[int, int]],
+    size: int,
+    minimum: timedelta,
+) -> tuple[list[int], Interval] | None:
+    """Find the earliest window in which a group of seats is free together.
+
+    The windows of all seats are swept once in order of start. A heap keyed by end holds the
+    windows that have started; at each start, windows ending too soon to fit `minimum` are
+    popped, leaving one window per seat free from that start on. The first start at which
+    `size` seats remain is the earliest the group can sit together, and the most compact of
+    those seats are chosen (see `compact_group`). Sorting the windows bounds the sweep by
+    O(w log w) for w windows.
+
+    Args:
+        free_windows (dict[int, list[Interval]]): Disjoint free windows by seat id (see
+            `seat_free_windows`).
+        positions (dict[int, tuple[int, int]]): The `(x, y)` position of every seat.
+        size (int): The number of seats in the group.
+        minimum (timedelta): The shortest window the group may share.
+
+    Returns:
+        tuple[list[int], Interval] | None: The ids of the group's seats and the window they
+            are all free in, or None if no `size` seats are ever free together."""
+    if size < 1:
+        return None
+    windows = sorted(
+        (start, end, seat_id)
+        for seat_id, intervals in free_windows.items()
+        for start, end in intervals
+    )
+    started: list[tuple[datetime, int]] = []
+    i = 0
+    while i < len(windows):
+        start = windows[i][0]
+        while i < len(windows) and windows[i][0] == start:
+            heappush(started, (windows[i][1], windows[i][2]))
+            i += 1
+        while started and started[0][0] - start < minimum:
+            heappop(started)
+        if len(started) >= size:
+            ends = {seat_id: end for end, seat_id in started}
+            seat_ids = compact_group(ends, positions, size)
+            return seat_ids, (start, min(ends[seat_id] for seat_id in seat_ids))
+    return None
+
+
+def compact_group(
+    ends: dict[int, datetime], positions: dict[int, tuple[int, int]], size: int
+) -> list[int]:
+    """Choose the seats of a group that sit closest together.
+
+    Seats are ordered along rows, then along columns, and every run of `size` consecutive
+    seats in either order is a candidate. The candidate with the smallest bounding box
+    (width plus height) wins, and ties go to the group free for longest. Spreads and common
+    ends of all runs are found with sliding window extremes, so choosing is O(s log s) for
+    s seats, whatever the size of the group.
+
+    Args:
+        ends (dict[int, datetime]): The seats to choose from, with the end of their free time.
+        positions (dict[int, tuple[int, int]]): The `(x, y)` position of every seat.
+        size (int): The number of seats to choose, at most `len(ends)`.
+
+    Returns:
+        list[int]: The ids of the chosen seats."""
+    best: tuple[int, datetime, list[int]] | None = None
+    for axes in ((1, 0), (0, 1)):
+        ordered = sorted(
+            ends,
+            key=lambda seat_id: (
+                positions[seat_id][axes[0]],
+                positions[seat_id][axes[1]],
+                seat_id,
+            ),
+        )
+        xs = [positions[seat_id][0] for seat_id in ordered]
+        ys = [positions[seat_id][1] for seat_id in ordered]
+        spreads = [
+            width + height
+            for width, height in zip(
+                _sliding_spreads(xs, size), _sliding_spreads(ys, size)
+            )
+        ]
+        common_ends = _sliding_minimums([ends[seat_id] for seat_id in ordered], size)
+        for i, (spread, end) in enumerate(zip(spreads, common_ends)):
+            if (
+                best is None
+                or spread < best[0]
+                or (spread == best[0] and end > best[1])
+            ):
+                best = (spread, end, ordered[i : i + size])
+    return best[2] if best else []
+
+
+def _sliding_minimums(values: Sequence[T], size: int) -> list[T]:
+    """The minimum of every run of `size` consecutive values, using a monotonic deque."""
+    minimums: list[T] = []
+    candidates: deque[int] = deque()
+    for i, value in enumerate(values):
+        while candidates and values[candidates[-1]] >= value:
+            candidates.pop()
+        candidates.append(i)
+        if candidates[0] <= i - size:
+            candidates.popleft()
+        if i >= size - 1:
+            minimums.append(values[candidates[0]])
+    return minimums
+
+
+def _sliding_spreads(values: Sequence[int], size: int) -> list[int]:
+    """The difference between the largest and smallest of every run of `size` values."""
+    maximums = _sliding_minimums([-value for value in values], size)
+    minimums = _sliding_minimums(values, size)
+    return [-maximum - minimum for maximum, minimum in zip(maximums, minimums)]
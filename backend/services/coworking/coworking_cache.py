@@ -0,0 +1,78 @@
+"""Process-wide snapshots of the coworking space's rooms, seats and operating hours.
+
+Every coworking status poll and room reservation map reads these tables, while they change only
+a few times per semester. Each snapshot is loaded once, stored as a tuple, and shared by every
+request without copying, so callers must treat the models it contains as read-only.
+
+Services that change rooms, seats or operating hours must invalidate the affected snapshots.
+Entries also expire after a short time so that changes made outside of this process (e.g. by
+the reset scripts) are eventually picked up.
+"""
+
+from datetime import timedelta
+from typing import Callable, Sequence, TypeVar
+
+from ...models import RoomDetails
+from ...models.coworking import OperatingHours, SeatDetails
+from ..cache import TTLCache
+from .seat_index import SeatIndex
+
+__authors__ = ["Kris Jordan"]
+__copyright__ = "Copyright 2023"
+__license__ = "MIT"
+
+
+T = TypeVar("T")
+
+_TTL = timedelta(minutes=10)
+
+reservable_rooms: TTLCache[None, tuple[RoomDetails, ...]] = TTLCache(
+    maxsize=1, ttl=_TTL
+)
+"""Rooms shown on the room reservation map, ordered by id."""
+
+seats: TTLCache[None, tuple[SeatDetails, ...]] = TTLCache(maxsize=1, ttl=_TTL)
+"""Every seat of the coworking space."""
+
+seat_index: TTLCache[None, SeatIndex] = TTLCache(maxsize=1, ttl=_TTL)
+"""Spatial index over the seat snapshot, rebuilt when the snapshot is replaced."""
+
+operating_hours: TTLCache[None, tuple[OperatingHours, ...]] = TTLCache(
+    maxsize=1, ttl=_TTL
+)
+"""Every operating hours entry, ordered by start."""
+
+
+def snapshot(
+    cache: TTLCache[None, tuple[T, ...]], load: Callable[[], Sequence[T]]
+) -> tuple[T, ...]:
+    """Get the snapshot held by a cache, loading it on a miss.
+
+    Args:
+        cache (TTLCache[None, tuple[T, ...]]): One of the snapshot caches of this module.
+        load (Callable[[], Sequence[T]]): Loads the models of the snapshot from the database.
+
+    Returns:
+        tuple[T, ...]: The shared snapshot."""
+    return cache.get_or_load(None, lambda: tuple(load()))
+
+
+def invalidate_rooms() -> None:
+    """Discard the room and seat snapshots after a room or seat changes.
+
+    Rooms embed their seats and seats embed their room, so both are discarded together.
+    """
+    reservable_rooms.clear()
+    seats.clear()
+    seat_index.clear()
+
+
+def invalidate_operating_hours() -> None:
+    """Discard the operating hours snapshot."""
+    operating_hours.clear()
+
+
+def invalidate_all() -> None:
+    """Discard every snapshot, e.g. after the database is reset."""
+    invalidate_rooms()
+    invalidate_operating_hours()
@@ -1,5 +1,8 @@
 """Service that manages operating hours of the XL."""
 
+from bisect import bisect_right
+from datetime import datetime
+from zoneinfo import ZoneInfo
 from fastapi import Depends
 from sqlalchemy.orm import Session
 from .exceptions import OperatingHoursCannotOverlapException
@@ -9,6 +12,7 @@ from ...models import User
 from ...database import db_session
 from ...models.coworking import OperatingHours, TimeRange
 from ...entities.coworking import OperatingHoursEntity
+from . import coworking_cache
 
 __authors__ = ["Kris Jordan"]
 __copyright__ = "Copyright 2023"
@@ -51,12 +55,36 @@ class OperatingHoursService:
     def schedule(self, time_range: TimeRange) -> list[OperatingHours]:
         """Returns all operating hours of the XL for a given date range.
 
+        Operating hours are served from a snapshot shared across requests and must not be
+        modified.
+
         Args:
             time_range (TimeRange): The date range to check for matching OperatingHours.
 
         Returns:
             list[OperatingHours]: All operating hours the XL within the given time_range, including overlaps.
         """
+        operating_hours = coworking_cache.snapshot(
+            coworking_cache.operating_hours, self._load
+        )
+        start, end = _naive(time_range.start), _naive(time_range.end)
+        # The snapshot is ordered by start, so entries starting after the range are skipped.
+        candidates = operating_hours[
+            : bisect_right(operating_hours, end, key=lambda entry: entry.start)
+        ]
+        return [entry for entry in candidates if entry.end >= start]
+
+    def _load(self) -> list[OperatingHours]:
+        entities = (
+            self._session.query(OperatingHoursEntity)
+            .order_by(OperatingHoursEntity.start)
+            .all()
+        )
+        return [entity.to_model() for entity in entities]
+
+    def _conflicts(self, time_range: TimeRange) -> list[OperatingHours]:
+        """Operating hours overlapping a time range, read from the database rather than the
+        snapshot so that writes are checked against the current state."""
         entities = (
             self._session.query(OperatingHoursEntity)
             .filter(
@@ -82,7 +110,7 @@ class OperatingHoursService:
             subject, "coworking.operating_hours.create", "coworking/operating_hours"
         )
 
-        conflicts = self.schedule(time_range)
+        conflicts = self._conflicts(time_range)
         if len(conflicts) > 0:
             raise OperatingHoursCannotOverlapException(
                 f"Conflicts in the range of {str(time_range)}"
@@ -91,6 +119,7 @@ class OperatingHoursService:
         entity = OperatingHoursEntity(start=time_range.start, end=time_range.end)
         self._session.add(entity)
         self._session.commit()
+        coworking_cache.invalidate_operating_hours()
         return entity.to_model()
 
     def delete(self, subject: User, operating_hours: OperatingHours) -> None:
@@ -114,3 +143,11 @@ class OperatingHoursService:
         )
         self._session.delete(operating_hours_entity)
         self._session.commit()
+        coworking_cache.invalidate_operating_hours()
+
+
+def _naive(value: datetime) -> datetime:
+    """Operating hours are stored as naive local times; see `TimeRange`."""
+    if value.tzinfo is None:
+        return value
+    return value.astimezone(ZoneInfo("America/New_York")).replace(tzinfo=None)
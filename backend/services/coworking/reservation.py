@@ -1,10 +1,12 @@
 """Service that manages reservations in the coworking space."""
 
 from fastapi import Depends
+from collections import defaultdict
 from datetime import datetime, timedelta
+from math import hypot
 from random import random
 from typing import Sequence
-from sqlalchemy import or_
+from sqlalchemy import and_, or_, select
 from sqlalchemy.orm import Session, joinedload
 from backend.entities.room_entity import RoomEntity
 
@@ -14,28 +16,46 @@ from ...models.user import User, UserIdentity
 from ..exceptions import UserPermissionException, ResourceNotFoundException
 from ...models.coworking import (
     Seat,
+    SeatProximity,
     Reservation,
     ReservationMapDetails,
     ReservationRequest,
     ReservationPartial,
+    ReservationDetails,
     TimeRange,
     SeatAvailability,
     ReservationState,
     RoomState,
-    AvailabilityList,
     OperatingHours,
 )
 from ...entities import UserEntity
-from ...entities.coworking import ReservationEntity, SeatEntity
+from ...entities.coworking import (
+    ReservationEntity,
+    SeatEntity,
+    reservation_seat_table,
+)
+from ...entities.coworking.reservation_entity import ACTIVE_RESERVATION
+from ...entities.coworking.reservation_user_table import reservation_user_table
 from .seat import SeatService
 from .policy import PolicyService
 from .operating_hours import OperatingHoursService
+from .availability_engine import (
+    Interval,
+    SeatInterval,
+    group_free_window,
+    seat_free_windows,
+)
+from .room_map import RoomSlotMatrix
+from . import coworking_cache
 from ..permission import PermissionService
 
-__authors__ = ["Kris Jordan", "Matt Vu","Yuvraj Jain"]
+__authors__ = ["Kris Jordan", "Matt Vu", "Yuvraj Jain"]
 __copyright__ = "Copyright 2023"
 __license__ = "MIT"
 
+# Slack allowed when checking a window is at least as long as the minimum reservation.
+MINUMUM_RESERVATION_EPSILON = timedelta(minutes=1)
+
 
 class ReservationException(Exception):
     def __init__(self, message: str):
@@ -143,9 +163,7 @@ class ReservationService:
             .filter(
                 ReservationEntity.start < time_range.end,
                 ReservationEntity.end > time_range.start,
-                ReservationEntity.state.not_in(
-                    [ReservationState.CANCELLED, ReservationState.CHECKED_OUT]
-                ),
+                ACTIVE_RESERVATION,
                 UserEntity.id == focus.id,
             )
             .options(
@@ -155,7 +173,7 @@ class ReservationService:
             .all()
         )
 
-        reservations = self._state_transition_reservation_entities_by_time(
+        reservations = self._exclude_expired_reservation_entities(
             datetime.now(), reservations
         )
 
@@ -183,7 +201,7 @@ class ReservationService:
             .all()
         )
 
-        reservations = self._state_transition_reservation_entities_by_time(
+        reservations = self._exclude_expired_reservation_entities(
             datetime.now(), reservations
         )
 
@@ -272,7 +290,7 @@ class ReservationService:
         """
         reserved_date_map: dict[str, list[int]] = {}
 
-        # Query DB to get reservable rooms. 
+        # Query DB to get reservable rooms.
         rooms = self._get_reservable_rooms()
 
         # Generate a 1 day time range to get operating hours on date.
@@ -302,9 +320,7 @@ class ReservationService:
             self._round_to_closest_half_hour(
                 operating_hours_on_date.start, round_up=True
             ),
-            self._round_to_closest_half_hour(
-                datetime.now(), round_up=False
-            )
+            self._round_to_closest_half_hour(datetime.now(), round_up=False),
         )
         operating_hours_end = self._round_to_closest_half_hour(
             operating_hours_on_date.end, round_up=False
@@ -320,56 +336,71 @@ class ReservationService:
         current_time = datetime.now()
         current_time_idx = self._idx_calculation(current_time, operating_hours_start)
 
-        for room in rooms:
-            time_slots_for_room = [0] * operating_hours_duration
-
-            # # Making slots up till current time gray
-            # This code no longer required, but may be required in the future. 
-            # Please keep this here for now.
-            # if date.date() == current_time.date():
-            #     for i in range(0, current_time_idx):
-            #         time_slots_for_room[i] = RoomState.UNAVAILABLE.value
-
-            if room.id == "SN156":
-                reservations = self._query_xl_reservations_by_date_for_user(date, subject)
-            else:
-                reservations = self._query_confirmed_reservations_by_date_and_room(
-                    date, room.id
-                )
-            for reservation in reservations:
-                start_idx = self._idx_calculation(
-                    reservation.start, operating_hours_start
-                )
-                end_idx = self._idx_calculation(reservation.end, operating_hours_start)
-
-                if start_idx < 0 or end_idx > operating_hours_duration:
+        # One row per room. The XL row (SN156) only carries the subject's own XL
+        # reservations so that they gray out the columns of the other rooms.
+        room_map = RoomSlotMatrix([room.id for room in rooms], operating_hours_duration)
+
+        reserved_spans: list[tuple[str, int, int]] = []
+        subject_spans: list[tuple[str, int, int]] = []
+        for (
+            room_id,
+            start,
+            end,
+            is_subject,
+        ) in self._query_room_map_reservations_by_date(
+            date, subject, include_xl="SN156" in room_map
+        ):
+            # Only the subject's room-less XL reservations belong in the XL row, not
+            # reservations made for the room SN156 itself.
+            if room_id == "SN156":
+                continue
+            room_id = room_id if room_id is not None else "SN156"
+            if room_id not in room_map:
+                continue
+
+            start_idx = self._idx_calculation(start, operating_hours_start)
+            end_idx = self._idx_calculation(end, operating_hours_start)
+
+            if start_idx < 0 or end_idx > operating_hours_duration:
+                continue
+
+            # Gray out previous time slots for today only
+            if date.date() == current_time.date():
+                if end_idx < current_time_idx:
                     continue
+                start_idx = max(current_time_idx, start_idx)
 
-                # Gray out previous time slots for today only
-                if date.date() == current_time.date():
-                    if end_idx < current_time_idx:
-                        continue
-                    start_idx = max(current_time_idx, start_idx)
-
-                for idx in range(start_idx, end_idx):
-                    # Currently only assuming single user.
-                    # TODO: If making group reservations, need to change this.
-                    if reservation.users[0].id == subject.id:
-                        time_slots_for_room[idx] = RoomState.SUBJECT_RESERVED.value
-                    else:
-                        if time_slots_for_room[idx] != RoomState.SUBJECT_RESERVED.value:
-                            time_slots_for_room[idx] = RoomState.RESERVED.value
-            reserved_date_map[room.id] = time_slots_for_room
-
-        self._transform_date_map_for_unavailable(reserved_date_map)
-        if "SN156" in reserved_date_map:
-            del reserved_date_map["SN156"]
-        self._transform_date_map_for_officehours(
-            date, reserved_date_map, operating_hours_start, operating_hours_duration
+            if is_subject:
+                subject_spans.append((room_id, start_idx, end_idx))
+            else:
+                reserved_spans.append((room_id, start_idx, end_idx))
+
+        # Subject's reservations are applied last so they take precedence over others'.
+        for room_id, start_idx, end_idx in reserved_spans:
+            room_map.fill(room_id, start_idx, end_idx, RoomState.RESERVED)
+        for room_id, start_idx, end_idx in subject_spans:
+            room_map.fill(room_id, start_idx, end_idx, RoomState.SUBJECT_RESERVED)
+
+        # A subject may not be in two places at once, so every column they hold is
+        # unavailable in all other rooms.
+        room_map.mask_available(
+            (start_idx, end_idx) for _, start_idx, end_idx in subject_spans
         )
+        room_map.remove("SN156")
+
+        for room_id, hours in self._policy_svc.office_hours(date=date).items():
+            if room_id not in room_map:
+                continue
+            for start, end in hours:
+                room_map.fill(
+                    room_id,
+                    self._idx_calculation(start, operating_hours_start),
+                    self._idx_calculation(end, operating_hours_start),
+                    RoomState.UNAVAILABLE,
+                )
 
         return ReservationMapDetails(
-            reserved_date_map=reserved_date_map,
+            reserved_date_map=room_map.to_dict(),
             operating_hours_start=operating_hours_start,
             operating_hours_end=operating_hours_end,
             number_of_time_slots=operating_hours_duration,
@@ -427,116 +458,55 @@ class ReservationService:
             (time.minute - operating_hours_start.minute) // 30
         )
 
-    def _transform_date_map_for_unavailable(
-        self, reserved_date_map: dict[str, list[int]]
-    ) -> None:
-        """
-        Modifies the reserved date map to mark certain slots as unavailable.
-
-        This function updates the reserved date map so that if a slot is reserved by the subject
-        (indicated by a 4), then any available slots (indicated by 0) in the same column across
-        all rooms are marked as unavailable (changed to 3).
-
-        Args:
-            reserved_date_map (dict[str, list[int]]): The map of room reservations to be transformed.
-
-        Returns:
-            None: This function modifies the reserved_date_map in place.
-        """
-        # Identify the columns where 4 appears
-        columns_with_4 = set()
-        for key, values in reserved_date_map.items():
-            for i, value in enumerate(values):
-                if value == RoomState.SUBJECT_RESERVED.value:
-                    columns_with_4.add(i)
-
-        # Transform the dictionary as per the rules
-        for key, values in reserved_date_map.items():
-            for i in columns_with_4:
-                if values[i] == RoomState.AVAILABLE.value:
-                    values[i] = RoomState.UNAVAILABLE.value
-
-    def _transform_date_map_for_officehours(
-        self,
-        date: datetime,
-        reserved_date_map: dict[str, list[int]],
-        operating_hours_start: datetime,
-        operating_hours_duration: int,
-    ) -> None:
-        """
-        Transforms date map in place.
-        """
-        office_hours = self._policy_svc.office_hours(date=date)
-        for room_id, hours in office_hours.items():
-            for start, end in hours:
-                start_idx = max(self._idx_calculation(start, operating_hours_start), 0)
-                end_idx = min(
-                    self._idx_calculation(end, operating_hours_start),
-                    operating_hours_duration,
-                )
-                if start_idx < end_idx:
-                    for idx in range(start_idx, end_idx):
-                        reserved_date_map[room_id][idx] = RoomState.UNAVAILABLE.value
-
-    def _query_confirmed_reservations_by_date_and_room(
-        self, date: datetime, room_id: str
-    ) -> Sequence[Reservation]:
+    def _query_room_map_reservations_by_date(
+        self, date: datetime, subject: User, include_xl: bool = True
+    ) -> Sequence[tuple[str | None, datetime, datetime, bool]]:
         """
-        Queries and returns confirmed and checked-in reservations for a given date and room.
+        Queries the reserved time ranges of every room, and the subject's XL reservations, for a date.
 
-        This function fetches all confirmed and checked-in reservations from the database for a specified date and room.
-        It includes reservations that have any overlap with the 24-hour period starting from the
-        beginning of the given date, and are associated with a specific room ID.
+        A single query replaces one query per room. Reservations are returned as plain rows
+        rather than Reservation models since the room map only needs their time ranges.
 
         Args:
-            date (datetime): The date for which to query confirmed reservations.
-            room_id (str): The ID of the room for which to query confirmed reservations.
+            date (datetime): The date for which to query reservations.
+            subject (User): The user whose reservations are flagged, and whose XL reservations are included.
+            include_xl (bool): Whether the subject's XL (seat) reservations are included.
 
         Returns:
-            Sequence[Reservation]: A sequence of Reservation model objects representing the confirmed reservations for the specified date and room.
+            Sequence[tuple[str | None, datetime, datetime, bool]]: A (room_id, start, end, is_subject) row
+                per active reservation, where room_id is None for XL reservations.
         """
         start = date.replace(hour=0, minute=0, second=0, microsecond=0)
-        reservations = (
-            self._session.query(ReservationEntity)
-            .join(ReservationEntity.room)
-            .filter(
-                ReservationEntity.start < start + timedelta(hours=24),
-                ReservationEntity.end > start,
-                ReservationEntity.state.not_in(
-                    [ReservationState.CANCELLED, ReservationState.CHECKED_OUT]
-                ),
-                RoomEntity.id == room_id,
+        is_subject = (
+            select(reservation_user_table.c.reservation_id)
+            .where(
+                reservation_user_table.c.reservation_id == ReservationEntity.id,
+                reservation_user_table.c.user_id == subject.id,
             )
-            .options(
-                joinedload(ReservationEntity.users), joinedload(ReservationEntity.seats)
-            )
-            .order_by(ReservationEntity.start)
-            .all()
+            .exists()
         )
+        location = ReservationEntity.room_id.is_not(None)
+        if include_xl:
+            location = or_(
+                location, and_(ReservationEntity.room_id.is_(None), is_subject)
+            )
 
-        return [reservation.to_model() for reservation in reservations]
-
-    def _query_xl_reservations_by_date_for_user(
-        self, date: datetime, subject: User
-    ) -> Sequence[Reservation]:
-        start = date.replace(hour=0, minute=0, second=0, microsecond=0)
-        reservations = (
-            self._session.query(ReservationEntity)
-            .join(ReservationEntity.users)
-            .filter(
+        query = (
+            select(
+                ReservationEntity.room_id,
+                ReservationEntity.start,
+                ReservationEntity.end,
+                is_subject.label("is_subject"),
+            )
+            .where(
                 ReservationEntity.start < start + timedelta(hours=24),
                 ReservationEntity.end > start,
-                ReservationEntity.state.not_in(
-                    [ReservationState.CANCELLED, ReservationState.CHECKED_OUT]
-                ),
-                ReservationEntity.room == None,
-                UserEntity.id == subject.id
+                ACTIVE_RESERVATION,
+                location,
             )
             .order_by(ReservationEntity.start)
-            .all()
         )
-
-        return [reservation.to_model() for reservation in reservations]
+        return [tuple(row) for row in self._session.execute(query)]
 
     def _get_reservable_rooms(self) -> Sequence[RoomDetails]:
         """
@@ -545,14 +515,20 @@ class ReservationService:
         (i.e., their 'reservable' attribute is True) and are not the room with ID 'SN156'.
         The rooms are then ordered by their ID in ascending order.
 
-        Each room entity is converted to a RoomDetails model before being returned.
+        Each room entity is converted to a RoomDetails model before being returned. The rooms
+        are a snapshot shared across requests and must not be modified.
 
         Returns:
             Sequence[RoomDetails]: A sequence of RoomDetails models representing all the reservable rooms, excluding room 'SN156'.
         """
+        return coworking_cache.snapshot(
+            coworking_cache.reservable_rooms, self._load_reservable_rooms
+        )
+
+    def _load_reservable_rooms(self) -> list[RoomDetails]:
         rooms = (
             self._session.query(RoomEntity)
-            .where(or_(RoomEntity.reservable == True, RoomEntity.id == 'SN156'))
+            .where(or_(RoomEntity.reservable == True, RoomEntity.id == "SN156"))
             .order_by(RoomEntity.id)
             .all()
         )
@@ -571,16 +547,42 @@ class ReservationService:
         Returns:
             Sequence[Reservation]: All reservations for the seats within the given time_range, including overlaps.
         """
+        reservations = self._get_seat_reservation_entities(
+            [seat.id for seat in seats], time_range.start, time_range.end
+        )
+        return [reservation.to_model() for reservation in reservations]
+
+    def _get_seat_reservation_intervals(
+        self, seat_ids: Sequence[int], start: datetime, end: datetime
+    ) -> list[SeatInterval]:
+        """Returns the reserved intervals of a set of seats without building Reservation models.
+
+        Args:
+            seat_ids (Sequence[int]): The ids of the seats to query for reservations.
+            start (datetime): The start of the time range of interest.
+            end (datetime): The end of the time range of interest.
+
+        Returns:
+            list[SeatInterval]: A (seat_id, start, end) tuple per reserved seat.
+        """
+        reservations = self._get_seat_reservation_entities(seat_ids, start, end)
+        return [
+            (seat.id, reservation.start, reservation.end)
+            for reservation in reservations
+            for seat in reservation.seats
+        ]
+
+    def _get_seat_reservation_entities(
+        self, seat_ids: Sequence[int], start: datetime, end: datetime
+    ) -> Sequence[ReservationEntity]:
         reservations = (
             self._session.query(ReservationEntity)
             .join(ReservationEntity.seats)
             .filter(
-                ReservationEntity.start < time_range.end,
-                ReservationEntity.end > time_range.start,
-                ReservationEntity.state.not_in(
-                    [ReservationState.CANCELLED, ReservationState.CHECKED_OUT]
-                ),
-                SeatEntity.id.in_([seat.id for seat in seats]),
+                ReservationEntity.start < end,
+                ReservationEntity.end > start,
+                ACTIVE_RESERVATION,
+                SeatEntity.id.in_(seat_ids),
             )
             .options(
                 joinedload(ReservationEntity.seats), joinedload(ReservationEntity.users)
@@ -588,17 +590,13 @@ class ReservationService:
             .all()
         )
 
-        reservations = self._state_transition_reservation_entities_by_time(
-            datetime.now(), reservations
-        )
-
-        return [reservation.to_model() for reservation in reservations]
+        return self._exclude_expired_reservation_entities(datetime.now(), reservations)
 
-    def _state_transition_reservation_entities_by_time(
+    def _exclude_expired_reservation_entities(
         self, cutoff: datetime, reservations: Sequence[ReservationEntity]
     ) -> Sequence[ReservationEntity]:
-        """Private, internal helper method for transitioning reservation entities
-        based on time. Three transitions are time-based:
+        """Private, internal helper method for excluding reservation entities that have
+        expired by time. Three transitions are time-based:
 
         1. Draft -> Cancelled following PolicyService#reservation_draft_timeout() after
            the reservation's created at.
@@ -606,45 +604,38 @@ class ReservationService:
             the reservation's start.
         3. Checked In -> Checked Out following the reservation's end.
 
+        The transitions themselves are applied in bulk by the background
+        `ReservationSweeper`; this method only hides reservations that expired since its
+        last sweep, so that read paths never write.
+
         Args:
-            moment (datetime): The time in which checks of expiration are made against. In
+            cutoff (datetime): The time in which checks of expiration are made against. In
                 production, this is the current time.
-            reservations (Sequence[ReservationEntity]): The list of entities to state transition.
+            reservations (Sequence[ReservationEntity]): The list of entities to filter.
 
         Returns:
-            Sequence[ReservationEntity] - All ReservationEntities that were not state transitioned.
+            Sequence[ReservationEntity] - All ReservationEntities that have not expired.
         """
-        valid: list[ReservationEntity] = []
-        dirty = False
-        for reservation in reservations:
-            if (
-                reservation.state == ReservationState.DRAFT
-                and reservation.created_at
-                + self._policy_svc.reservation_draft_timeout()
-                < cutoff
-            ):
-                reservation.state = ReservationState.CANCELLED
-                dirty = True
-            elif (
-                reservation.state == ReservationState.CONFIRMED
-                and reservation.start + self._policy_svc.reservation_checkin_timeout()
-                < cutoff
-            ):
-                reservation.state = ReservationState.CANCELLED
-                dirty = True
-            elif (
-                reservation.state == ReservationState.CHECKED_IN
-                and reservation.end <= cutoff
-            ):
-                reservation.state = ReservationState.CHECKED_OUT
-                dirty = True
-            else:
-                valid.append(reservation)
-
-        if dirty:
-            self._session.commit()
-
-        return valid
+        draft_cutoff = cutoff - self._policy_svc.reservation_draft_timeout()
+        checkin_cutoff = cutoff - self._policy_svc.reservation_checkin_timeout()
+        return [
+            reservation
+            for reservation in reservations
+            if not (
+                (
+                    reservation.state == ReservationState.DRAFT
+                    and reservation.created_at < draft_cutoff
+                )
+                or (
+                    reservation.state == ReservationState.CONFIRMED
+                    and reservation.start < checkin_cutoff
+                )
+                or (
+                    reservation.state == ReservationState.CHECKED_IN
+                    and reservation.end <= cutoff
+                )
+            )
+        ]
 
     def seat_availability(
         self, seats: Sequence[Seat], bounds: TimeRange
@@ -658,92 +649,160 @@ class ReservationService:
         Returns:
             Sequence[SeatAvailability]: All seat availability ordered by nearest and longest available.
         """
+        return self._seat_availability(seats, bounds)[0]
+
+    def _seat_availability(
+        self, seats: Sequence[Seat], bounds: TimeRange, neighbours: Sequence[int] = ()
+    ) -> tuple[list[SeatAvailability], list[SeatInterval]]:
+        """Computes seat availability as `seat_availability` does, keeping the reservations.
+
+        Args:
+            seats (Sequence[Seat]): The seats to check the availability of.
+            bounds (TimeRange): The time range of interest.
+            neighbours (Sequence[int]): The ids of further seats whose reservations to load.
+
+        Returns:
+            tuple[list[SeatAvailability], list[SeatInterval]]: The seat availability, and the
+                reserved intervals of the seats and their neighbours within the open windows.
+        """
+        seats_by_id, free_windows, reserved = self._seat_free_windows(
+            seats, bounds, neighbours
+        )
+
+        # Sort by nearest available ASC, duration DESC, reservable (False before True), with entropy
+        # The rationale for entropy is when XL is wide open for walkins, within the given seat search
+        # we'd like to mix up the order in which seats are assigned rather than always giving away
+        # the same sequence of seats (and causing more consisten wear and tear to it).
+        ordered_seat_ids = sorted(
+            free_windows.keys(),
+            key=lambda seat_id: (
+                free_windows[seat_id][0][0],
+                -(free_windows[seat_id][0][1] - free_windows[seat_id][0][0]),
+                seats_by_id[seat_id].reservable,
+                random(),
+            ),
+        )
+
+        return [
+            SeatAvailability(
+                availability=[
+                    TimeRange(start=start, end=end)
+                    for start, end in free_windows[seat_id]
+                ],
+                **seats_by_id[seat_id].model_dump(),
+            )
+            for seat_id in ordered_seat_ids
+        ], reserved
+
+    def group_seat_availability(
+        self, seats: Sequence[Seat], bounds: TimeRange, size: int
+    ) -> tuple[list[Seat], TimeRange] | None:
+        """Finds the earliest time a group can sit together, choosing seats near each other.
+
+        Args:
+            seats (Sequence[Seat]): The seats the group may choose from.
+            bounds (TimeRange): The time range of interest.
+            size (int): The number of seats the group needs.
+
+        Returns:
+            tuple[list[Seat], TimeRange] | None: The group's seats and the time range they are
+                all free for, or None if `size` of the seats are never free together.
+        """
+        seats_by_id, free_windows, _ = self._seat_free_windows(seats, bounds)
+        group = group_free_window(
+            free_windows,
+            {seat_id: (seat.x, seat.y) for seat_id, seat in seats_by_id.items()},
+            size,
+            self._policy_svc.minimum_reservation_duration()
+            - MINUMUM_RESERVATION_EPSILON,
+        )
+        if group is None:
+            return None
+        seat_ids, (start, end) = group
+        return [seats_by_id[seat_id] for seat_id in seat_ids], TimeRange(
+            start=start, end=end
+        )
+
+    def _seat_free_windows(
+        self, seats: Sequence[Seat], bounds: TimeRange, neighbours: Sequence[int] = ()
+    ) -> tuple[dict[int, Seat], dict[int, list[Interval]], list[SeatInterval]]:
+        """Computes the free windows of seats within a time range in one availability pass.
+
+        Args:
+            seats (Sequence[Seat]): The seats to check the availability of.
+            bounds (TimeRange): The time range of interest, whose start is moved up to now.
+            neighbours (Sequence[int]): The ids of further seats whose reservations are loaded
+                in the same query, without computing their free windows.
+
+        Returns:
+            tuple[dict[int, Seat], dict[int, list[Interval]], list[SeatInterval]]: The seats by
+                id, the free windows of those with at least a minimum reservation free by seat
+                id, and the reserved intervals of the seats and neighbours.
+        """
         # No seats are available in the past
         now = datetime.now()
         if bounds.end <= now:
-            return []
+            return {}, {}, []
 
         # Ensure the start of the bounds is at least right now
         if bounds.start < now:
             bounds.start = now
 
         # Ensure the bounds is at least as long as a minimum reservation length, with a fudge factor
-        MINUMUM_RESERVATION_EPSILON = timedelta(minutes=1)
         if (
             bounds.duration()
             < self._policy_svc.minimum_reservation_duration()
             - MINUMUM_RESERVATION_EPSILON
         ):
-            return []
+            return {}, {}, []
 
         # Find operating hours schedule during the requested bounds
         open_hours = self._operating_hours_svc.schedule(bounds)
         if len(open_hours) == 0:
-            return []
-
-        # Convert the operating hours during the bounds into an availability list
-        # and constrain the availability list within the bounds.
-        open_availability_list = self._operating_hours_to_bounded_availability_list(
-            open_hours, bounds
-        )
-        if len(open_availability_list.availability) == 0:
-            return []
-
-        # Start from a position where all seats begin with same availability as
-        # open_availability_list. From there, reservations will subtract availability
-        # from the given seat.
-        seat_availability_dict = self._initialize_seat_availability_dict(
-            seats, open_availability_list
+            return {}, {}, []
+
+        # Convert the operating hours during the bounds into open windows constrained
+        # within the bounds.
+        open_windows = self._operating_hours_to_bounded_intervals(open_hours, bounds)
+        if len(open_windows) == 0:
+            return {}, {}, []
+
+        # Get all active reservations during the open windows for the seats and subtract
+        # them from every seat's availability in a single sweep. Seats with availability
+        # below the minimum reservation threshold are dropped.
+        seats_by_id = {seat.id: seat for seat in seats if seat.id is not None}
+        reserved = self._get_seat_reservation_intervals(
+            list(seats_by_id.keys() | set(neighbours)),
+            open_windows[0][0],
+            open_windows[-1][1],
         )
-
-        # Get all active reservations during the availability bounds for the seats.
-        reservation_range = TimeRange(
-            start=open_availability_list.availability[0].start,
-            end=open_availability_list.availability[-1].end,
-        )
-        reservations = self.get_seat_reservations(seats, reservation_range)
-
-        # Subtract all seat reservations from their availability
-        self._remove_reservations_from_availability(
-            seat_availability_dict, reservations
-        )
-
-        # Remove seats with availability below threshold
-        available_seats: list[SeatAvailability] = list(
-            self._prune_seats_below_availability_threshold(
-                list(seat_availability_dict.values()),
-                self._policy_svc.minimum_reservation_duration()
-                - MINUMUM_RESERVATION_EPSILON,
-            )
+        free_windows = seat_free_windows(
+            seats_by_id.keys(),
+            open_windows,
+            reserved,
+            self._policy_svc.minimum_reservation_duration()
+            - MINUMUM_RESERVATION_EPSILON,
         )
-
-        # Sort by nearest available ASC, duration DESC, reservable (False before True), with entropy
-        # The rationale for entropy is when XL is wide open for walkins, within the given seat search
-        # we'd like to mix up the order in which seats are assigned rather than always giving away
-        # the same sequence of seats (and causing more consisten wear and tear to it).
-        available_seats.sort(
-            key=lambda sa: (
-                sa.availability[0].start,
-                -1 * sa.availability[0].duration(),
-                sa.reservable,
-                random(),
-            )
-        )
-
-        return available_seats
+        return seats_by_id, free_windows, reserved
 
     def draft_reservation(
-        self, subject: User, request: ReservationRequest
+        self,
+        subject: User,
+        request: ReservationRequest,
+        near: int | SeatProximity | None = None,
     ) -> Reservation:
         """When a user begins the process of making a reservation, a draft holds its place until confired.
 
-        For launch, reservations are limited to a single user. Reservations must either be made by and for
-        the subject initiating the request, or by an admin with permission to complete the action
-        "coworking.reservation.manage" for resource "user/{user.id}".
+        Reservations must either be made by and for the subject initiating the request, or by an admin
+        with permission to complete the action "coworking.reservation.manage" for resource "user/{user.id}".
+        A seat reservation for several users is drafted for a group of seats, one per user, that are
+        free together and sit near each other.
 
         Args:
             subject (User): The user initiating the draft request.
             request (ReservationRequest): The requested reservation.
+            near (int | SeatProximity | None): For a single user, prefer the seats nearest the seat
+                with this id, or the seats matching this preference, among those available soonest.
 
         Returns:
             Reservation: The DRAFT reservation.
@@ -753,17 +812,9 @@ class ReservationService:
 
         Future work:
             * Think about errors/validations of drafts that can be edited rather than raising exceptions.
-            * Multi-user reservations
-                * Check for equality between users and available seats
-                * Limit users and seats counts to policy
+            * Limit users and seats counts of multi-user reservations to policy
             * Clean-up / Refactor Implementation
         """
-        # For the time being, reservations are limited to one user. As soon as
-        # possible, we'd like to add multi-user reservations so that pairs and teams
-        # can be simplified.
-        if len(request.users) > 1:
-            raise NotImplementedError("Multi-user reservations not yet supproted.")
-
         # Enforce Reservation Draft Permissions
         if subject.id not in [user.id for user in request.users]:
             for user in request.users:
@@ -808,34 +859,28 @@ class ReservationService:
             raise ReservationException(
                 "At least one valid user is required to make a reservation."
             )
+        group_size = len({user.id for user in request.users})
+        if len(user_entities) < group_size:
+            raise ReservationException(
+                "Every user of a group reservation must be a valid user."
+            )
 
-        # Check for overlapping reservations for a single user
-        # if len(user_entities) == 1:
-        conflicts = self._get_active_reservations_for_user(request.users[0], bounds)
-        for conflict in conflicts:
-            if is_walkin and conflict.walkin:
-                raise ReservationException(
-                    "Users may not have concurrent walk-in reservations."
-                )
-
-            nonconflicting = bounds.subtract(conflict)
-            if len(nonconflicting) >= 1:
-                bounds = nonconflicting[0]
-            else:
-                raise ReservationException(
-                    "Users may not have conflicting reservations."
-                )
+        # Check for overlapping reservations of every user
+        for user in request.users:
+            conflicts = self._get_active_reservations_for_user(user, bounds)
+            for conflict in conflicts:
+                if is_walkin and conflict.walkin:
+                    raise ReservationException(
+                        "Users may not have concurrent walk-in reservations."
+                    )
 
-        # Dead code because of the NotImplementedError testing for multiple users at the top
-        # else:
-        #     # Draft of expected functionality (needs testing and sanity checking)
-        #     # Multiple users all need to not have conflicts
-        #     for user in request.users:
-        #         conflicts = self._get_active_reservations_for_user(user, bounds)
-        #         if len(conflicts) > 0:
-        #             raise ReservationException(
-        #                 "Users may not have conflicting reservations."
-        #             )
+                nonconflicting = bounds.subtract(conflict)
+                if len(nonconflicting) >= 1:
+                    bounds = nonconflicting[0]
+                else:
+                    raise ReservationException(
+                        "Users may not have conflicting reservations."
+                    )
 
         # Look at the seats - match bounds of assigned seat's availability
         # TODO: Fetch all seats
@@ -843,24 +888,12 @@ class ReservationService:
             seats: list[Seat] = SeatEntity.get_models_from_identities(
                 self._session, request.seats
             )
-            seat_availability = self.seat_availability(seats, bounds)
-
-            if not is_walkin:
-                seat_availability = [
-                    seat for seat in seat_availability if seat.reservable
-                ]
-
-            if len(seat_availability) == 0:
-                raise ReservationException(
-                    "The requested seat(s) are no longer available."
+            if group_size > 1:
+                seat_entities, bounds = self._draft_group_seats(
+                    seats, bounds, group_size, is_walkin
                 )
-
-            # TODO (limit to # of users on request if multiple users)
-            # Here we constrain the reservation start/end to that of the best available seat requested.
-            # This matters as walk-in availability becomes scarce (may start in the near future even though request
-            # start is for right now), alternatively may end early due to reserved seat on backend.
-            seat_entities = [self._session.get(SeatEntity, seat_availability[0].id)]
-            bounds = seat_availability[0].availability[0]
+            else:
+                seat_entities, bounds = self._draft_seat(seats, bounds, is_walkin, near)
         else:
             seat_entities = []
 
@@ -880,6 +913,158 @@ class ReservationService:
         self._session.commit()
         return draft.to_model()
 
+    def _draft_seat(
+        self,
+        seats: Sequence[Seat],
+        bounds: TimeRange,
+        is_walkin: bool,
+        near: int | SeatProximity | None = None,
+    ) -> tuple[list[SeatEntity], TimeRange]:
+        """Chooses the best available of the requested seats for a single user.
+
+        Args:
+            seats (Sequence[Seat]): The requested seats.
+            bounds (TimeRange): The requested time range.
+            is_walkin (bool): Whether the reservation is a walk-in, which may use unreservable seats.
+            near (int | SeatProximity | None): The seat id or preference to choose a seat near.
+
+        Returns:
+            tuple[list[SeatEntity], TimeRange]: The chosen seat and the time range it is available for.
+
+        Raises:
+            ReservationException: If none of the seats are available.
+        """
+        # Proximity away from others depends on the reservations of every seat in the space,
+        # not only those requested, so they are loaded alongside the requested seats'.
+        neighbours = (
+            [seat.id for seat in self._seat_svc.index().seats if seat.id is not None]
+            if near == SeatProximity.APART
+            else []
+        )
+        seat_availability, reserved = self._seat_availability(seats, bounds, neighbours)
+
+        if not is_walkin:
+            seat_availability = [seat for seat in seat_availability if seat.reservable]
+
+        if len(seat_availability) == 0:
+            raise ReservationException("The requested seat(s) are no longer available.")
+
+        if near is not None:
+            seat_availability = self._order_by_proximity(
+                seat_availability, reserved, near
+            )
+
+        # Here we constrain the reservation start/end to that of the best available seat requested.
+        # This matters as walk-in availability becomes scarce (may start in the near future even though request
+        # start is for right now), alternatively may end early due to reserved seat on backend.
+        return [
+            self._session.get(SeatEntity, seat_availability[0].id)
+        ], seat_availability[0].availability[0]
+
+    def _order_by_proximity(
+        self,
+        seat_availability: Sequence[SeatAvailability],
+        reserved: Sequence[SeatInterval],
+        near: int | SeatProximity,
+    ) -> list[SeatAvailability]:
+        """Orders the seats available soonest by how well they match a proximity preference.
+
+        Seats available later are left in place after them, as are ties in proximity.
+
+        Args:
+            seat_availability (Sequence[SeatAvailability]): The available seats, as ordered by
+                `seat_availability`.
+            reserved (Sequence[SeatInterval]): The reserved intervals of the seats in the space.
+                A seat is occupied while one of them overlaps the window it would be drafted for.
+            near (int | SeatProximity): The id of a seat to sit near, or a proximity preference.
+
+        Returns:
+            list[SeatAvailability]: The available seats in order of preference.
+        """
+        index = self._seat_svc.index()
+        soonest_start = seat_availability[0].availability[0].start
+        soonest = [
+            seat
+            for seat in seat_availability
+            if seat.availability[0].start == soonest_start
+        ]
+        later = seat_availability[len(soonest) :]
+
+        if near == SeatProximity.MONITOR:
+
+            def distance(seat: Seat) -> float:
+                nearest = index.nearest(seat.x, seat.y, lambda other: other.has_monitor)
+                return nearest[1] if nearest else 0.0
+
+        elif near == SeatProximity.APART:
+            reserved_by_seat: dict[int | None, list[Interval]] = defaultdict(list)
+            for seat_id, start, end in reserved:
+                reserved_by_seat[seat_id].append((start, end))
+
+            def distance(seat: SeatAvailability) -> float:
+                window = seat.availability[0]
+
+                def occupied(other: Seat) -> bool:
+                    return any(
+                        start < window.end and end > window.start
+                        for start, end in reserved_by_seat.get(other.id, ())
+                    )
+
+                nearest = index.nearest(seat.x, seat.y, occupied)
+                return -nearest[1] if nearest else 0.0
+
+        else:
+            target = index.get(near)
+            if target is None:
+                return list(seat_availability)
+
+            def distance(seat: Seat) -> float:
+                return hypot(seat.x - target.x, seat.y - target.y)
+
+        return sorted(soonest, key=distance) + list(later)
+
+    def _draft_group_seats(
+        self, seats: Sequence[Seat], bounds: TimeRange, size: int, is_walkin: bool
+    ) -> tuple[list[SeatEntity], TimeRange]:
+        """Chooses a group of the requested seats, one per user, that are free together.
+
+        Args:
+            seats (Sequence[Seat]): The requested seats.
+            bounds (TimeRange): The requested time range.
+            size (int): The number of users in the group.
+            is_walkin (bool): Whether the reservation is a walk-in, which may use unreservable seats.
+
+        Returns:
+            tuple[list[SeatEntity], TimeRange]: The chosen seats and the time range they are all
+                available for.
+
+        Raises:
+            ReservationException: If fewer than `size` of the seats are free together.
+        """
+        if not is_walkin:
+            seats = [seat for seat in seats if seat.reservable]
+
+        if len(seats) < size:
+            raise ReservationException(
+                "A group reservation requires a seat for every user."
+            )
+
+        group = self.group_seat_availability(seats, bounds, size)
+        if group is None:
+            raise ReservationException(
+                "The requested seat(s) are no longer available for the whole group."
+            )
+
+        # As with a single seat, the group's start/end is constrained to the window all of its
+        # seats are free for.
+        group_seats, bounds = group
+        seat_entities = (
+            self._session.query(SeatEntity)
+            .filter(SeatEntity.id.in_([seat.id for seat in group_seats]))
+            .all()
+        )
+        return seat_entities, bounds
+
     def change_reservation(
         self, subject: User, delta: ReservationPartial
     ) -> Reservation:
@@ -897,26 +1082,13 @@ class ReservationService:
         Raises:
             ResourceNotFoundException when the requested ID is not found
             UserPermissionException when user does not have permission to modify the reservation
+            ReservationException when a requested later end is beyond what the reservation can be extended until
             NotImplementedError when requested changes are not yet implemented as features
 
         Future work:
-            Implement the ability to change seats, party, and start/end time within policy restrictions
+            Implement the ability to change seats, party, and start time within policy restrictions
         """
-        entity = self._session.get(ReservationEntity, delta.id)
-        if entity is None:
-            raise ResourceNotFoundException(
-                f"Reservation(id={delta.id}) does not exist"
-            )
-
-        # Either the current user is party to the reservation or an admin has
-        # permission to manage reservations for all users.
-        current = entity.to_model()
-        user_ids = set((user.id for user in current.users))
-        if subject.id not in user_ids:
-            for user_id in user_ids:
-                self._permission_svc.enforce(
-                    subject, "coworking.reservation.manage", f"user/{user_id}"
-                )
+        entity = self._get_reservation_entity_to_change(subject, delta.id)
 
         # Handle Requested State Changes
         dirty = False
@@ -933,16 +1105,246 @@ class ReservationService:
         if delta.users is not None:
             raise NotImplementedError("Changing party not yet supported.")
 
-        # Handle Requested Time Changes (TODO)
-        if delta.start is not None or delta.end is not None or delta.seats is not None:
-            # TODO: Assure these requested changes are valid within policies
-            raise NotImplementedError("Changing start/end not yet supported")
+        # Handle Requested Time Changes
+        if delta.start is not None and delta.start != entity.start:
+            raise NotImplementedError("Changing start not yet supported")
+
+        if delta.end is not None and delta.end != entity.end:
+            if delta.end < entity.end:
+                raise NotImplementedError("Shortening reservations not yet supported")
+            self._extend(subject, entity, delta.end)
+            dirty = True
 
         if dirty:  # and valid():
             self._session.commit()
 
         return entity.to_model()
 
+    def _get_reservation_entity_to_change(
+        self, subject: User, id: int
+    ) -> ReservationEntity:
+        """Fetches a reservation the subject is party to or has permission to manage.
+
+        Args:
+            subject (User): The user changing the reservation.
+            id (int): The ID of the reservation.
+
+        Returns:
+            ReservationEntity: The reservation.
+
+        Raises:
+            ResourceNotFoundException when the requested ID is not found
+            UserPermissionException when user does not have permission to modify the reservation
+        """
+        entity = self._session.get(ReservationEntity, id)
+        if entity is None:
+            raise ResourceNotFoundException(f"Reservation(id={id}) does not exist")
+
+        # Either the current user is party to the reservation or an admin has
+        # permission to manage reservations for all users.
+        user_ids = set((user.id for user in entity.users))
+        if subject.id not in user_ids:
+            for user_id in user_ids:
+                self._permission_svc.enforce(
+                    subject, "coworking.reservation.manage", f"user/{user_id}"
+                )
+        return entity
+
+    def get_reservation_extension(self, subject: User, id: int) -> ReservationDetails:
+        """Returns a reservation along with whether, from when, and until when it can be extended.
+
+        Args:
+            subject (User): The user extending the reservation.
+            id (int): The ID of the reservation.
+
+        Returns:
+            ReservationDetails: The reservation and its extension details. When it cannot be
+                extended, `errors` explains why.
+
+        Raises:
+            ResourceNotFoundException when the requested ID is not found
+            UserPermissionException when user does not have permission to modify the reservation
+        """
+        entity = self._get_reservation_entity_to_change(subject, id)
+        return self._extension_details(subject, entity)
+
+    def extend_reservation(self, subject: User, id: int) -> Reservation:
+        """Extends a reservation for as long as policy and the following reservations allow.
+
+        Args:
+            subject (User): The user extending the reservation.
+            id (int): The ID of the reservation.
+
+        Returns:
+            Reservation: The extended reservation.
+
+        Raises:
+            ResourceNotFoundException when the requested ID is not found
+            UserPermissionException when user does not have permission to modify the reservation
+            ReservationException when the reservation cannot be extended
+        """
+        entity = self._get_reservation_entity_to_change(subject, id)
+        details = self._extension_details(subject, entity)
+        if not details.extendable or details.extendable_until is None:
+            raise ReservationException(details.errors[0])
+        entity.end = details.extendable_until
+        self._session.commit()
+        return entity.to_model()
+
+    def _extend(self, subject: User, entity: ReservationEntity, end: datetime) -> None:
+        """Moves the end of a reservation later, if it can be extended until then."""
+        details = self._extension_details(subject, entity)
+        if not details.extendable:
+            raise ReservationException(details.errors[0])
+        if details.extendable_until is None or end > details.extendable_until:
+            raise ReservationException(
+                f"The reservation can only be extended until {details.extendable_until}."
+            )
+        entity.end = end
+
+    def _extension_details(
+        self, subject: User, entity: ReservationEntity
+    ) -> ReservationDetails:
+        """Computes whether, from when, and until when a reservation can be extended.
+
+        A reservation can be extended within the policy's extend window before its end. It may
+        be extended by up to the policy's extend duration, until the next reservation of any
+        of its seats, room, or users begins and, for seats, until the XL closes. Only one query
+        is made for the next reservation; seat availability is not recomputed.
+
+        Args:
+            subject (User): The user extending the reservation.
+            entity (ReservationEntity): The reservation.
+
+        Returns:
+            ReservationDetails: The reservation and its extension details.
+        """
+        now = datetime.now()
+        extendable_at = entity.end - self._policy_svc.extend_window(subject)
+        extendable_until = None
+        errors = []
+        if (
+            entity.state
+            not in (ReservationState.CONFIRMED, ReservationState.CHECKED_IN)
+            or entity.end <= now
+        ):
+            errors.append("Only upcoming and active reservations can be extended.")
+        elif now < extendable_at:
+            errors.append(
+                f"The reservation can be extended starting at {extendable_at}."
+            )
+        else:
+            extendable_until = self._extendable_until(subject, entity)
+            if (
+                extendable_until - entity.end
+                < self._policy_svc.minimum_reservation_duration()
+            ):
+                errors.append(
+                    "The reservation cannot be extended because the seat, room, or party "
+                    "is reserved or the XL closes soon after it ends."
+                )
+
+        return ReservationDetails(
+            **entity.to_model().model_dump(),
+            errors=errors,
+            extendable=len(errors) == 0,
+            extendable_at=extendable_at,
+            extendable_until=extendable_until,
+        )
+
+    def _extendable_until(self, subject: User, entity: ReservationEntity) -> datetime:
+        """The latest time a reservation could be extended until, ignoring when it is extended."""
+        until = entity.end + self._policy_svc.extend_duration(subject)
+
+        next_start = self._next_reservation_start(entity, until)
+        if next_start is not None:
+            until = min(until, next_start)
+
+        # Seats can only be reserved while the XL is open. Operating hours are a cached
+        # snapshot, so this does not query the database.
+        if entity.room_id is None and until > entity.end:
+            open_hours = self._operating_hours_svc.schedule(
+                TimeRange(start=entity.end, end=until)
+            )
+            closes = next(
+                (
+                    hours.end
+                    for hours in open_hours
+                    if hours.start <= entity.end < hours.end
+                ),
+                entity.end,
+            )
+            until = min(until, closes)
+
+        # Study room reservations are limited to a number of hours per week.
+        if entity.room_id is not None and until > entity.end:
+            for user in entity.users:
+                if not self._check_user_reservation_duration(
+                    user.to_model(), TimeRange(start=entity.end, end=until)
+                ):
+                    until = entity.end
+                    break
+
+        return until
+
+    def _next_reservation_start(
+        self, entity: ReservationEntity, before: datetime
+    ) -> datetime | None:
+        """Finds when the next reservation of a reservation's seats, room, or users begins.
+
+        This is a single `ORDER BY start LIMIT 1` query, bounded by the end of the reservation
+        and `before`, which scans only the few reservations starting in between using the
+        index on the start of reservations.
+
+        Args:
+            entity (ReservationEntity): The reservation being extended.
+            before (datetime): Reservations starting at or after this time are ignored.
+
+        Returns:
+            datetime | None: The start of the next reservation, or None if there is none.
+        """
+        # Drafts that expired, and confirmed reservations whose check-in window passed, since
+        # the last sweep no longer hold their seats.
+        now = datetime.now()
+        draft_cutoff = now - self._policy_svc.reservation_draft_timeout()
+        checkin_cutoff = now - self._policy_svc.reservation_checkin_timeout()
+        if entity.room_id is not None:
+            shares_seat_or_room = ReservationEntity.room_id == entity.room_id
+        else:
+            shares_seat_or_room = ReservationEntity.id.in_(
+                select(reservation_seat_table.c.reservation_id).where(
+                    reservation_seat_table.c.seat_id.in_(
+                        [seat.id for seat in entity.seats]
+                    )
+                )
+            )
+        shares_user = ReservationEntity.id.in_(
+            select(reservation_user_table.c.reservation_id).where(
+                reservation_user_table.c.user_id.in_([user.id for user in entity.users])
+            )
+        )
+        query = (
+            select(ReservationEntity.start)
+            .where(
+                ReservationEntity.start >= entity.end,
+                ReservationEntity.start < before,
+                ReservationEntity.id != entity.id,
+                ACTIVE_RESERVATION,
+                or_(
+                    ReservationEntity.state != ReservationState.DRAFT,
+                    ReservationEntity.created_at >= draft_cutoff,
+                ),
+                or_(
+                    ReservationEntity.state != ReservationState.CONFIRMED,
+                    ReservationEntity.start >= checkin_cutoff,
+                ),
+                or_(shares_seat_or_room, shares_user),
+            )
+            .order_by(ReservationEntity.start)
+            .limit(1)
+        )
+        return self._session.scalar(query)
+
     def _change_state(self, entity: ReservationEntity, delta: ReservationState) -> bool:
         RS = ReservationState
 
@@ -1105,47 +1507,13 @@ class ReservationService:
 
     # Private helper methods
 
-    def _operating_hours_to_bounded_availability_list(
+    def _operating_hours_to_bounded_intervals(
         self, operating_hours: Sequence[OperatingHours], bounds: TimeRange
-    ) -> AvailabilityList:
-        availability = AvailabilityList(
-            availability=[
-                TimeRange(start=operating_hour.start, end=operating_hour.end)
-                for operating_hour in operating_hours
-            ]
-        )
-        availability.constrain(bounds)
-        return availability
-
-    def _initialize_seat_availability_dict(
-        self, seats: Sequence[Seat], availability: AvailabilityList
-    ) -> dict[int, SeatAvailability]:
-        return {
-            seat.id: SeatAvailability(
-                availability=availability.model_copy(deep=True).availability,
-                **seat.model_dump(),
-            )
-            for seat in seats
-            if seat.id is not None
-        }
-
-    def _remove_reservations_from_availability(
-        self,
-        seat_availability_dict: dict[int, SeatAvailability],
-        reservations: Sequence[Reservation],
-    ):
-        for reservation in reservations:
-            if len(reservation.seats) > 0:
-                for seat in reservation.seats:
-                    if seat.id in seat_availability_dict:
-                        seat_availability_dict[seat.id].subtract(reservation)
-
-    def _prune_seats_below_availability_threshold(
-        self, seats: Sequence[SeatAvailability], threshold: timedelta
-    ) -> Sequence[SeatAvailability]:
-        available_seats: list[SeatAvailability] = []
-        for seat in seats:
-            seat.filter_time_ranges_below(threshold)
-            if len(seat.availability) > 0:
-                available_seats.append(seat)
-        return available_seats
+    ) -> list[Interval]:
+        intervals: list[Interval] = []
+        for operating_hour in operating_hours:
+            start = max(operating_hour.start, bounds.start)
+            end = min(operating_hour.end, bounds.end)
+            if start < end:
+                intervals.append((start, end))
+        return intervals
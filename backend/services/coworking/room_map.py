@@ -0,0 +1,82 @@
+"""Rooms by half-hour time slots matrix backing the room reservation map."""
+
+from typing import Iterable, Sequence
+from ...models.coworking import RoomState
+
+__authors__ = ["Kris Jordan", "Yuvraj Jain"]
+__copyright__ = "Copyright 2024"
+__license__ = "MIT"
+
+
+# Translation table used to turn AVAILABLE slots into UNAVAILABLE slots while leaving
+# every other state untouched.
+_AVAILABLE_TO_UNAVAILABLE = bytes(
+    (
+        RoomState.UNAVAILABLE.value if value == RoomState.AVAILABLE.value else value
+        for value in range(256)
+    )
+)
+
+
+class RoomSlotMatrix:
+    """A rooms x time slots matrix of `RoomState` values.
+
+    Each room is a compact `bytearray` row so that reservation, masking, and office hours
+    rules are applied as slice operations over a run of slots rather than slot by slot.
+    """
+
+    def __init__(self, room_ids: Sequence[str], number_of_slots: int):
+        """Initializes a matrix with every slot of every room AVAILABLE.
+
+        Args:
+            room_ids (Sequence[str]): The ids of the rooms, one row per room.
+            number_of_slots (int): The number of half-hour time slots in the day.
+        """
+        self._number_of_slots = max(number_of_slots, 0)
+        self._rows: dict[str, bytearray] = {
+            room_id: bytearray(self._number_of_slots) for room_id in room_ids
+        }
+
+    def __contains__(self, room_id: str) -> bool:
+        return room_id in self._rows
+
+    def fill(self, room_id: str, start_idx: int, end_idx: int, state: RoomState):
+        """Set a run of slots for a room to the given state.
+
+        Indices are clamped to the bounds of the day.
+
+        Args:
+            room_id (str): The room whose slots are set.
+            start_idx (int): Index of the first slot (inclusive).
+            end_idx (int): Index of the last slot (exclusive).
+            state (RoomState): The state to assign.
+        """
+        start_idx = max(start_idx, 0)
+        end_idx = min(end_idx, self._number_of_slots)
+        if start_idx < end_idx:
+            row = self._rows[room_id]
+            row[start_idx:end_idx] = bytes((state.value,)) * (end_idx - start_idx)
+
+    def mask_available(self, spans: Iterable[tuple[int, int]]):
+        """Mark AVAILABLE slots UNAVAILABLE in every room for the given column spans.
+
+        Args:
+            spans (Iterable[tuple[int, int]]): `(start_idx, end_idx)` column spans to mask.
+        """
+        for start_idx, end_idx in spans:
+            start_idx = max(start_idx, 0)
+            end_idx = min(end_idx, self._number_of_slots)
+            if start_idx >= end_idx:
+                continue
+            for row in self._rows.values():
+                row[start_idx:end_idx] = row[start_idx:end_idx].translate(
+                    _AVAILABLE_TO_UNAVAILABLE
+                )
+
+    def remove(self, room_id: str) -> None:
+        """Drop a room's row from the matrix if present."""
+        self._rows.pop(room_id, None)
+
+    def to_dict(self) -> dict[str, list[int]]:
+        """Convert the matrix into the `reserved_date_map` shape of `ReservationMapDetails`."""
+        return {room_id: list(row) for room_id, row in self._rows.items()}
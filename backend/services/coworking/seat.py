@@ -1,10 +1,13 @@
 """Service that manages seats in the coworking space."""
 
+from typing import Sequence
 from fastapi import Depends
 from sqlalchemy.orm import Session
 from ...database import db_session
 from ...models.coworking import Seat, SeatDetails
 from ...entities.coworking import SeatEntity
+from . import coworking_cache
+from .seat_index import SeatIndex
 
 __authors__ = ["Kris Jordan"]
 __copyright__ = "Copyright 2023"
@@ -22,11 +25,31 @@ class SeatService:
         """
         self._session = session
 
-    def list(self) -> list[SeatDetails]:
+    def list(self) -> Sequence[SeatDetails]:
         """Returns all seats in the coworking space.
 
+        The seats are a snapshot shared across requests and must not be modified.
+
+        Returns:
+            Sequence[SeatDetails]: All seats in the coworking space.
+        """
+        return coworking_cache.snapshot(coworking_cache.seats, self._load)
+
+    def index(self) -> SeatIndex:
+        """Returns a spatial index over all seats in the coworking space.
+
+        The index is shared across requests and rebuilt whenever the seat snapshot is.
+
         Returns:
-            list[SeatDetails]: All rooms in the coworking space orderd by increasing capacity.
+            SeatIndex: The index of the seats returned by `list`.
         """
+        seats = self.list()
+        index = coworking_cache.seat_index.get(None)
+        if index is None or index.seats is not seats:
+            index = SeatIndex(seats)
+            coworking_cache.seat_index.set(None, index)
+        return index
+
+    def _load(self) -> Sequence[SeatDetails]:
         entities = self._session.query(SeatEntity).all()
         return [entity.to_model() for entity in entities]
@@ -0,0 +1,99 @@
+"""Grid index over the positions of seats in the coworking space.
+
+Seats are bucketed into square cells of a uniform grid by their `x`/`y` coordinates. A nearest
+seat query visits the cells in rings of growing distance around the query point and stops once
+no unvisited cell can hold a seat closer than the nearest found, so queries about a crowded
+floor only look at the few cells around the point of interest.
+
+The index is built from the seat snapshot of `coworking_cache` and rebuilt whenever that
+snapshot is replaced (see `SeatService.index`).
+"""
+
+from collections import defaultdict
+from math import floor, hypot
+from typing import Callable, Sequence
+
+from ...models.coworking import Seat
+
+__authors__ = ["Kris Jordan"]
+__copyright__ = "Copyright 2023"
+__license__ = "MIT"
+
+
+Cell = tuple[int, int]
+
+
+class SeatIndex:
+    """Index of seats by position supporting nearest seat queries."""
+
+    def __init__(self, seats: Sequence[Seat], cell_size: int = 4):
+        """Builds the index.
+
+        Args:
+            seats (Sequence[Seat]): The seats to index, kept as given.
+            cell_size (int): The width and height of a grid cell, in seat coordinates.
+        """
+        self.seats = seats
+        self._cell_size = cell_size
+        self._by_id = {seat.id: seat for seat in seats}
+        self._cells: dict[Cell, list[Seat]] = defaultdict(list)
+        for seat in seats:
+            self._cells[self._cell(seat.x, seat.y)].append(seat)
+        columns = [column for column, _ in self._cells] or [0]
+        rows = [row for _, row in self._cells] or [0]
+        self._bounds = (min(columns), max(columns), min(rows), max(rows))
+
+    def get(self, seat_id: int) -> Seat | None:
+        """Returns the seat with the given id, or None if it is not indexed."""
+        return self._by_id.get(seat_id)
+
+    def nearest(
+        self, x: float, y: float, where: Callable[[Seat], bool] = lambda _: True
+    ) -> tuple[Seat, float] | None:
+        """Finds the seat nearest a point among the seats matching a condition.
+
+        Args:
+            x (float): The x coordinate of the point.
+            y (float): The y coordinate of the point.
+            where (Callable[[Seat], bool]): Seats for which this is False are skipped.
+
+        Returns:
+            tuple[Seat, float] | None: The nearest matching seat and its distance from the
+                point, or None if no seat matches.
+        """
+        if not self._cells:
+            return None
+        column, row = self._cell(x, y)
+        min_column, max_column, min_row, max_row = self._bounds
+        # Rings beyond the farthest corner of the grid hold no seats.
+        reach = max(
+            column - min_column, max_column - column, row - min_row, max_row - row
+        )
+        best: tuple[Seat, float] | None = None
+        for ring in range(reach + 1):
+            for cell in self._ring(column, row, ring):
+                for seat in self._cells.get(cell, ()):
+                    distance = hypot(seat.x - x, seat.y - y)
+                    if (best is None or distance < best[1]) and where(seat):
+                        best = (seat, distance)
+            # Seats in later rings are at least `ring` cells away along one axis.
+            if best is not None and best[1] <= ring * self._cell_size:
+                break
+        return best
+
+    def _cell(self, x: float, y: float) -> Cell:
+        return floor(x / self._cell_size), floor(y / self._cell_size)
+
+    @staticmethod
+    def _ring(column: int, row: int, ring: int) -> list[Cell]:
+        """The cells exactly `ring` cells away from a cell, in Chebyshev distance."""
+        if ring == 0:
+            return [(column, row)]
+        cells = []
+        for offset in range(-ring, ring + 1):
+            cells.append((column + offset, row - ring))
+            cells.append((column + offset, row + ring))
+        for offset in range(-ring + 1, ring):
+            cells.append((column - ring, row + offset))
+            cells.append((column + ring, row + offset))
+        return cells
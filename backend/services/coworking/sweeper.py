@@ -0,0 +1,182 @@
+"""Background sweeper applying time-based reservation state transitions in bulk.
+
+Three reservation state transitions are driven by the passage of time:
+
+1. Draft -> Cancelled following PolicyService#reservation_draft_timeout() after the
+   reservation's created at.
+2. Confirmed -> Cancelled following PolicyService#reservation_checkin_timeout() after the
+   reservation's start, when the reserver never checked in.
+3. Checked In -> Checked Out following the reservation's end.
+
+Rather than applying these transitions while reading reservations, which turns GET requests
+into write transactions contending on the same rows, the sweeper applies each with a single
+set-based UPDATE on a fixed interval. Read paths exclude reservations that have expired
+since the last sweep without modifying them.
+
+The sweeper runs as a background task for the lifetime of the application. When several
+application workers are running, each sweeps; the UPDATEs are idempotent, so this is safe.
+The interval, in seconds, is set by the optional RESERVATION_SWEEP_INTERVAL environment
+variable (default 60, 0 disables the sweeper).
+"""
+
+import asyncio
+import logging
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta
+from threading import Lock
+from time import perf_counter
+from typing import AsyncIterator
+from sqlalchemy import ColumnElement, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from ...database import async_engine
+from ...entities.coworking import ReservationEntity
+from ...env import getenv
+from ...models.coworking import (
+    ReservationState,
+    ReservationSweep,
+    ReservationSweepStatistics,
+)
+from .policy import PolicyService
+
+__authors__ = ["Kris Jordan"]
+__copyright__ = "Copyright 2023"
+__license__ = "MIT"
+
+logger = logging.getLogger(__name__)
+
+
+class ReservationSweeper:
+    """Periodically transitions expired reservations and records statistics per tick."""
+
+    def __init__(self, policy_svc: PolicyService, interval: timedelta):
+        """Initializes a sweeper.
+
+        Args:
+            policy_svc (PolicyService): Source of the draft and check-in timeouts.
+            interval (timedelta): Time between sweeps; a non-positive interval disables running.
+        """
+        self._policy_svc = policy_svc
+        self._interval = interval
+        self._lock = Lock()
+        self._statistics = ReservationSweepStatistics(
+            interval_seconds=interval.total_seconds()
+        )
+
+    def sweep(self, session: Session, cutoff: datetime) -> ReservationSweep:
+        """Transition every reservation that expired as of the cutoff and commit.
+
+        Args:
+            session (Session): The database session to sweep with.
+            cutoff (datetime): The time expiration is checked against, the current time in production.
+
+        Returns:
+            ReservationSweep: The number of reservations transitioned, by transition."""
+        sweep = ReservationSweep(
+            expired_drafts=self._transition(
+                session,
+                ReservationState.DRAFT,
+                ReservationEntity.created_at
+                < cutoff - self._policy_svc.reservation_draft_timeout(),
+                ReservationState.CANCELLED,
+            ),
+            no_shows=self._transition(
+                session,
+                ReservationState.CONFIRMED,
+                ReservationEntity.start
+                < cutoff - self._policy_svc.reservation_checkin_timeout(),
+                ReservationState.CANCELLED,
+            ),
+            checked_out=self._transition(
+                session,
+                ReservationState.CHECKED_IN,
+                ReservationEntity.end <= cutoff,
+                ReservationState.CHECKED_OUT,
+            ),
+        )
+        session.commit()
+        return sweep
+
+    def _transition(
+        self,
+        session: Session,
+        from_state: ReservationState,
+        expired: ColumnElement[bool],
+        to_state: ReservationState,
+    ) -> int:
+        """Set-based UPDATE of expired reservations in one state to another state."""
+        result = session.execute(
+            update(ReservationEntity)
+            .where(ReservationEntity.state == from_state, expired)
+            .values(state=to_state)
+            .execution_options(synchronize_session=False)
+        )
+        return result.rowcount
+
+    def tick(self, session: Session) -> ReservationSweep:
+        """Sweep as of now and record the tick's statistics.
+
+        Args:
+            session (Session): The database session to sweep with.
+
+        Returns:
+            ReservationSweep: The number of reservations transitioned, by transition."""
+        started = perf_counter()
+        swept_at = datetime.now()
+        sweep = self.sweep(session, swept_at)
+        elapsed_ms = (perf_counter() - started) * 1000.0
+        with self._lock:
+            statistics = self._statistics
+            statistics.ticks += 1
+            statistics.last_swept_at = swept_at
+            statistics.last_duration_ms = elapsed_ms
+            statistics.last_sweep = sweep
+            statistics.totals = ReservationSweep(
+                expired_drafts=statistics.totals.expired_drafts + sweep.expired_drafts,
+                no_shows=statistics.totals.no_shows + sweep.no_shows,
+                checked_out=statistics.totals.checked_out + sweep.checked_out,
+            )
+        return sweep
+
+    def statistics(self) -> ReservationSweepStatistics:
+        """A snapshot of the sweeper's statistics since the process started."""
+        with self._lock:
+            return self._statistics.model_copy()
+
+    async def run(self) -> None:
+        """Sweep on the configured interval until cancelled.
+
+        A failed tick is logged, counted and retried at the next interval."""
+        while True:
+            try:
+                async with AsyncSession(async_engine) as session:
+                    await session.run_sync(self.tick)
+            except Exception:
+                logger.exception("Reservation sweep failed")
+                with self._lock:
+                    self._statistics.failures += 1
+            await asyncio.sleep(self._interval.total_seconds())
+
+    @asynccontextmanager
+    async def running(self) -> AsyncIterator[None]:
+        """Run the sweeper in the background for the duration of the context."""
+        if self._interval <= timedelta(0):
+            yield
+            return
+        task = asyncio.create_task(self.run())
+        try:
+            yield
+        finally:
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                ...
+
+
+reservation_sweeper = ReservationSweeper(
+    PolicyService(),
+    timedelta(seconds=float(getenv("RESERVATION_SWEEP_INTERVAL", "60"))),
+)
+"""Process-wide sweeper run for the lifetime of the application."""
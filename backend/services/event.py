@@ -5,8 +5,9 @@ The Event Service allows the API to manipulate event data in the database.
 from typing import Sequence
 
 from fastapi import Depends
-from sqlalchemy import func, select, and_, func, or_, exists, or_
-from sqlalchemy.orm import Session, aliased
+from sqlalchemy import func, select, and_, or_, exists, false, literal
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session, aliased, joinedload
 from backend.entities.user_entity import UserEntity
 from backend.models.event_registration import EventRegistration
 from ..models.public_user import PublicUser
@@ -25,6 +26,8 @@ from ..entities import (
 )
 from ..entities import EventEntity, OrganizationEntity
 from .permission import PermissionService
+from .pagination import paginate
+from .search import to_search_query, matches, rank
 from .exceptions import (
     ResourceNotFoundException,
     EventRegistrationException,
@@ -42,6 +45,9 @@ __authors__ = [
 __copyright__ = "Copyright 2023"
 __license__ = "MIT"
 
+# Columns matched by a search of only stop words, which its search query cannot match
+_SEARCH_FALLBACK_COLUMNS = (EventEntity.name, EventEntity.description)
+
 
 class EventService:
     """Service that performs all of the actions on the `Event` table"""
@@ -72,7 +78,6 @@ class EventService:
         """
 
         statement = select(EventEntity)
-        length_statement = select(func.count()).select_from(EventEntity)
         if pagination_params.range_start != "":
             range_start = pagination_params.range_start
             range_end = pagination_params.range_end
@@ -82,45 +87,31 @@ class EventService:
                 EventEntity.time <= datetime.strptime(range_end, "%d/%m/%Y, %H:%M:%S"),
             )
             statement = statement.where(criteria)
-            length_statement = length_statement.where(criteria)
-
-        if pagination_params.filter != "":
-            query = pagination_params.filter
-
-            criteria = or_(
-                EventEntity.name.ilike(f"%{query}%"),
-                EventEntity.description.ilike(f"%{query}%"),
-                exists().where(
-                    OrganizationEntity.id == EventEntity.organization_id,
-                    OrganizationEntity.name.ilike(f"%{query}%"),
-                ),
-                exists().where(
-                    OrganizationEntity.id == EventEntity.organization_id,
-                    OrganizationEntity.slug.ilike(f"%{query}%"),
-                ),
-            )
-            statement = statement.where(criteria)
-            length_statement = length_statement.where(criteria)
-
-        offset = pagination_params.page * pagination_params.page_size
-        limit = pagination_params.page_size
 
-        if pagination_params.order_by != "":
-            statement = statement.order_by(
-                    getattr(EventEntity, pagination_params.order_by)
-                ) if pagination_params.ascending else statement.order_by(
-                    getattr(EventEntity, pagination_params.order_by).desc()
+        search_query = to_search_query(pagination_params.filter)
+        if search_query is not None:
+            statement = statement.where(
+                matches(
+                    EventEntity.search_vector,
+                    search_query,
+                    pagination_params.filter,
+                    _SEARCH_FALLBACK_COLUMNS,
                 )
+            )
 
-        statement = statement.offset(offset).limit(limit)
-
-        length = self._session.execute(length_statement).scalar()
-        entities = self._session.execute(statement).scalars()
+        entities, length, next_cursor = paginate(
+            self._session,
+            statement.options(joinedload(EventEntity.organization)),
+            pagination_params,
+            EventEntity.id,
+            ascending=pagination_params.ascending != "false",
+        )
 
         return Paginated(
-            items=[entity.to_details_model(subject) for entity in entities],
+            items=self._to_details_models(entities, subject),
             length=length,
             params=pagination_params,
+            next_cursor=next_cursor,
         )
 
     def all(
@@ -137,12 +128,51 @@ class EventService:
             list[EventDetails]: List of all `EventDetails`
         """
         # Select all entries in `Event` table
-        event_entities = (self._session.query(EventEntity)).all()
+        event_entities = (
+            self._session.query(EventEntity)
+            .options(joinedload(EventEntity.organization))
+            .all()
+        )
 
         # Convert entities to details models and return
-        return [
-            event_entity.to_details_model(subject) for event_entity in event_entities
-        ]
+        return self._to_details_models(event_entities, subject)
+
+    def search(
+        self, query: str, subject: User | None = None, limit: int = 10
+    ) -> list[EventDetails]:
+        """
+        Search events by their name and description, and their organization's name and slug
+
+        Args:
+            query: The search string
+            subject: The User making the request.
+            limit: The maximum number of events to return
+
+        Returns:
+            list[EventDetails]: The matching events, most relevant first
+        """
+        search_query = to_search_query(query)
+        if search_query is None:
+            return []
+
+        event_entities = self._session.scalars(
+            select(EventEntity)
+            .where(
+                matches(
+                    EventEntity.search_vector,
+                    search_query,
+                    query,
+                    _SEARCH_FALLBACK_COLUMNS,
+                )
+            )
+            .order_by(
+                rank(EventEntity.search_vector, search_query).desc(), EventEntity.id
+            )
+            .limit(limit)
+            .options(joinedload(EventEntity.organization))
+        ).all()
+
+        return self._to_details_models(event_entities, subject)
 
     def get_events_in_time_range(
         self, time_range: TimeRange, subject: User | None = None
@@ -161,9 +191,11 @@ class EventService:
             self._session.query(EventEntity)
             .where(EventEntity.time >= time_range.start)
             .where(EventEntity.time < time_range.end)
+            .options(joinedload(EventEntity.organization))
+            .all()
         )
 
-        return [entity.to_details_model(subject) for entity in event_entities]
+        return self._to_details_models(event_entities, subject)
 
     def create(self, subject: User, event: DraftEvent) -> EventDetails:
         """
@@ -250,11 +282,78 @@ class EventService:
         events = (
             self._session.query(EventEntity)
             .filter(EventEntity.organization_id == organization.id)
+            .order_by(EventEntity.id)
+            .options(joinedload(EventEntity.organization))
             .all()
         )
 
         # Convert entities to models and return
-        return [event.to_details_model(subject) for event in events]
+        return self._to_details_models(events, subject)
+
+    def _to_details_models(
+        self, events: Sequence[EventEntity], subject: User | None = None
+    ) -> list[EventDetails]:
+        """Convert a list of event entities to details models with a constant number of queries.
+
+        Rather than loading each event's registrations, attendee counts and the subject's
+        attendance are computed with one aggregate query, and organizers are loaded with
+        their users in a second query.
+
+        Args:
+            events: The event entities, with their organizations loaded.
+            subject: The User making the request.
+
+        Returns:
+            list[EventDetails]: The details models, in the order of the entities given.
+        """
+        if len(events) == 0:
+            return []
+        event_ids = [event.id for event in events]
+
+        is_attendee = EventRegistrationEntity.registration_type == (
+            RegistrationType.ATTENDEE
+        )
+        subject_is_attendee = (
+            func.bool_or(
+                and_(is_attendee, EventRegistrationEntity.user_id == subject.id)
+            )
+            if subject is not None
+            else false()
+        )
+        attendance = {
+            event_id: (registration_count, bool(attended))
+            for event_id, registration_count, attended in self._session.execute(
+                select(
+                    EventRegistrationEntity.event_id,
+                    func.count().filter(is_attendee),
+                    subject_is_attendee,
+                )
+                .where(EventRegistrationEntity.event_id.in_(event_ids))
+                .group_by(EventRegistrationEntity.event_id)
+            )
+        }
+
+        organizers: dict[int, list[PublicUser]] = {id: [] for id in event_ids}
+        for registration in self._session.scalars(
+            select(EventRegistrationEntity)
+            .where(
+                EventRegistrationEntity.event_id.in_(event_ids),
+                EventRegistrationEntity.registration_type == RegistrationType.ORGANIZER,
+            )
+            .options(joinedload(EventRegistrationEntity.user))
+            .order_by(EventRegistrationEntity.user_id)
+        ):
+            organizers[registration.event_id].append(registration.to_flat_model())
+
+        details: list[EventDetails] = []
+        for event in events:
+            registration_count, attended = attendance.get(event.id, (0, False))
+            details.append(
+                event.to_summarized_details_model(
+                    organizers[event.id], registration_count, attended, subject
+                )
+            )
+        return details
 
     def update(self, subject: User, event: Event) -> EventDetails:
         """
@@ -496,14 +595,25 @@ class EventService:
                 f"organization/{event.organization.id}",
             )
 
-        # Get the registration status.
-        # NOTE: It is preferred to use the service function rather than the list of
-        # registrations passed in from `event` in the case that registrations are added
-        # between when `event` was fetched and this function runs.
-
-        # Raise exception if event is full.
-        if event.registration_count >= event.registration_limit:
-            raise EventRegistrationException(event.id)
+        # Admit the attendee only while the event has capacity. The check and the insert
+        # happen in the database so that concurrent registrations cannot overfill it. They
+        # run in a savepoint so that a full event only rolls back the attempted admission,
+        # not the rest of the session's transaction.
+        with self._session.begin_nested() as admission:
+            admitted = self._admit_attendee(attendee, event.id)
+            if not admitted:
+                admission.rollback()
+
+        if admitted:
+            self._session.commit()
+            return PublicUser(
+                id=attendee.id,
+                first_name=attendee.first_name,
+                last_name=attendee.last_name,
+                pronouns=attendee.pronouns,
+                email=attendee.email,
+                github_avatar=attendee.github_avatar,
+            )
 
         # Enable idemopotency in returning existing registration, if one exists.
         # Permission to manage / read registration is enforced in EventService#get_registration
@@ -513,17 +623,61 @@ class EventService:
                 existing_registration
             ).to_flat_model()
 
-        # Add new object to table and commit changes
-        event_registration_entity = EventRegistrationEntity(
-            user_id=attendee.id,
-            event_id=event.id,
-            registration_type=RegistrationType.ATTENDEE,
+        # Otherwise, the event is full.
+        raise EventRegistrationException(event.id)
+
+    def _admit_attendee(self, attendee: User, event_id: int | None) -> bool:
+        """
+        Insert an attendee registration if, and only if, the event has capacity remaining.
+
+        The event's row is locked first so that registrations for the same event are
+        serialized. The insert then counts attendees and adds the registration in a single
+        `INSERT ... SELECT ... WHERE count < registration_limit` statement, without loading
+        the existing registrations.
+
+        Args:
+            attendee: The user being registered for the event
+            event_id: ID of the event being registered for
+
+        Returns:
+            bool: True if the registration was inserted, False if the event is full or the
+                attendee was already registered
+        """
+        locked_event = (
+            select(EventEntity.id).where(EventEntity.id == event_id).with_for_update()
         )
-        self._session.add(event_registration_entity)
-        self._session.commit()
+        if self._session.scalar(locked_event) is None:
+            raise ResourceNotFoundException(
+                f"No event found with matching ID: {event_id}"
+            )
 
-        # Return registration
-        return event_registration_entity.to_flat_model()
+        attendee_count = (
+            select(func.count())
+            .select_from(EventRegistrationEntity)
+            .where(
+                EventRegistrationEntity.event_id == event_id,
+                EventRegistrationEntity.registration_type == RegistrationType.ATTENDEE,
+            )
+            .scalar_subquery()
+        )
+        admission = select(
+            literal(attendee.id),
+            EventEntity.id,
+            literal(
+                RegistrationType.ATTENDEE,
+                EventRegistrationEntity.registration_type.type,
+            ),
+        ).where(
+            EventEntity.id == event_id,
+            attendee_count < EventEntity.registration_limit,
+        )
+        insert_registration = (
+            insert(EventRegistrationEntity)
+            .from_select(["user_id", "event_id", "registration_type"], admission)
+            .on_conflict_do_nothing()
+            .returning(EventRegistrationEntity.user_id)
+        )
+        return self._session.scalar(insert_registration) is not None
 
     def unregister(self, subject: User, attendee: User, event: EventDetails) -> None:
         """
@@ -645,19 +799,6 @@ class EventService:
             )
         )
 
-        # Statement to determine number of rows in query result
-        length_statement = (
-            select(func.count())
-            .select_from(UserEntity)
-            .join(
-                EventRegistrationAlias, EventRegistrationAlias.user_id == UserEntity.id
-            )
-            .where(
-                EventRegistrationAlias.event_id == event_id,
-                EventRegistrationAlias.registration_type == RegistrationType.ATTENDEE,
-            )
-        )
-
         # Filter results by query
         if pagination_params.filter != "":
             query = pagination_params.filter
@@ -668,28 +809,16 @@ class EventService:
             )
 
             statement = statement.where(criteria)
-            length_statement = length_statement.where(criteria)
 
-        # Calculate where to begin retrieving rows and how many to retrieve
-        offset = pagination_params.page * pagination_params.page_size
-        limit = pagination_params.page_size
-
-        # Order results by order by attribute
-        if pagination_params.order_by != "":
-            statement = statement.order_by(
-                getattr(UserEntity, pagination_params.order_by)
-            )
-
-        # Retrieve limited items
-        statement = statement.offset(offset).limit(limit)
-
-        # Execute statement and retrieve entities
-        length = self._session.execute(length_statement).scalar()
-        entities = self._session.execute(statement).scalars()
+        # Retrieve the page ordered by the order by attribute
+        entities, length, next_cursor = paginate(
+            self._session, statement, pagination_params, UserEntity.id
+        )
 
         # Convert `UserEntity`s to model and return page
         return Paginated(
             items=[entity.to_model() for entity in entities],
             length=length,
             params=pagination_params,
+            next_cursor=next_cursor,
         )
@@ -24,3 +24,10 @@ class EventRegistrationException(Exception):
 
     def __init__(self, event_id: int):
         super().__init__(f"Unable to register user for the event with id: {event_id}")
+
+
+class InvalidCursorException(Exception):
+    """InvalidCursorException is raised when a pagination cursor is malformed or was issued for a different ordering."""
+
+    def __init__(self, cursor: str):
+        super().__init__(f"Invalid pagination cursor: {cursor}")
@@ -1,11 +1,12 @@
 """
 GitHub user authentication service.
+
+PyGithub and requests are only needed while a user links their GitHub account, so they are
+imported on first use rather than when the application starts.
 """
 
-import requests
 import uuid
 from fastapi import Depends
-from github import Github
 from ..models import User
 from .user import UserService
 from ..env import getenv
@@ -40,6 +41,8 @@ class GitHubService:
 
         Returns:
             bool: True if the user was successfully authenticated, False otherwise."""
+        from github import Github
+
         try:
             token = self._get_github_oauth_token(oauth_code, redirect_uri)
             github = Github(token)
@@ -77,6 +80,8 @@ class GitHubService:
         return uri
 
     def _get_github_oauth_token(self, oauth_code: str, redirect_uri: str) -> str:
+        import requests
+
         result = requests.post(
             "https://github.com/login/oauth/access_token",
             data={
@@ -11,7 +11,12 @@ In this context health does not refer to correctness as much as running, connect
 
 from fastapi import Depends
 from sqlalchemy import text
-from ..database import Session, db_session
+from ..database import Session, db_session, pool_statistics
+from ..models import User
+from ..models.pool_statistics import DatabasePoolStatistics
+from ..models.coworking import ReservationSweepStatistics
+from .coworking.sweeper import reservation_sweeper
+from .permission import PermissionService
 
 __authors__ = ["Kris Jordan"]
 __copyright__ = "Copyright 2023"
@@ -20,12 +25,48 @@ __license__ = "MIT"
 
 class HealthService:
     _session: Session
+    _permission: PermissionService
 
-    def __init__(self, session: Session = Depends(db_session)):
+    def __init__(
+        self,
+        session: Session = Depends(db_session),
+        permission: PermissionService = Depends(),
+    ):
         self._session = session
+        self._permission = permission
 
     def check(self):
         stmt = text("SELECT 'OK', NOW()")
         result = self._session.execute(stmt)
         row = result.all()[0]
         return str(f"{row[0]} @ {row[1]}")
+
+    def pool(self, subject: User) -> DatabasePoolStatistics:
+        """Report usage of the application's sync and async database connection pools.
+
+        Args:
+            subject (User): The user requesting the statistics.
+
+        Returns:
+            DatabasePoolStatistics: Checked-out and overflow connections, plus checkout wait
+                times, of each pool.
+
+        Raises:
+            UserPermissionException: If the subject may not read the pool statistics."""
+        self._permission.enforce(subject, "health.pool", "health")
+        return pool_statistics()
+
+    def reservation_sweeper(self, subject: User) -> ReservationSweepStatistics:
+        """Report the activity of the background reservation sweeper.
+
+        Args:
+            subject (User): The user requesting the statistics.
+
+        Returns:
+            ReservationSweepStatistics: Ticks, failures, and reservations transitioned per tick.
+
+        Raises:
+            UserPermissionException: If the subject may not read the sweeper statistics.
+        """
+        self._permission.enforce(subject, "health.reservation_sweeper", "health")
+        return reservation_sweeper.statistics()
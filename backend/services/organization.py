@@ -12,6 +12,7 @@ from ..models.organization_details import OrganizationDetails
 from ..entities.organization_entity import OrganizationEntity
 from ..models import User
 from .permission import PermissionService
+from .search import to_search_query, matches, rank
 
 from .exceptions import ResourceNotFoundException
 
@@ -20,6 +21,15 @@ __authors__ = ["Ajay Gandecha", "Jade Keegan", "Brianna Ta", "Audrey Toney"]
 __copyright__ = "Copyright 2023"
 __license__ = "MIT"
 
+# Columns matched by a search of only stop words, which its search query cannot match
+_SEARCH_FALLBACK_COLUMNS = (
+    OrganizationEntity.name,
+    OrganizationEntity.shorthand,
+    OrganizationEntity.slug,
+    OrganizationEntity.short_description,
+    OrganizationEntity.long_description,
+)
+
 
 class OrganizationService:
     """Service that performs all of the actions on the `Organization` table"""
@@ -47,6 +57,38 @@ class OrganizationService:
         # Convert entries to a model and return
         return [entity.to_model() for entity in entities]
 
+    def search(self, query: str) -> list[Organization]:
+        """
+        Searches organizations by their names and descriptions
+
+        Args:
+            query: The search string
+
+        Returns:
+            list[Organization]: The matching `Organization`s, most relevant first
+        """
+        search_query = to_search_query(query)
+        if search_query is None:
+            return []
+
+        statement = (
+            select(OrganizationEntity)
+            .where(
+                matches(
+                    OrganizationEntity.search_vector,
+                    search_query,
+                    query,
+                    _SEARCH_FALLBACK_COLUMNS,
+                )
+            )
+            .order_by(
+                rank(OrganizationEntity.search_vector, search_query).desc(),
+                OrganizationEntity.name,
+            )
+        )
+        entities = self._session.scalars(statement).all()
+        return [entity.to_model() for entity in entities]
+
     def create(self, subject: User, organization: Organization) -> Organization:
         """
         Creates a organization based on the input object and adds it to the table.
@@ -0,0 +1,146 @@
+"""Offset and keyset (cursor) pagination of SQLAlchemy select statements.
+
+Results are always ordered by the requested sort column with the primary key as a tiebreaker,
+so the order is stable across requests. Every page carries a `next_cursor` encoding the sort
+key and id of its last row. Passing that cursor back fetches the following page with a
+`WHERE (sort, id) > (:key, :id)` predicate instead of an OFFSET, so a deep page costs the
+same as the first one. The total length requires a second, counting query; it is computed
+for offset pages and omitted for cursor pages, whose client already has it from the first.
+
+Cursor pagination assumes the sort column is not nullable.
+"""
+
+import base64
+import binascii
+import json
+from datetime import date, datetime
+from typing import Any, Sequence
+
+from sqlalchemy import Select, func, select, tuple_
+from sqlalchemy.orm import InstrumentedAttribute, Session
+
+from ..models.pagination import PaginationParams
+from .exceptions import InvalidCursorException
+
+__authors__ = ["Kris Jordan"]
+__copyright__ = "Copyright 2023"
+__license__ = "MIT"
+
+
+def encode_cursor(order_by: str, key: Any, id: int) -> str:
+    """Encode the position after a row as an opaque, URL-safe cursor.
+
+    Args:
+        order_by (str): The name of the column results are sorted by.
+        key (Any): The row's value of the sort column.
+        id (int): The row's primary key.
+
+    Returns:
+        str: The cursor."""
+    if isinstance(key, (datetime, date)):
+        key = key.isoformat()
+    payload = json.dumps([order_by, key, id], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(
+    cursor: str, order_by: str, sort_column: InstrumentedAttribute
+) -> tuple[Any, int]:
+    """Decode a cursor produced by `encode_cursor` for the same ordering.
+
+    Args:
+        cursor (str): The cursor from a previous page.
+        order_by (str): The name of the column results are sorted by.
+        sort_column (InstrumentedAttribute): The column results are sorted by.
+
+    Returns:
+        tuple[Any, int]: The sort key and id of the last row of the previous page.
+
+    Raises:
+        InvalidCursorException: If the cursor is malformed, was issued for another ordering, or
+            its sort key is not of the sort column's type.
+    """
+    python_type = sort_column.type.python_type
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        cursor_order_by, key, id = json.loads(base64.urlsafe_b64decode(padded))
+        if python_type in (datetime, date) and key is not None:
+            key = python_type.fromisoformat(key)
+    except (binascii.Error, ValueError, TypeError):
+        raise InvalidCursorException(cursor)
+    if cursor_order_by != order_by or not _is_instance(id, int):
+        raise InvalidCursorException(cursor)
+    if key is not None and not _is_instance(key, python_type):
+        raise InvalidCursorException(cursor)
+    return key, id
+
+
+def _is_instance(value: Any, python_type: type) -> bool:
+    """Whether a value decoded from JSON is of a column's Python type.
+
+    Booleans are not accepted as integers, and integers are accepted as floats."""
+    if isinstance(value, bool) != (python_type is bool):
+        return False
+    if python_type is float:
+        return isinstance(value, (int, float))
+    return isinstance(value, python_type)
+
+
+def paginate(
+    session: Session,
+    statement: Select,
+    params: PaginationParams,
+    id_column: InstrumentedAttribute,
+    ascending: bool = True,
+) -> tuple[Sequence[Any], int | None, str | None]:
+    """Fetch one page of the entities selected by a statement.
+
+    Args:
+        session (Session): The session to execute the statements with.
+        statement (Select): A statement selecting the filtered entities, without ordering.
+        params (PaginationParams): The page to fetch. The `cursor`, when given, takes precedence over `page`.
+        id_column (InstrumentedAttribute): The primary key of the selected entity.
+        ascending (bool): Whether results are sorted in ascending order.
+
+    Returns:
+        tuple[Sequence[Any], int | None, str | None]: The entities of the page, the total length
+            of the unpaginated results (None for cursor pages), and the cursor of the next page
+            (None on the last page).
+
+    Raises:
+        InvalidCursorException: If the cursor is malformed or was issued for another ordering.
+    """
+    entity = id_column.class_
+    order_by = params.order_by or id_column.key
+    sort_column: InstrumentedAttribute = getattr(entity, order_by)
+
+    length = None
+    if params.cursor == "":
+        length = session.scalar(
+            select(func.count()).select_from(statement.order_by(None).subquery())
+        )
+
+    if ascending:
+        statement = statement.order_by(sort_column, id_column)
+    else:
+        statement = statement.order_by(sort_column.desc(), id_column.desc())
+
+    if params.cursor != "":
+        key, id = decode_cursor(params.cursor, order_by, sort_column)
+        position = tuple_(sort_column, id_column)
+        statement = statement.where(
+            position > tuple_(key, id) if ascending else position < tuple_(key, id)
+        )
+    else:
+        statement = statement.offset(params.page * params.page_size)
+
+    # Fetch one row beyond the page to learn whether there is a next page.
+    entities = session.scalars(statement.limit(params.page_size + 1)).unique().all()
+    next_cursor = None
+    if len(entities) > params.page_size:
+        entities = entities[: params.page_size]
+        last = entities[-1]
+        next_cursor = encode_cursor(
+            order_by, getattr(last, sort_column.key), getattr(last, id_column.key)
+        )
+    return entities, length, next_cursor
@@ -5,15 +5,15 @@ This Service is more of an internal service that other services take dependency
 exposed via the API.
 """
 
-import re
 from fastapi import Depends
-from functools import lru_cache
-from sqlalchemy import select
+from sqlalchemy import select, or_
 from sqlalchemy.orm import Session
 from ..database import db_session
 from ..models import User, Permission, Role, RoleDetails
-from ..entities import UserEntity, PermissionEntity, RoleEntity
+from ..entities import UserEntity, PermissionEntity, RoleEntity, user_role_table
 from ..services.exceptions import UserPermissionException
+from .permission_matcher import PermissionMatcher
+from .user_cache import invalidate_user
 
 __authors__ = ["Kris Jordan"]
 __copyright__ = "Copyright 2023"
@@ -24,13 +24,22 @@ class PermissionService:
     """PermissionService grants, revokes, tests, and enforces permissions for users and roles in the system."""
 
     _session: Session
+    _snapshots: dict[int, list[Permission]]
+    _matchers: dict[int, PermissionMatcher]
 
     def __init__(self, session: Session = Depends(db_session)):
         """Initialize a new PermissionService instance.
 
+        FastAPI caches dependencies for the duration of a request, so a single instance is
+        shared by every service injected into the same request. Subjects' effective permissions
+        are snapshotted on the instance the first time they are needed and reused by every
+        subsequent check in the request.
+
         Args:
             session (Session): The SQLAlchemy session to use for database operations."""
         self._session = session
+        self._snapshots = {}
+        self._matchers = {}
 
     def get_permissions(self, subject: User) -> list[Permission]:
         """Get the permissions for a user.
@@ -40,10 +49,7 @@ class PermissionService:
 
         Returns:
             list[Permission]: The permissions for the user."""
-        user_permissions = self._get_user_permissions(subject)
-        roles_permissions = self._get_user_roles_permissions(subject)
-        permissions = user_permissions + roles_permissions
-        return [permission.to_model() for permission in permissions]
+        return list(self._get_effective_permissions(subject))
 
     def grant(
         self, grantor: User, grantee: User | Role | RoleDetails, permission: Permission
@@ -83,6 +89,7 @@ class PermissionService:
 
         self._session.add(permission_entity)
         self._session.commit()
+        self.invalidate()
         return True
 
     def revoke(self, revoker: User, permission: Permission) -> bool:
@@ -110,8 +117,29 @@ class PermissionService:
 
         self._session.delete(permission_entity)
         self._session.commit()
+        self.invalidate()
         return True
 
+    def invalidate(self, user_id: int | None = None) -> None:
+        """Discard snapshotted permissions so they are reloaded on the next check.
+
+        Must be called whenever a user's permissions or role memberships change. Users cached
+        by authentication are invalidated, too.
+
+        Args:
+            user_id (int | None): The id of the user whose snapshot is stale, or None to
+                discard every snapshot (e.g. when a role's permissions change).
+
+        Returns:
+            None"""
+        if user_id is None:
+            self._snapshots.clear()
+            self._matchers.clear()
+        else:
+            self._snapshots.pop(user_id, None)
+            self._matchers.pop(user_id, None)
+        invalidate_user(user_id)
+
     def enforce(self, subject: User, action: str, resource: str) -> None:
         """Enforce a permission for a user.
 
@@ -138,96 +166,43 @@ class PermissionService:
         Returns:
             bool: True if the user has permission to carry out the action on the resource, False otherwise.
         """
-        # Check user permissions
-        user_perms = self._get_user_permissions(subject)
-        if self._has_permission(user_perms, action, resource):
-            return True
-
-        # Check role permissions
-        role_permissions = self._get_user_roles_permissions(subject)
-        return self._has_permission(role_permissions, action, resource)
-
-    def _get_user_permissions(self, subject: User) -> list[PermissionEntity]:
-        """Get the permissions for a user.
-
-        Args:
-            subject (User): The user to get permissions for.
-
-        Returns:
-            list[PermissionEntity]: The permissions for the user."""
-        user_query = select(PermissionEntity).where(
-            PermissionEntity.user_id == subject.id
-        )
-        user_perms = [p for p in self._session.execute(user_query).scalars()]
-        return user_perms
-
-    def _get_user_roles_permissions(self, subject: User) -> list[PermissionEntity]:
-        """Get the permissions for a user's roles.
+        matcher = self._matchers.get(subject.id)
+        if matcher is None:
+            permissions = self._get_effective_permissions(subject)
+            matcher = PermissionMatcher.compile(
+                (permission.action, permission.resource) for permission in permissions
+            )
+            self._matchers[subject.id] = matcher
+        return matcher.matches(action, resource)
+
+    def _get_effective_permissions(self, subject: User) -> list[Permission]:
+        """Get the snapshot of a user's own and roles' permissions, loading it on first use.
 
         Args:
             subject (User): The user to get permissions for.
 
         Returns:
-            list[PermissionEntity]: The permissions for the user's roles."""
-        user_entity = self._session.get(UserEntity, subject.id)
-        if user_entity == None:
-            return []
-        role_ids = [role.id for role in user_entity.roles]
-        if len(role_ids) == 0:
-            return []
-        role_query = select(PermissionEntity).where(
-            PermissionEntity.role_id.in_(role_ids)
-        )
-        return [p for p in self._session.execute(role_query).scalars()]
-
-    def _has_permission(
-        self, permissions: list[PermissionEntity], action: str, resource: str
-    ) -> bool:
-        """Check if a user has permission to carry out an action on a resource in a list of permissions.
-
-        Args:
-            permissions (list[PermissionEntity]): The permissions to check.
-            action (str): The action in question.
-            resource (str): The resource in question.
-
-        Returns:
-            bool: True if the user has permission to carry out the action on the resource, False otherwise.
-        """
-        for permission in permissions:
-            if self._check_permission(permission, action, resource):
-                return True
-        return False
-
-    def _check_permission(
-        self, permission: PermissionEntity, action: str, resource: str
-    ) -> bool:
-        """Check if a user has permission to carry out an action on a resource.
-
-        Args:
-            permission (PermissionEntity): The permission to check.
-            action (str): The action in question.
-            resource (str): The resource in question.
-
-        Returns:
-            bool: True if the user has permission to carry out the action on the resource, False otherwise.
+            list[Permission]: The user's permissions followed by their roles' permissions.
         """
-        action_re = self._expand_pattern(permission.action)
-        if action_re.fullmatch(action) is not None:
-            resource_re = self._expand_pattern(permission.resource)
-            return resource_re.fullmatch(resource) is not None
-        else:
-            return False
-
-    @lru_cache()
-    def _expand_pattern(self, pattern: str) -> re.Pattern:
-        """Expand a permission pattern into a regular expression.
-
-        This function is memoized to avoid recompiling the same regular expression multiple times.
-
-        Args:
-            pattern (str): The pattern to expand.
-
-        Returns:
-            re.Pattern: The compiled regular expression."""
-        search = pattern.replace("*", ".*")
-        return re.compile(f"^{search}$")
+        snapshot = self._snapshots.get(subject.id)
+        if snapshot is None:
+            query = (
+                select(PermissionEntity)
+                .outerjoin(
+                    user_role_table,
+                    PermissionEntity.role_id == user_role_table.c.role_id,
+                )
+                .where(
+                    or_(
+                        PermissionEntity.user_id == subject.id,
+                        user_role_table.c.user_id == subject.id,
+                    )
+                )
+                .order_by(PermissionEntity.role_id.is_not(None), PermissionEntity.id)
+            )
+            snapshot = [
+                permission.to_model()
+                for permission in self._session.execute(query).scalars().unique()
+            ]
+            self._snapshots[subject.id] = snapshot
+        return snapshot
@@ -0,0 +1,171 @@
+"""
+Compiled matcher for permission action and resource glob patterns.
+
+Permissions grant an action pattern on a resource pattern, where `*` matches any sequence of
+characters. Rather than testing every permission's patterns against a request, patterns are
+indexed by their literal prefix (the text before the first `*`) in a character trie. A lookup
+walks the trie along the requested action, or resource, and only tests patterns whose prefix
+matches. Patterns without a `*` are found with a single dictionary lookup.
+
+Matchers are immutable once compiled and are cached process-wide by their set of grants, so
+subjects sharing roles share the same compiled matcher across requests.
+"""
+
+import re
+from functools import lru_cache
+from typing import Callable, Generic, Iterable, Iterator, TypeVar
+
+__authors__ = ["Kris Jordan"]
+__copyright__ = "Copyright 2023"
+__license__ = "MIT"
+
+T = TypeVar("T")
+
+WILDCARD = "*"
+
+
+@lru_cache(maxsize=4096)
+def _compile_glob(pattern: str) -> re.Pattern:
+    """Compile a permission glob pattern into a regular expression.
+
+    Memoized at the module level so compiled patterns are shared by every request.
+
+    Args:
+        pattern (str): The pattern to compile.
+
+    Returns:
+        re.Pattern: The compiled regular expression."""
+    return re.compile(".*".join(re.escape(part) for part in pattern.split(WILDCARD)))
+
+
+def glob_match(pattern: str, value: str) -> bool:
+    """Test whether a value matches a permission glob pattern.
+
+    Args:
+        pattern (str): The glob pattern, where `*` matches any sequence of characters.
+        value (str): The action or resource in question.
+
+    Returns:
+        bool: True if the whole value matches the pattern."""
+    if pattern == WILDCARD:
+        return True
+    if WILDCARD not in pattern:
+        return pattern == value
+    return _compile_glob(pattern).fullmatch(value) is not None
+
+
+class _TrieNode(Generic[T]):
+    """A node of the prefix trie holding wildcard patterns whose literal prefix ends here."""
+
+    __slots__ = ("children", "patterns")
+
+    def __init__(self):
+        self.children: dict[str, _TrieNode[T]] = {}
+        self.patterns: dict[str, T] = {}
+
+
+class _GlobIndex(Generic[T]):
+    """An index of glob patterns, each associated with a value, searchable by matching text."""
+
+    def __init__(self, factory: Callable[[], T]):
+        self._factory = factory
+        self._exact: dict[str, T] = {}
+        self._root: _TrieNode[T] = _TrieNode()
+
+    def add(self, pattern: str) -> T:
+        """Add a pattern to the index.
+
+        Args:
+            pattern (str): The glob pattern to index.
+
+        Returns:
+            T: The value associated with the pattern, created by the factory on first add.
+        """
+        if WILDCARD not in pattern:
+            if pattern not in self._exact:
+                self._exact[pattern] = self._factory()
+            return self._exact[pattern]
+
+        node = self._root
+        for char in pattern[: pattern.index(WILDCARD)]:
+            child = node.children.get(char)
+            if child is None:
+                child = node.children[char] = _TrieNode()
+            node = child
+        if pattern not in node.patterns:
+            node.patterns[pattern] = self._factory()
+        return node.patterns[pattern]
+
+    def match(self, text: str) -> Iterator[T]:
+        """Yield the values of every indexed pattern matching the text.
+
+        Exact patterns are yielded first, followed by wildcard patterns from the shortest
+        literal prefix to the longest.
+
+        Args:
+            text (str): The action or resource in question.
+
+        Returns:
+            Iterator[T]: Values of matching patterns."""
+        exact = self._exact.get(text)
+        if exact is not None:
+            yield exact
+
+        node = self._root
+        depth = 0
+        while node is not None:
+            for pattern, value in node.patterns.items():
+                if glob_match(pattern, text):
+                    yield value
+            if depth == len(text):
+                break
+            node = node.children.get(text[depth])
+            depth += 1
+
+
+class PermissionMatcher:
+    """A compiled set of (action, resource) grants answering permission checks."""
+
+    def __init__(self, grants: Iterable[tuple[str, str]]):
+        """Compile a matcher over the given grants.
+
+        Prefer `PermissionMatcher.compile`, which caches compiled matchers process-wide.
+
+        Args:
+            grants (Iterable[tuple[str, str]]): (action pattern, resource pattern) pairs.
+        """
+        self._actions: _GlobIndex[_GlobIndex[bool]] = _GlobIndex(
+            lambda: _GlobIndex(bool)
+        )
+        for action, resource in grants:
+            self._actions.add(action).add(resource)
+
+    def matches(self, action: str, resource: str) -> bool:
+        """Check whether any grant permits an action on a resource.
+
+        Args:
+            action (str): The action in question.
+            resource (str): The resource in question.
+
+        Returns:
+            bool: True if a grant's action and resource patterns both match."""
+        for resources in self._actions.match(action):
+            for _ in resources.match(resource):
+                return True
+        return False
+
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def _compile(grants: frozenset[tuple[str, str]]) -> "PermissionMatcher":
+        return PermissionMatcher(grants)
+
+    @staticmethod
+    def compile(grants: Iterable[tuple[str, str]]) -> "PermissionMatcher":
+        """Get the compiled matcher for a set of grants, reusing a cached one when possible.
+
+        Args:
+            grants (Iterable[tuple[str, str]]): (action pattern, resource pattern) pairs.
+
+        Returns:
+            PermissionMatcher: A matcher shared by every caller with the same grants."""
+        return PermissionMatcher._compile(frozenset(grants))
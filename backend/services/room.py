@@ -12,6 +12,7 @@ from ..models import RoomDetails
 from ..models.user import User
 from ..entities import RoomEntity
 from .permission import PermissionService
+from .coworking.coworking_cache import invalidate_rooms
 
 from ..services.exceptions import ResourceNotFoundException
 from datetime import datetime
@@ -85,6 +86,7 @@ class RoomService:
         # Add new object to table and commit changes
         self._session.add(room_entity)
         self._session.commit()
+        invalidate_rooms()
 
         # Return added object
         return room_entity.to_details_model()
@@ -119,6 +121,7 @@ class RoomService:
 
         # Commit changes
         self._session.commit()
+        invalidate_rooms()
 
         # Return edited object
         return room_entity.to_details_model()
@@ -144,3 +147,4 @@ class RoomService:
         # Delete and commit changes
         self._session.delete(room_entity)
         self._session.commit()
+        invalidate_rooms()
@@ -0,0 +1,78 @@
+"""Full-text search queries over the `search_vector` columns of searchable entities.
+
+Search vectors are built with the `english` text search configuration and weighted by field
+(see `EventEntity` and `OrganizationEntity`). A search string becomes a query requiring every
+word it contains, each matched as a prefix so that results update as the user types.
+
+The configuration drops stop words such as "the", so a search of only stop words becomes an
+empty query which matches nothing. Such searches instead match rows where any of a set of
+fallback columns contains the search string.
+"""
+
+import re
+
+from typing import Sequence
+from sqlalchemy import ColumnElement, and_, func, or_
+from sqlalchemy.orm import InstrumentedAttribute
+
+__authors__ = ["Kris Jordan"]
+__copyright__ = "Copyright 2023"
+__license__ = "MIT"
+
+SEARCH_CONFIG = "english"
+
+_WORD = re.compile(r"[^\W_]+")
+
+
+def to_search_query(search: str) -> ColumnElement | None:
+    """Convert a user's search string into a text search query.
+
+    Args:
+        search (str): The search string.
+
+    Returns:
+        ColumnElement | None: A `tsquery` matching every word of the search as a prefix, or
+            None if the search contains no words."""
+    words = _WORD.findall(search.lower())
+    if len(words) == 0:
+        return None
+    return func.to_tsquery(SEARCH_CONFIG, " & ".join(f"{word}:*" for word in words))
+
+
+def matches(
+    search_vector: InstrumentedAttribute,
+    query: ColumnElement,
+    search: str = "",
+    fallback_columns: Sequence[InstrumentedAttribute] = (),
+) -> ColumnElement[bool]:
+    """Criteria for rows whose search vector matches a query, served by its GIN index.
+
+    Where the query is empty because the search contains only stop words, rows match if any
+    fallback column contains the search string instead. The query is a constant, so the
+    planner keeps only the branch that applies.
+
+    Args:
+        search_vector (InstrumentedAttribute): The searched entity's search vector.
+        query (ColumnElement): The query made by `to_search_query` from the search.
+        search (str): The search string.
+        fallback_columns (Sequence[InstrumentedAttribute]): The columns to match when the
+            query is empty.
+
+    Returns:
+        ColumnElement[bool]: The search criteria."""
+    criteria = search_vector.op("@@")(query)
+    if len(fallback_columns) == 0:
+        return criteria
+    escaped = (
+        search.strip().replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    )
+    contains = or_(
+        *(column.ilike(f"%{escaped}%", escape="\\") for column in fallback_columns)
+    )
+    is_empty = func.numnode(query) == 0
+    return or_(and_(~is_empty, criteria), and_(is_empty, contains))
+
+
+def rank(search_vector: InstrumentedAttribute, query: ColumnElement) -> ColumnElement:
+    """Relevance of rows to a query, taking the weights of matched fields into account."""
+    return func.ts_rank(search_vector, query)
@@ -0,0 +1,120 @@
+"""
+The Table Version Service reports the version counters of database tables.
+
+Counters are maintained by database triggers (see `entities.table_version_table`) and are
+read without loading any entities, so that validating a cached response is a single,
+primary key lookup.
+
+Tables with concurrent writers are not versioned, since their writers would serialize on the
+counter. Responses built from them are validated by a fingerprint instead: the sum of a hash
+of each relevant row, plus the row count, computed by a read-only aggregate query. Any
+insert, update, or delete of those rows changes the fingerprint, without writers contending
+on anything.
+"""
+
+from typing import Iterable
+
+from fastapi import Depends
+from sqlalchemy import BigInteger, ColumnElement, Select, cast, func, select
+from sqlalchemy.orm import Session
+
+from ..database import db_session
+from ..entities import EventRegistrationEntity, UserEntity
+from ..entities.academics import SectionMemberEntity
+from ..entities.table_version_table import VERSIONED_TABLES, table_version_table
+from ..models import RegistrationType
+from ..models.table_version import TableVersion
+
+__authors__ = ["Kris Jordan"]
+__copyright__ = "Copyright 2023"
+__license__ = "MIT"
+
+
+def _fingerprint(*columns: ColumnElement) -> ColumnElement[int]:
+    """The row count plus the sum of a hash of the given columns of every row."""
+    row_hash = cast(func.hashtext(func.concat_ws(":", *columns)), BigInteger)
+    return func.count() + func.coalesce(func.sum(row_hash), 0)
+
+
+FINGERPRINTS: dict[str, Select] = {
+    # Every registration, which determines events' registration counts and organizers.
+    "event_registration": select(
+        _fingerprint(
+            EventRegistrationEntity.event_id,
+            EventRegistrationEntity.user_id,
+            EventRegistrationEntity.registration_type,
+        )
+    ),
+    # The public profiles of event organizers.
+    "event_organizer": select(
+        _fingerprint(
+            UserEntity.id,
+            UserEntity.first_name,
+            UserEntity.last_name,
+            UserEntity.pronouns,
+            UserEntity.email,
+            UserEntity.github_avatar,
+        )
+    )
+    .join(EventRegistrationEntity, EventRegistrationEntity.user_id == UserEntity.id)
+    .where(EventRegistrationEntity.registration_type == RegistrationType.ORGANIZER),
+    # The public profiles of section members.
+    "section_member": select(
+        _fingerprint(
+            UserEntity.id,
+            UserEntity.first_name,
+            UserEntity.last_name,
+            UserEntity.pronouns,
+        )
+    ).join(SectionMemberEntity, SectionMemberEntity.user_id == UserEntity.id),
+}
+"""Queries computing the fingerprints of unversioned data, by name."""
+
+
+class TableVersionService:
+    """Service that reads the `table_version` counters."""
+
+    def __init__(self, session: Session = Depends(db_session)):
+        """Initializes the `TableVersionService` session"""
+        self._session = session
+
+    def get(self, tables: Iterable[str]) -> list[TableVersion]:
+        """
+        Get the version counters of tables, and the fingerprints of unversioned data
+
+        Args:
+            tables: Names of versioned tables or of `FINGERPRINTS`
+
+        Returns:
+            list[TableVersion]: The counters of the tables mutated at least once, ordered by
+                name, followed by the requested fingerprints, ordered by name
+
+        Raises:
+            ValueError if a table is neither versioned nor fingerprinted
+        """
+        tables = set(tables)
+        unversioned = tables.difference(VERSIONED_TABLES, FINGERPRINTS)
+        if unversioned:
+            raise ValueError(f"Tables are not versioned: {sorted(unversioned)}")
+
+        statement = (
+            select(table_version_table)
+            .where(table_version_table.c.table_name.in_(tables))
+            .order_by(table_version_table.c.table_name)
+        )
+        versions = [
+            TableVersion.model_validate(row._mapping)
+            for row in self._session.execute(statement)
+        ]
+        fingerprinted = sorted(tables.intersection(FINGERPRINTS))
+        if fingerprinted:
+            fingerprints = self._session.execute(
+                select(
+                    *(FINGERPRINTS[name].scalar_subquery() for name in fingerprinted)
+                )
+            ).one()
+            versions.extend(
+                TableVersion(table_name=name, version=fingerprint)
+                for name, fingerprint in zip(fingerprinted, fingerprints)
+            )
+        return versions
@@ -3,19 +3,35 @@
 The User Service provides access to the User model and its associated database operations.
 """
 
+from typing import Sequence
 from fastapi import Depends
-from sqlalchemy import select, or_, func, cast, String
+from sqlalchemy import ColumnElement, select, or_, func, cast, String, text
 from sqlalchemy.orm import Session
 from ..database import db_session
 from ..models import User, UserDetails, Paginated, PaginationParams
 from ..entities import UserEntity
 from .exceptions import ResourceNotFoundException
 from .permission import PermissionService
+from .pagination import paginate
+from .user_cache import invalidate_user
 
 __authors__ = ["Kris Jordan"]
 __copyright__ = "Copyright 2023"
 __license__ = "MIT"
 
+# Columns matched by user search, and the narrower set matched by the admin list filter
+_SEARCH_COLUMNS = (
+    UserEntity.first_name,
+    UserEntity.last_name,
+    UserEntity.onyen,
+    UserEntity.email,
+    cast(UserEntity.pid, String),
+)
+_LIST_FILTER_COLUMNS = (UserEntity.first_name, UserEntity.last_name, UserEntity.onyen)
+
+# Whether trigram search is available, by database URL
+_trigram_search_enabled: dict[str, bool] = {}
+
 
 class UserService:
     _session: Session
@@ -78,18 +94,53 @@ class UserService:
         Returns:
             list[User]: The list of users matching the query.
         """
-        statement = select(UserEntity)
-        criteria = or_(
-            UserEntity.first_name.ilike(f"%{query}%"),
-            UserEntity.last_name.ilike(f"%{query}%"),
-            UserEntity.onyen.ilike(f"%{query}%"),
-            UserEntity.email.ilike(f"%{query}%"),
-            cast(UserEntity.pid, String).ilike(f"%{query}%")
-        )
-        statement = statement.where(criteria).limit(10)
+        statement = select(UserEntity).where(self._search_criteria(query)).limit(10)
+        if self._trigram_search_enabled():
+            # Rank the closest matches first, such as an exact first or last name.
+            statement = statement.order_by(
+                func.greatest(
+                    func.similarity(
+                        UserEntity.first_name + " " + UserEntity.last_name, query
+                    ),
+                    func.similarity(UserEntity.onyen, query),
+                    func.similarity(UserEntity.email, query),
+                ).desc(),
+                UserEntity.id,
+            )
         entities = self._session.execute(statement).scalars()
         return [entity.to_model() for entity in entities]
 
+    def _search_criteria(
+        self, query: str, columns: Sequence[ColumnElement[str]] = _SEARCH_COLUMNS
+    ) -> ColumnElement[bool]:
+        """Criteria matching users where any of the given columns contains the query.
+
+        The query is matched literally: `%`, `_`, and `\\` in it are escaped. Each `ILIKE`
+        is served by the column's trigram index where `pg_trgm` is installed.
+
+        Args:
+            query: The search query.
+            columns: The columns to match, by default the name, onyen, email, and PID.
+
+        Returns:
+            ColumnElement[bool]: The search criteria."""
+        escaped = query.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+        return or_(*(column.ilike(f"%{escaped}%", escape="\\") for column in columns))
+
+    def _trigram_search_enabled(self) -> bool:
+        """Whether the `pg_trgm` extension is installed in the database, checked once per database."""
+        url = str(self._session.get_bind().engine.url)
+        if url not in _trigram_search_enabled:
+            _trigram_search_enabled[url] = bool(
+                self._session.scalar(
+                    text(
+                        "SELECT EXISTS "
+                        "(SELECT 1 FROM pg_extension WHERE extname = 'pg_trgm')"
+                    )
+                )
+            )
+        return _trigram_search_enabled[url]
+
     def list(
         self, subject: User, pagination_params: PaginationParams
     ) -> Paginated[User]:
@@ -110,34 +161,20 @@ class UserService:
         self._permission.enforce(subject, "user.list", "user/")
 
         statement = select(UserEntity)
-        length_statement = select(func.count()).select_from(UserEntity)
         if pagination_params.filter != "":
-            query = pagination_params.filter
-            criteria = or_(
-                UserEntity.first_name.ilike(f"%{query}%"),
-                UserEntity.last_name.ilike(f"%{query}%"),
-                UserEntity.onyen.ilike(f"%{query}%"),
-            )
-            statement = statement.where(criteria)
-            length_statement = length_statement.where(criteria)
-
-        offset = pagination_params.page * pagination_params.page_size
-        limit = pagination_params.page_size
-
-        if pagination_params.order_by != "":
-            statement = statement.order_by(
-                getattr(UserEntity, pagination_params.order_by)
+            statement = statement.where(
+                self._search_criteria(pagination_params.filter, _LIST_FILTER_COLUMNS)
             )
 
-        statement = statement.offset(offset).limit(limit)
-
-        length = self._session.execute(length_statement).scalar()
-        entities = self._session.execute(statement).scalars()
+        entities, length, next_cursor = paginate(
+            self._session, statement, pagination_params, UserEntity.id
+        )
 
         return Paginated(
             items=[entity.to_model() for entity in entities],
             length=length,
             params=pagination_params,
+            next_cursor=next_cursor,
         )
 
     def create(self, subject: User, user: User) -> User:
@@ -182,4 +219,5 @@ class UserService:
         entity = self._session.get(UserEntity, user.id)
         entity.update(user)
         self._session.commit()
+        invalidate_user(entity.id)
         return entity.to_model()
@@ -0,0 +1,85 @@
+"""Process-wide cache of users resolved from bearer tokens.
+
+`api.authentication.registered_user` resolves every authenticated request's bearer token to
+a `UserDetails`, including the user's permissions. Entries are keyed by the token and hold the
+verified JWT claims alongside the resolved user. Services that change a user's profile or
+permissions must invalidate the affected entries.
+
+A user resolved while an invalidation of them is under way could otherwise be written back
+stale after the invalidation. Each invalidation records a new generation for the affected
+user, and a resolved user is only cached if no invalidation of them happened after the
+generation captured before resolving it.
+"""
+
+from datetime import timedelta
+from threading import Lock
+from typing import Any
+from ..models import UserDetails
+from .cache import TTLCache
+
+__authors__ = ["Kris Jordan"]
+__copyright__ = "Copyright 2023"
+__license__ = "MIT"
+
+
+registered_users: TTLCache[str, tuple[dict[str, Any], UserDetails]] = TTLCache(
+    maxsize=4096, ttl=timedelta(minutes=5)
+)
+"""Verified JWT claims and resolved user, keyed by bearer token."""
+
+_lock = Lock()
+_generation = 0
+_invalidated_at: dict[int | None, int] = {}
+"""The generation of the latest invalidation of each user id, or of every user under None."""
+
+
+def generation() -> int:
+    """The current invalidation generation, captured before resolving a user to cache.
+
+    Returns:
+        int: The generation to pass to `cache_user`."""
+    return _generation
+
+
+def cache_user(
+    key: str,
+    auth_info: dict[str, Any],
+    user: UserDetails,
+    since: int,
+    ttl: timedelta | None = None,
+) -> bool:
+    """Cache a resolved user unless they were invalidated while being resolved.
+
+    Args:
+        key (str): The bearer token the user was resolved from.
+        auth_info (dict[str, Any]): The verified JWT claims of the token.
+        user (UserDetails): The resolved user.
+        since (int): The `generation` captured before the user was resolved.
+        ttl (timedelta | None): Overrides the cache's time-to-live for this entry when given.
+
+    Returns:
+        bool: True if the user was cached, False if an invalidation made them stale."""
+    with _lock:
+        if max(_invalidated_at.get(user.id, 0), _invalidated_at.get(None, 0)) > since:
+            return False
+        registered_users.set(key, (auth_info, user), ttl)
+        return True
+
+
+def invalidate_user(user_id: int | None = None) -> None:
+    """Discard cached users so they are resolved again on their next request.
+
+    Args:
+        user_id (int | None): The id of the user whose profile or permissions changed, or
+            None to discard every cached user (e.g. when a role's permissions change).
+
+    Returns:
+        None"""
+    global _generation
+    with _lock:
+        _generation += 1
+        _invalidated_at[user_id] = _generation
+        if user_id is None:
+            registered_users.clear()
+        else:
+            registered_users.discard_if(lambda _, entry: entry[1].id == user_id)
@@ -0,0 +1,30 @@
+"""Tests for authenticating requests to the system health API."""
+
+import asyncio
+import httpx
+import pytest
+
+from ...main import app
+
+__authors__ = ["Kris Jordan"]
+__copyright__ = "Copyright 2023"
+__license__ = "MIT"
+
+
+def get(path: str, headers: dict[str, str] = {}) -> httpx.Response:
+    async def request() -> httpx.Response:
+        transport = httpx.ASGITransport(app=app)  # type: ignore
+        async with httpx.AsyncClient(
+            transport=transport, base_url="http://test"
+        ) as client:
+            return await client.get(path, headers=headers)
+
+    return asyncio.run(request())
+
+
+@pytest.mark.parametrize(
+    "path", ["/api/health/pool", "/api/health/reservation-sweeper"]
+)
+def test_statistics_require_authentication(path: str):
+    assert get(path).status_code == 403
+    assert get(path, {"Authorization": "Bearer invalid"}).status_code == 401
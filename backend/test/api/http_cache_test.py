@@ -0,0 +1,132 @@
+"""Tests for the conditional response dependency of public endpoints."""
+
+import pytest
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+from fastapi import HTTPException, Request, Response
+from unittest.mock import create_autospec
+
+from ...api.http_cache import cache_validators, etag
+from ...models.table_version import TableVersion
+from ...services.table_version import TableVersionService
+
+__authors__ = ["Kris Jordan"]
+__copyright__ = "Copyright 2023"
+__license__ = "MIT"
+
+MODIFIED_AT = datetime(2024, 3, 5, 16, 47, 9, 284113, tzinfo=timezone.utc)
+VERSIONS = [
+    TableVersion(table_name="organization", version=3, modified_at=MODIFIED_AT),
+    TableVersion(
+        table_name="room", version=8, modified_at=MODIFIED_AT - timedelta(days=1)
+    ),
+]
+
+
+@pytest.fixture()
+def table_version_svc() -> TableVersionService:
+    table_version_svc = create_autospec(TableVersionService)
+    table_version_svc.get.return_value = VERSIONS
+    return table_version_svc
+
+
+def _validate(table_version_svc: TableVersionService, **headers: str) -> Response:
+    request = Request(
+        {
+            "type": "http",
+            "method": "GET",
+            "path": "/",
+            "headers": [
+                (name.replace("_", "-").encode(), value.encode())
+                for name, value in headers.items()
+            ],
+        }
+    )
+    response = Response()
+    cache_validators("organization", "room")(request, response, table_version_svc)
+    return response
+
+
+def test_etag_changes_with_versions():
+    bumped = VERSIONS[0].model_copy(update={"version": 4})
+    assert etag(VERSIONS) != etag([bumped, VERSIONS[1]])
+    assert etag(VERSIONS).startswith('W/"')
+
+
+def test_unconditional_request(table_version_svc: TableVersionService):
+    response = _validate(table_version_svc)
+    assert response.headers["ETag"] == etag(VERSIONS)
+    assert response.headers["Last-Modified"] == "Tue, 05 Mar 2024 16:47:09 GMT"
+    assert response.headers["Cache-Control"] == "public, no-cache"
+    table_version_svc.get.assert_called_once_with(("organization", "room"))
+
+
+def test_if_none_match(table_version_svc: TableVersionService):
+    with pytest.raises(HTTPException) as e:
+        _validate(table_version_svc, if_none_match=f'"other", {etag(VERSIONS)}')
+    assert e.value.status_code == 304
+    assert e.value.headers["ETag"] == etag(VERSIONS)
+
+
+def test_if_none_match_stale(table_version_svc: TableVersionService):
+    response = _validate(table_version_svc, if_none_match='W/"stale"')
+    assert response.headers["ETag"] == etag(VERSIONS)
+
+
+def test_if_modified_since(table_version_svc: TableVersionService):
+    with pytest.raises(HTTPException) as e:
+        _validate(
+            table_version_svc,
+            if_modified_since=format_datetime(
+                MODIFIED_AT.replace(microsecond=0), usegmt=True
+            ),
+        )
+    assert e.value.status_code == 304
+
+
+def test_if_modified_since_stale(table_version_svc: TableVersionService):
+    since = MODIFIED_AT - timedelta(seconds=1)
+    response = _validate(
+        table_version_svc, if_modified_since=format_datetime(since, usegmt=True)
+    )
+    assert "ETag" in response.headers
+
+
+def test_if_none_match_takes_precedence(table_version_svc: TableVersionService):
+    response = _validate(
+        table_version_svc,
+        if_none_match='W/"stale"',
+        if_modified_since=format_datetime(MODIFIED_AT, usegmt=True),
+    )
+    assert "ETag" in response.headers
+
+
+def test_unversioned_table():
+    with pytest.raises(ValueError):
+        cache_validators("coworking__reservation")
+
+
+def test_fingerprint_has_no_last_modified(table_version_svc: TableVersionService):
+    """Responses built from fingerprinted data are validated by their ETag alone."""
+    fingerprint = TableVersion(table_name="event_registration", version=-12345)
+    table_version_svc.get.return_value = [*VERSIONS, fingerprint]
+    request = Request(
+        {
+            "type": "http",
+            "method": "GET",
+            "path": "/",
+            "headers": [
+                (
+                    b"if-modified-since",
+                    format_datetime(MODIFIED_AT, usegmt=True).encode(),
+                )
+            ],
+        }
+    )
+    response = Response()
+    cache_validators("organization", "room", "event_registration")(
+        request, response, table_version_svc
+    )
+    assert "Last-Modified" not in response.headers
+    assert response.headers["ETag"] == etag([*VERSIONS, fingerprint])
+    assert response.headers["ETag"] != etag(VERSIONS)
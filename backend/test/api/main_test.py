@@ -0,0 +1,60 @@
+"""Tests for registering the feature APIs' routes on the application."""
+
+import asyncio
+import httpx
+from fastapi import FastAPI
+from fastapi.routing import APIRoute
+
+from ...api import user as user_api
+from ...api.authentication import registered_user
+from ...main import app, feature_apis
+from ...services import UserService
+
+__authors__ = ["Kris Jordan"]
+__copyright__ = "Copyright 2023"
+__license__ = "MIT"
+
+
+def _endpoints(routes) -> set[tuple[str, str]]:
+    return {
+        (route.path, method)
+        for route in routes
+        if isinstance(route, APIRoute)
+        for method in route.methods
+    }
+
+
+def get(path: str, params: dict[str, str]) -> httpx.Response:
+    async def request() -> httpx.Response:
+        transport = httpx.ASGITransport(app=app)  # type: ignore
+        async with httpx.AsyncClient(
+            transport=transport, base_url="http://test"
+        ) as client:
+            return await client.get(path, params=params)
+
+    return asyncio.run(request())
+
+
+def test_routes_match_include_router():
+    """Tests that the app serves the same endpoints as including each router would."""
+    included = FastAPI()
+    for feature_api in feature_apis:
+        included.include_router(feature_api.api)
+    assert _endpoints(app.routes) == _endpoints(included.routes)
+
+
+def test_dependency_overrides_apply_to_feature_routes():
+    """Tests that routes resolve their dependencies through the app."""
+
+    class StubUserService:
+        def search(self, subject, query):
+            return []
+
+    app.dependency_overrides[registered_user] = lambda: None
+    app.dependency_overrides[UserService] = StubUserService
+    try:
+        response = get(user_api.api.prefix, {"q": "sally"})
+    finally:
+        app.dependency_overrides.clear()
+    assert response.status_code == 200
+    assert response.json() == []
@@ -0,0 +1,70 @@
+"""Tests for the SQL query profiler middleware."""
+
+import asyncio
+import logging
+import pytest
+from sqlalchemy import Engine, create_engine, text
+
+from ...api.query_profiler import (
+    QueryProfilerMiddleware,
+    fingerprint,
+    profile_queries,
+)
+
+__authors__ = ["Kris Jordan"]
+__copyright__ = "Copyright 2023"
+__license__ = "MIT"
+
+
+@pytest.fixture()
+def engine() -> Engine:
+    return create_engine("sqlite://")
+
+
+def test_fingerprint_ignores_parameters():
+    assert fingerprint("SELECT * FROM user WHERE id = %(id_1)s") == fingerprint(
+        "SELECT  *\n FROM user WHERE id = %(id_2)s"
+    )
+    assert fingerprint("SELECT 1 WHERE id IN ($1, $2, $3)") == (
+        "SELECT 1 WHERE id IN (?)"
+    )
+
+
+def test_profile_queries(engine: Engine):
+    with engine.connect() as connection:
+        connection.execute(text("SELECT 1"))
+        with profile_queries() as profile:
+            for id in range(3):
+                connection.execute(text("SELECT :id"), {"id": id})
+        connection.execute(text("SELECT 2"))
+    assert profile.count == 3
+    assert profile.total_ms >= 0
+    assert profile.repeated(3) == [("SELECT ?", 3)]
+    assert profile.repeated(4) == []
+
+
+def test_middleware_reports_queries(engine: Engine, caplog: pytest.LogCaptureFixture):
+    async def app(scope, receive, send):
+        with engine.connect() as connection:
+            for id in range(5):
+                connection.execute(text("SELECT :id"), {"id": id})
+        await send({"type": "http.response.start", "status": 200, "headers": []})
+        await send({"type": "http.response.body", "body": b""})
+
+    messages = []
+
+    async def send(message):
+        messages.append(message)
+
+    async def receive():
+        return {"type": "http.request"}
+
+    middleware = QueryProfilerMiddleware(app, n_plus_one_threshold=5)
+    scope = {"type": "http", "method": "GET", "path": "/api/events", "headers": []}
+    with caplog.at_level(logging.WARNING):
+        asyncio.run(middleware(scope, receive, send))
+
+    headers = dict(messages[0]["headers"])
+    assert headers[b"x-query-count"] == b"5"
+    assert headers[b"server-timing"].startswith(b"db;dur=")
+    assert "Possible N+1 query in GET /api/events" in caplog.text
@@ -0,0 +1,135 @@
+"""Tests for serving the front-end's static files and compressing API responses."""
+
+import asyncio
+import gzip
+import mimetypes
+import os
+from pathlib import Path
+import pytest
+from starlette.responses import Response
+
+from ...api.compression import APIGZipMiddleware
+from ...api.static_files import (
+    IMMUTABLE_CACHE_CONTROL,
+    REVALIDATE_CACHE_CONTROL,
+    StaticFileMiddleware,
+    accepted_encodings,
+)
+
+__authors__ = ["Kris Jordan"]
+__copyright__ = "Copyright 2023"
+__license__ = "MIT"
+
+BUNDLE = "main.0123456789abcdef.js"
+
+
+@pytest.fixture()
+def static_files(tmp_path: Path) -> StaticFileMiddleware:
+    (tmp_path / "index.html").write_text("<html></html>")
+    (tmp_path / BUNDLE).write_text("console.log('main');")
+    (tmp_path / f"{BUNDLE}.gz").write_bytes(gzip.compress(b"console.log('main');"))
+    (tmp_path / f"{BUNDLE}.br").write_bytes(b"brotli")
+    return StaticFileMiddleware(directory=tmp_path)
+
+
+def get(
+    static_files: StaticFileMiddleware, path: str, headers: dict[str, str] = {}
+) -> Response:
+    scope = {
+        "type": "http",
+        "method": "GET",
+        "path": path,
+        "headers": [
+            (name.lower().encode(), value.encode()) for name, value in headers.items()
+        ],
+    }
+    return asyncio.run(static_files.get_response(path.lstrip("/"), scope))
+
+
+def test_accepted_encodings():
+    assert accepted_encodings("gzip, deflate, br") == {"gzip", "deflate", "br"}
+    assert accepted_encodings("br;q=0, GZIP;q=0.5") == {"gzip"}
+    assert accepted_encodings("") == set()
+
+
+def test_serves_preferred_precompressed_sibling(static_files: StaticFileMiddleware):
+    response = get(static_files, f"/{BUNDLE}", {"Accept-Encoding": "gzip, br"})
+    assert response.headers["content-encoding"] == "br"
+    assert response.headers["content-type"].startswith(mimetypes.guess_type(BUNDLE)[0])
+    assert response.headers["content-length"] == str(len(b"brotli"))
+    assert response.headers["vary"] == "Accept-Encoding"
+
+    response = get(static_files, f"/{BUNDLE}", {"Accept-Encoding": "gzip"})
+    assert response.headers["content-encoding"] == "gzip"
+
+
+def test_serves_identity_without_accepted_sibling(static_files: StaticFileMiddleware):
+    response = get(static_files, f"/{BUNDLE}", {"Accept-Encoding": "deflate"})
+    assert "content-encoding" not in response.headers
+    assert response.headers["content-length"] == str(len("console.log('main');"))
+
+
+def test_cache_control(static_files: StaticFileMiddleware):
+    assert get(static_files, f"/{BUNDLE}").headers["cache-control"] == (
+        IMMUTABLE_CACHE_CONTROL
+    )
+    assert get(static_files, "/index.html").headers["cache-control"] == (
+        REVALIDATE_CACHE_CONTROL
+    )
+
+
+def test_not_modified(static_files: StaticFileMiddleware):
+    headers = {"Accept-Encoding": "br"}
+    etag = get(static_files, f"/{BUNDLE}", headers).headers["etag"]
+    response = get(static_files, f"/{BUNDLE}", {**headers, "If-None-Match": etag})
+    assert response.status_code == 304
+
+
+def test_unknown_path_serves_cached_index(
+    static_files: StaticFileMiddleware, tmp_path: Path
+):
+    response = get(static_files, "/coworking/reservation/1")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/html")
+
+    # The index is resolved once rather than statted per request.
+    os.remove(tmp_path / "index.html")
+    full_path, stat_result = static_files.lookup_path("organizations")
+    assert full_path == str(tmp_path / "index.html")
+    assert stat_result is not None
+
+
+def send_response(middleware: APIGZipMiddleware, path: str) -> list[dict]:
+    messages = []
+
+    async def send(message):
+        messages.append(message)
+
+    async def receive():
+        return {"type": "http.request"}
+
+    scope = {
+        "type": "http",
+        "method": "GET",
+        "path": path,
+        "headers": [(b"accept-encoding", b"gzip")],
+    }
+    asyncio.run(middleware(scope, receive, send))
+    return messages
+
+
+def test_api_responses_compressed_above_minimum_size():
+    async def app(scope, receive, send):
+        body = b"x" * int(scope["path"].rsplit("/", 1)[1])
+        await Response(body, media_type="application/json")(scope, receive, send)
+
+    middleware = APIGZipMiddleware(app, minimum_size=1024)
+
+    start = send_response(middleware, "/api/events/2048")[0]
+    assert (b"content-encoding", b"gzip") in start["headers"]
+
+    start = send_response(middleware, "/api/events/100")[0]
+    assert (b"content-encoding", b"gzip") not in start["headers"]
+
+    start = send_response(middleware, "/assets/2048")[0]
+    assert (b"content-encoding", b"gzip") not in start["headers"]
@@ -0,0 +1,57 @@
+"""Tests for the TTLCache used by process-level caches."""
+
+from datetime import timedelta
+from ...services.cache import TTLCache
+
+__authors__ = ["Kris Jordan"]
+__copyright__ = "Copyright 2023"
+__license__ = "MIT"
+
+
+def test_get_missing():
+    cache: TTLCache[str, int] = TTLCache(maxsize=2, ttl=timedelta(minutes=1))
+    assert cache.get("missing") is None
+
+
+def test_set_and_get():
+    cache: TTLCache[str, int] = TTLCache(maxsize=2, ttl=timedelta(minutes=1))
+    cache.set("a", 1)
+    assert cache.get("a") == 1
+
+
+def test_expired_entry():
+    cache: TTLCache[str, int] = TTLCache(maxsize=2, ttl=timedelta(minutes=1))
+    cache.set("a", 1, ttl=timedelta(seconds=-1))
+    assert cache.get("a") is None
+    assert len(cache) == 0
+
+
+def test_evicts_least_recently_used():
+    cache: TTLCache[str, int] = TTLCache(maxsize=2, ttl=timedelta(minutes=1))
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+    assert cache.get("a") == 1
+    assert cache.get("b") is None
+    assert cache.get("c") == 3
+
+
+def test_get_or_load():
+    cache: TTLCache[str, int] = TTLCache(maxsize=2, ttl=timedelta(minutes=1))
+    assert cache.get_or_load("a", lambda: 1) == 1
+    assert cache.get_or_load("a", lambda: 2) == 1
+
+
+def test_discard_if_and_clear():
+    cache: TTLCache[str, int] = TTLCache(maxsize=4, ttl=timedelta(minutes=1))
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.set("c", 3)
+    cache.discard_if(lambda _, value: value % 2 == 1)
+    assert cache.get("a") is None
+    assert cache.get("b") == 2
+    cache.pop("b")
+    assert cache.get("b") is None
+    cache.clear()
+    assert len(cache) == 0
@@ -1,5 +1,23 @@
-"""Shared pytest fixtures for database dependent tests."""
+"""Shared pytest fixtures for database dependent tests.
 
+The schema is created once per test run in a template database. Each test process clones the
+template into a database of its own, so tests may run in parallel with `pytest -n <workers>`.
+
+Each test then runs inside a transaction that is rolled back when the test ends, so the next
+test starts from the empty schema. The `session` fixture joins that transaction with
+savepoints: when a service commits, only its savepoint is released, and when it rolls back,
+only the work since its last commit is undone.
+
+Rolled back rows still occupy space in their tables, so rows inserted by later tests may be
+stored, and returned by queries without an ORDER BY, in a different order than inserted.
+Tests whose data must be committed, e.g. to be visible to other connections, or whose
+assertions depend on that order, are marked `@pytest.mark.committed`. They run against freshly
+truncated tables and their `session` commits to the database.
+"""
+
+import os
+import uuid
+import zlib
 import pytest
 
 from sqlalchemy import create_engine, text, Engine
@@ -9,22 +27,39 @@ from sqlalchemy.exc import OperationalError, ProgrammingError
 from ...database import _engine_str
 from ...env import getenv
 from ... import entities
+from ...services.coworking import coworking_cache
 
-POSTGRES_DATABASE = f'{getenv("POSTGRES_DATABASE")}_test'
+_WORKER = os.environ.get("PYTEST_XDIST_WORKER")
+POSTGRES_TEMPLATE_DATABASE = f'{getenv("POSTGRES_DATABASE")}_test_template'
+POSTGRES_DATABASE = f'{getenv("POSTGRES_DATABASE")}_test' + (
+    f"_{_WORKER}" if _WORKER else ""
+)
 POSTGRES_USER = getenv("POSTGRES_USER")
 
+# Identifies this test run, so that every parallel worker clones a template built by it.
+_TEST_RUN = os.environ.get("PYTEST_XDIST_TESTRUNUID", uuid.uuid4().hex)
+# Serializes building and cloning the template across parallel workers.
+_TEMPLATE_LOCK = zlib.crc32(POSTGRES_TEMPLATE_DATABASE.encode())
+
 __authors__ = ["Kris Jordan"]
 __copyright__ = "Copyright 2023"
 __license__ = "MIT"
 
 
-def reset_database():
+def pytest_configure(config: pytest.Config):
+    config.addinivalue_line(
+        "markers",
+        "committed: commit test data to the database rather than rolling back",
+    )
+
+
+def reset_database(database: str = POSTGRES_DATABASE, template: str | None = None):
     engine = create_engine(_engine_str(""))
     with engine.connect() as connection:
         try:
             conn = connection.execution_options(autocommit=False)
             conn.execute(text("ROLLBACK"))  # Get out of transactional mode...
-            conn.execute(text(f"DROP DATABASE {POSTGRES_DATABASE}"))
+            conn.execute(text(f"DROP DATABASE {database}"))
         except ProgrammingError:
             ...
         except OperationalError:
@@ -33,26 +68,97 @@ def reset_database():
             )
             exit(1)
 
-        conn.execute(text(f"CREATE DATABASE {POSTGRES_DATABASE}"))
+        template_clause = f" TEMPLATE {template}" if template else ""
+        conn.execute(text(f"CREATE DATABASE {database}{template_clause}"))
         conn.execute(
-            text(
-                f"GRANT ALL PRIVILEGES ON DATABASE {POSTGRES_DATABASE} TO {POSTGRES_USER}"
-            )
+            text(f"GRANT ALL PRIVILEGES ON DATABASE {database} TO {POSTGRES_USER}")
         )
+    engine.dispose()
+
+
+def _build_template() -> None:
+    """Create the schema in the template database unless this test run already has."""
+    engine = create_engine(_engine_str(""), isolation_level="AUTOCOMMIT")
+    with engine.connect() as connection:
+        connection.execute(text(f"SELECT pg_advisory_lock({_TEMPLATE_LOCK})"))
+        try:
+            built_by = connection.scalar(
+                text(
+                    "SELECT shobj_description(oid, 'pg_database') FROM pg_database "
+                    "WHERE datname = :database"
+                ),
+                {"database": POSTGRES_TEMPLATE_DATABASE},
+            )
+            if built_by != _TEST_RUN:
+                reset_database(POSTGRES_TEMPLATE_DATABASE)
+                template_engine = create_engine(_engine_str(POSTGRES_TEMPLATE_DATABASE))
+                entities.EntityBase.metadata.create_all(template_engine)
+                _disable_autovacuum(template_engine)
+                template_engine.dispose()
+                connection.execute(
+                    text(
+                        f"COMMENT ON DATABASE {POSTGRES_TEMPLATE_DATABASE} "
+                        f"IS '{_TEST_RUN}'"
+                    )
+                )
+            reset_database(POSTGRES_DATABASE, template=POSTGRES_TEMPLATE_DATABASE)
+        finally:
+            connection.execute(text(f"SELECT pg_advisory_unlock({_TEMPLATE_LOCK})"))
+    engine.dispose()
+
+
+def _disable_autovacuum(engine: Engine) -> None:
+    """Keep autovacuum from reusing the space of rolled back rows and from updating planner
+    statistics mid-run, which would make test outcomes depend on the order tests ran in.
+    """
+    with engine.begin() as connection:
+        for table in entities.EntityBase.metadata.sorted_tables:
+            connection.execute(
+                text(f'ALTER TABLE "{table.name}" SET (autovacuum_enabled = false)')
+            )
 
 
 @pytest.fixture(scope="session")
 def test_engine() -> Engine:
-    reset_database()
+    _build_template()
     return create_engine(_engine_str(POSTGRES_DATABASE))
 
 
 @pytest.fixture(scope="function")
-def session(test_engine: Engine):
-    entities.EntityBase.metadata.drop_all(test_engine)
-    entities.EntityBase.metadata.create_all(test_engine)
+def session(test_engine: Engine, request: pytest.FixtureRequest):
+    # Snapshots of the previous test's database must not leak into this one.
+    coworking_cache.invalidate_all()
+    if request.node.get_closest_marker("committed"):
+        yield from _committed_session(test_engine)
+    else:
+        yield from _rolled_back_session(test_engine)
+
+
+def _rolled_back_session(test_engine: Engine):
+    connection = test_engine.connect()
+    transaction = connection.begin()
+    session = Session(bind=connection, join_transaction_mode="create_savepoint")
+    try:
+        yield session
+    finally:
+        session.close()
+        transaction.rollback()
+        connection.close()
+
+
+def _committed_session(test_engine: Engine):
+    _truncate_all(test_engine)
     session = Session(test_engine)
     try:
         yield session
     finally:
         session.close()
+        _truncate_all(test_engine)
+
+
+def _truncate_all(test_engine: Engine) -> None:
+    tables = ", ".join(
+        f'"{table.name}"' for table in entities.EntityBase.metadata.sorted_tables
+    )
+    with test_engine.begin() as connection:
+        connection.execute(text(f"TRUNCATE {tables} RESTART IDENTITY CASCADE"))
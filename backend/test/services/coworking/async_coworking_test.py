@@ -0,0 +1,83 @@
+"""Tests for the AsyncCoworkingService facade."""
+
+import asyncio
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.pool import NullPool
+
+from ....database import _engine_str
+from ....services.coworking import ReservationService
+from ....services.coworking.async_coworking import AsyncCoworkingService
+from ....models.coworking import ReservationState
+from ..conftest import POSTGRES_DATABASE
+
+# Imported fixtures provide dependencies injected for the tests as parameters.
+from .fixtures import (
+    reservation_svc,
+    permission_svc,
+    seat_svc,
+    policy_svc,
+    operating_hours_svc,
+)
+from .time import *
+
+# Since there are relationship dependencies between the entities, order matters.
+from ..core_data import setup_insert_data_fixture as insert_order_0
+from .operating_hours_data import fake_data_fixture as insert_order_1
+from ..room_data import fake_data_fixture as insert_order_2
+from .seat_data import fake_data_fixture as insert_order_3
+from .reservation.reservation_data import fake_data_fixture as insert_order_4
+
+from ..core_data import user_data
+from .reservation import reservation_data
+
+__authors__ = ["Kris Jordan"]
+__copyright__ = "Copyright 2023"
+__license__ = "MIT"
+
+# The service under test reads the fixture data through its own connection.
+pytestmark = pytest.mark.committed
+
+
+def _run(operation):
+    """Run a coroutine function against an AsyncCoworkingService on the test database."""
+
+    async def with_service():
+        engine = create_async_engine(
+            _engine_str(POSTGRES_DATABASE, "postgresql+asyncpg"), poolclass=NullPool
+        )
+        try:
+            async with AsyncSession(engine) as session:
+                return await operation(AsyncCoworkingService(session))
+        finally:
+            await engine.dispose()
+
+    return asyncio.run(with_service())
+
+
+def test_get_coworking_status(reservation_svc: ReservationService):
+    status = _run(lambda svc: svc.get_coworking_status(user_data.user))
+    assert status.my_reservations == reservation_svc.get_current_reservations_for_user(
+        user_data.user, user_data.user
+    )
+    assert len(status.operating_hours) > 0
+
+
+def test_list_all_active_and_upcoming_for_xl(reservation_svc: ReservationService):
+    reservations = _run(
+        lambda svc: svc.list_all_active_and_upcoming_for_xl(user_data.ambassador)
+    )
+    assert reservations == reservation_svc.list_all_active_and_upcoming_for_xl(
+        user_data.ambassador
+    )
+
+
+def test_draft_reservation(time: dict[str, datetime]):
+    reservation = _run(
+        lambda svc: svc.draft_reservation(
+            user_data.ambassador, reservation_data.test_request()
+        )
+    )
+    assert reservation.id is not None
+    assert reservation.state == ReservationState.DRAFT
+    assert reservation.users[0].id == user_data.ambassador.id
@@ -0,0 +1,117 @@
+"""Unit tests for the seat availability interval engine."""
+
+from ....services.coworking.availability_engine import (
+    merge_intervals,
+    subtract_intervals,
+    seat_free_windows,
+    group_free_window,
+    compact_group,
+)
+from .time import *
+
+__authors__ = ["Kris Jordan"]
+__copyright__ = "Copyright 2023"
+__license__ = "MIT"
+
+
+def test_merge_intervals_coalesces_overlaps(time: dict[str, datetime]):
+    merged = merge_intervals(
+        [
+            (time[IN_ONE_HOUR], time[IN_THREE_HOURS]),
+            (time[NOW], time[IN_THIRTY_MINUTES]),
+            (time[IN_THIRTY_MINUTES], time[IN_ONE_HOUR]),
+        ]
+    )
+    assert merged == [(time[NOW], time[IN_THREE_HOURS])]
+
+
+def test_subtract_intervals_no_blocks(time: dict[str, datetime]):
+    windows = [(time[NOW], time[IN_ONE_HOUR])]
+    assert subtract_intervals(windows, []) == windows
+
+
+def test_subtract_intervals_splits_window(time: dict[str, datetime]):
+    windows = [(time[NOW], time[IN_THREE_HOURS])]
+    blocks = [(time[IN_ONE_HOUR], time[IN_TWO_HOURS])]
+    assert subtract_intervals(windows, blocks) == [
+        (time[NOW], time[IN_ONE_HOUR]),
+        (time[IN_TWO_HOURS], time[IN_THREE_HOURS]),
+    ]
+
+
+def test_subtract_intervals_block_spans_windows(time: dict[str, datetime]):
+    windows = [
+        (time[NOW], time[IN_ONE_HOUR]),
+        (time[IN_TWO_HOURS], time[IN_THREE_HOURS]),
+    ]
+    blocks = [(time[IN_THIRTY_MINUTES], time[IN_TWO_HOURS] + THIRTY_MINUTES)]
+    assert subtract_intervals(windows, blocks) == [
+        (time[NOW], time[IN_THIRTY_MINUTES]),
+        (time[IN_TWO_HOURS] + THIRTY_MINUTES, time[IN_THREE_HOURS]),
+    ]
+
+
+def test_subtract_intervals_adjacent_block(time: dict[str, datetime]):
+    windows = [(time[IN_ONE_HOUR], time[IN_TWO_HOURS])]
+    blocks = [(time[NOW], time[IN_ONE_HOUR])]
+    assert subtract_intervals(windows, blocks) == windows
+
+
+def test_seat_free_windows(time: dict[str, datetime]):
+    open_windows = [(time[NOW], time[IN_TWO_HOURS])]
+    reservations = [
+        (1, time[NOW], time[IN_TWO_HOURS] - FIVE_MINUTES),
+        (2, time[IN_ONE_HOUR], time[IN_TWO_HOURS]),
+        (99, time[NOW], time[IN_TWO_HOURS]),
+    ]
+    free = seat_free_windows([1, 2, 3], open_windows, reservations, THIRTY_MINUTES)
+    assert 1 not in free
+    assert 99 not in free
+    assert free[2] == [(time[NOW], time[IN_ONE_HOUR])]
+    assert free[3] == open_windows
+
+
+def test_group_free_window_earliest_common_start(time: dict[str, datetime]):
+    free_windows = {
+        1: [
+            (time[NOW], time[IN_THIRTY_MINUTES]),
+            (time[IN_TWO_HOURS], time[IN_THREE_HOURS]),
+        ],
+        2: [(time[IN_ONE_HOUR], time[IN_THREE_HOURS])],
+        3: [(time[NOW], time[IN_EIGHT_HOURS])],
+    }
+    positions = {1: (0, 0), 2: (1, 0), 3: (2, 0)}
+    group = group_free_window(free_windows, positions, 3, THIRTY_MINUTES)
+    assert group == ([1, 2, 3], (time[IN_TWO_HOURS], time[IN_THREE_HOURS]))
+
+
+def test_group_free_window_skips_windows_too_short(time: dict[str, datetime]):
+    free_windows = {
+        1: [(time[NOW], time[IN_THIRTY_MINUTES])],
+        2: [(time[NOW] + FIVE_MINUTES, time[IN_THREE_HOURS])],
+    }
+    positions = {1: (0, 0), 2: (1, 0)}
+    assert group_free_window(free_windows, positions, 2, THIRTY_MINUTES) is None
+    assert group_free_window(free_windows, positions, 2, FIVE_MINUTES) == (
+        [1, 2],
+        (time[NOW] + FIVE_MINUTES, time[IN_THIRTY_MINUTES]),
+    )
+
+
+def test_group_free_window_too_few_seats(time: dict[str, datetime]):
+    free_windows = {1: [(time[NOW], time[IN_ONE_HOUR])]}
+    assert group_free_window(free_windows, {1: (0, 0)}, 2, THIRTY_MINUTES) is None
+
+
+def test_compact_group_prefers_adjacent_seats(time: dict[str, datetime]):
+    ends = {seat_id: time[IN_ONE_HOUR] for seat_id in range(1, 6)}
+    # Seats 1, 2 and 3 share a spaced out row far from 4 and 5, which sit side by side.
+    positions = {1: (0, 0), 2: (2, 0), 3: (4, 0), 4: (10, 5), 5: (10, 6)}
+    assert compact_group(ends, positions, 2) == [4, 5]
+    assert compact_group(ends, positions, 3) == [1, 2, 3]
+
+
+def test_compact_group_ties_favor_longest_common_end(time: dict[str, datetime]):
+    ends = {1: time[IN_ONE_HOUR], 2: time[IN_THREE_HOURS], 3: time[IN_THREE_HOURS]}
+    positions = {1: (0, 0), 2: (1, 0), 3: (2, 0)}
+    assert compact_group(ends, positions, 2) == [2, 3]
@@ -27,9 +27,7 @@ future: OperatingHours
 all: list[OperatingHours] = []
 
 
-def insert_fake_data(session: Session, time: dict[str, datetime]):
-    """Fake data insert factored out of the fixture for use in dev reset scripts."""
-
+def instantiate_global_models(time: dict[str, datetime]):
     # We're definining these values here so that they can depend on times generated per
     # test run.
     global today, future, tomorrow, all
@@ -47,6 +45,11 @@ def insert_fake_data(session: Session, time: dict[str, datetime]):
     )
     all = [today, future, tomorrow]
 
+
+def insert_fake_data(session: Session, time: dict[str, datetime]):
+    """Fake data insert factored out of the fixture for use in dev reset scripts."""
+    instantiate_global_models(time)
+
     for operating_hours in all:
         entity = OperatingHoursEntity.from_model(operating_hours)
         session.add(entity)
@@ -1,6 +1,7 @@
 """Tests for Coworking Operating Hours Service."""
 
 from unittest.mock import create_autospec, call
+from zoneinfo import ZoneInfo
 
 from ....services.coworking import OperatingHoursService
 from ....models.coworking import OperatingHours, TimeRange
@@ -55,6 +56,19 @@ def test_schedule_multiple_match(
     assert result[1].id == operating_hours_data.future.id
 
 
+def test_schedule_timezone_aware(
+    operating_hours_svc: OperatingHoursService, time: dict[str, datetime]
+):
+    """Time zone aware ranges are compared in the XL's local time, like stored hours."""
+    eastern = ZoneInfo("America/New_York")
+    time_range = TimeRange(
+        start=time[NOW].replace(tzinfo=eastern),
+        end=time[IN_ONE_HOUR].replace(tzinfo=eastern),
+    )
+    result: list[OperatingHours] = operating_hours_svc.schedule(time_range)
+    assert [entry.id for entry in result] == [operating_hours_data.today.id]
+
+
 def test_create(operating_hours_svc: OperatingHoursService, time: dict[str, datetime]):
     """Creating an Operating Hours entity expected case."""
     time_range = TimeRange(
@@ -65,6 +79,19 @@ def test_create(operating_hours_svc: OperatingHoursService, time: dict[str, date
     assert result.id is not None
 
 
+def test_create_invalidates_schedule(
+    operating_hours_svc: OperatingHoursService, time: dict[str, datetime]
+):
+    """Creating Operating Hours discards the cached schedule."""
+    time_range = TimeRange(
+        start=time[TOMORROW] + timedelta(days=5),
+        end=time[TOMORROW] + timedelta(days=5, hours=2),
+    )
+    assert operating_hours_svc.schedule(time_range) == []
+    created = operating_hours_svc.create(user_data.root, time_range)
+    assert operating_hours_svc.schedule(time_range) == [created]
+
+
 def test_create_overlap(operating_hours_svc: OperatingHoursService):
     """Creating an Operating Hours entity that overlaps with another raises OperatingHoursCannotOverlapException"""
     with pytest.raises(OperatingHoursCannotOverlapException):
@@ -104,6 +131,15 @@ def test_delete(operating_hours_svc: OperatingHoursService):
         future = operating_hours_svc.get_by_id(operating_hours_data.future.id)  # type: ignore
 
 
+def test_delete_invalidates_schedule(operating_hours_svc: OperatingHoursService):
+    """Deleting Operating Hours discards the cached schedule."""
+    future = operating_hours_data.future
+    time_range = TimeRange(start=future.start, end=future.end)
+    assert len(operating_hours_svc.schedule(time_range)) == 1
+    operating_hours_svc.delete(user_data.root, future)
+    assert operating_hours_svc.schedule(time_range) == []
+
+
 def test_delete_permissions(operating_hours_svc: OperatingHoursService):
     """Delete an Operating Hours entity expected case."""
     permission_svc = create_autospec(PermissionService)
@@ -182,12 +182,12 @@ def test_change_reservation_change_start_not_implemented(
         )
 
 
-def test_change_reservation_change_end_not_implemented(
+def test_change_reservation_change_end_not_yet_extendable(
     reservation_svc: ReservationService, time: dict[str, datetime]
 ):
-    """This test is for 100% coverage but should be replaced with actual tests for when
-    changing a reservation end time has logic implemented."""
-    with pytest.raises(NotImplementedError):
+    """Later ends are extensions, which are only possible shortly before a reservation ends
+    (see extend_test.py)."""
+    with pytest.raises(ReservationException):
         reservation_svc.change_reservation(
             user_data.ambassador,
             ReservationPartial(
@@ -6,7 +6,7 @@ from unittest.mock import create_autospec
 from .....services import PermissionService
 from .....services.coworking import ReservationService
 from .....services.coworking.reservation import ReservationException
-from .....models.coworking import ReservationState
+from .....models.coworking import ReservationState, SeatProximity
 
 from .....models.user import UserIdentity
 from .....models.coworking.seat import SeatIdentity
@@ -287,10 +287,106 @@ def test_draft_reservation_permissions(reservation_svc: ReservationService):
     )
 
 
-def test_draft_reservation_multiple_users_not_implemented(
+def test_draft_reservation_near_seat(reservation_svc: ReservationService):
+    """A seat is chosen near the seat of a friend."""
+    reservation = reservation_svc.draft_reservation(
+        user_data.ambassador,
+        reservation_data.test_request(
+            {
+                "seats": [
+                    SeatIdentity(**seat_data.monitor_seat_01.model_dump()),
+                    SeatIdentity(**seat_data.monitor_seat_11.model_dump()),
+                ]
+            }
+        ),
+        near=seat_data.monitor_seat_10.id,
+    )
+    assert reservation.seats[0].id == seat_data.monitor_seat_11.id
+
+
+def test_draft_reservation_apart(reservation_svc: ReservationService):
+    """A seat is chosen away from the occupied seats."""
+    reservation = reservation_svc.draft_reservation(
+        user_data.ambassador,
+        reservation_data.test_request(
+            {"seats": [SeatIdentity(**seat.model_dump()) for seat in seat_data.seats]}
+        ),
+        near=SeatProximity.APART,
+    )
+    assert reservation.seats[0].id == seat_data.monitor_seat_11.id
+
+
+def test_draft_reservation_apart_from_unrequested_seats(
     reservation_svc: ReservationService,
 ):
-    with pytest.raises(NotImplementedError):
+    """Seats occupied by others count even when they are not among the requested seats."""
+    reservation = reservation_svc.draft_reservation(
+        user_data.ambassador,
+        reservation_data.test_request(
+            {
+                "seats": [
+                    SeatIdentity(**seat.model_dump())
+                    for seat in seat_data.seats
+                    if seat.id != seat_data.monitor_seat_00.id
+                ]
+            }
+        ),
+        near=SeatProximity.APART,
+    )
+    assert reservation.seats[0].id == seat_data.monitor_seat_11.id
+
+
+def test_draft_reservation_group_adjacent_seats(reservation_svc: ReservationService):
+    """A group is seated together in the open seats nearest each other."""
+    reservation = reservation_svc.draft_reservation(
+        user_data.ambassador,
+        reservation_data.test_request(
+            {
+                "users": [
+                    UserIdentity(**user_data.root.model_dump()),
+                    UserIdentity(**user_data.ambassador.model_dump()),
+                ],
+                "seats": [
+                    SeatIdentity(**seat.model_dump()) for seat in seat_data.seats
+                ],
+            }
+        ),
+    )
+    assert reservation.state == ReservationState.DRAFT
+    assert len(reservation.users) == 2
+    assert {seat.id for seat in reservation.seats} == {
+        seat_data.monitor_seat_01.id,
+        seat_data.monitor_seat_11.id,
+    }
+
+
+def test_draft_reservation_group_common_window(reservation_svc: ReservationService):
+    """A group starts once every one of its seats is free."""
+    reservation = reservation_svc.draft_reservation(
+        user_data.ambassador,
+        reservation_data.test_request(
+            {
+                "users": [
+                    UserIdentity(**user_data.root.model_dump()),
+                    UserIdentity(**user_data.ambassador.model_dump()),
+                ],
+                "end": reservation_data.reservation_1.end + ONE_HOUR,
+                "seats": [
+                    SeatIdentity(**seat_data.monitor_seat_00.model_dump()),
+                    SeatIdentity(**seat_data.monitor_seat_10.model_dump()),
+                ],
+            }
+        ),
+    )
+    assert_equal_times(reservation_data.reservation_1.end, reservation.start)
+    assert {seat.id for seat in reservation.seats} == {
+        seat_data.monitor_seat_00.id,
+        seat_data.monitor_seat_10.id,
+    }
+
+
+def test_draft_reservation_group_too_few_seats(reservation_svc: ReservationService):
+    with pytest.raises(ReservationException):
         reservation_svc.draft_reservation(
             user_data.ambassador,
             reservation_data.test_request(
@@ -298,6 +394,26 @@ def test_draft_reservation_multiple_users_not_implemented(
                     "users": [
                         UserIdentity(**user_data.root.model_dump()),
                         UserIdentity(**user_data.ambassador.model_dump()),
+                        UserIdentity(**user_data.user.model_dump()),
+                    ],
+                    "seats": [
+                        SeatIdentity(**seat_data.monitor_seat_01.model_dump()),
+                        SeatIdentity(**seat_data.monitor_seat_11.model_dump()),
+                    ],
+                }
+            ),
+        )
+
+
+def test_draft_reservation_group_invalid_user(reservation_svc: ReservationService):
+    with pytest.raises(ReservationException):
+        reservation_svc.draft_reservation(
+            user_data.ambassador,
+            reservation_data.test_request(
+                {
+                    "users": [
+                        UserIdentity(**user_data.ambassador.model_dump()),
+                        UserIdentity(id=404),
                     ]
                 }
             ),
@@ -0,0 +1,208 @@
+"""ReservationService#extend_reservation and #get_reservation_extension method tests"""
+
+import pytest
+from sqlalchemy.orm import Session
+
+from .....services.coworking import ReservationService
+from .....services.coworking.reservation import ReservationException
+from .....entities.coworking import (
+    OperatingHoursEntity,
+    ReservationEntity,
+    SeatEntity,
+)
+from .....entities import UserEntity
+from .....models.coworking import ReservationState
+from .....models.coworking.reservation import ReservationPartial
+
+# Imported fixtures provide dependencies injected for the tests as parameters.
+# Dependent fixtures (seat_svc) are required to be imported in the testing module.
+from ..fixtures import (
+    reservation_svc,
+    permission_svc,
+    seat_svc,
+    policy_svc,
+    operating_hours_svc,
+)
+from ..time import *
+
+# Import the setup_teardown fixture explicitly to load entities in database.
+# The order in which these fixtures run is dependent on their imported alias.
+# Since there are relationship dependencies between the entities, order matters.
+from ...core_data import setup_insert_data_fixture as insert_order_0
+from ..operating_hours_data import fake_data_fixture as insert_order_1
+from ...room_data import fake_data_fixture as insert_order_2
+from ..seat_data import fake_data_fixture as insert_order_3
+from .reservation_data import fake_data_fixture as insert_order_4
+
+# Import the fake model data in a namespace for test assertions
+from ...core_data import user_data
+from .. import operating_hours_data
+from .. import seat_data
+from . import reservation_data
+
+__authors__ = ["Kris Jordan"]
+__copyright__ = "Copyright 2023"
+__license__ = "MIT"
+
+
+def end_reservation_at(session: Session, id: int, end: datetime) -> None:
+    entity = session.get(ReservationEntity, id)
+    entity.end = end
+    session.commit()
+
+
+def reserve_seat(session: Session, user_id: int, seat_id: int, start: datetime) -> None:
+    session.add(
+        ReservationEntity(
+            start=start,
+            end=start + ONE_HOUR,
+            state=ReservationState.CONFIRMED,
+            walkin=False,
+            users=[session.get(UserEntity, user_id)],
+            seats=[session.get(SeatEntity, seat_id)],
+        )
+    )
+    session.commit()
+
+
+def test_extension_not_yet_open(reservation_svc: ReservationService):
+    """Reservations are extended only near their end."""
+    details = reservation_svc.get_reservation_extension(
+        user_data.user, reservation_data.reservation_1.id
+    )
+    assert not details.extendable
+    assert len(details.errors) == 1
+    assert details.extendable_until is None
+    assert_equal_times(
+        reservation_data.reservation_1.end
+        - reservation_svc._policy_svc.extend_window(user_data.user),
+        details.extendable_at,
+    )
+
+
+def test_extension_by_extend_duration(
+    reservation_svc: ReservationService, session: Session, time: dict[str, datetime]
+):
+    end = time[NOW] + FIVE_MINUTES
+    end_reservation_at(session, reservation_data.reservation_1.id, end)
+    details = reservation_svc.get_reservation_extension(
+        user_data.user, reservation_data.reservation_1.id
+    )
+    assert details.extendable
+    assert details.errors == []
+    assert_equal_times(end + ONE_HOUR, details.extendable_until)
+
+
+def test_extension_until_next_reservation_of_seat(
+    reservation_svc: ReservationService, session: Session, time: dict[str, datetime]
+):
+    end = time[NOW] + FIVE_MINUTES
+    end_reservation_at(session, reservation_data.reservation_1.id, end)
+    next_start = end + THIRTY_MINUTES
+    reserve_seat(session, user_data.root.id, seat_data.monitor_seat_00.id, next_start)
+    reservation = reservation_svc.extend_reservation(
+        user_data.user, reservation_data.reservation_1.id
+    )
+    assert_equal_times(next_start, reservation.end)
+
+
+def test_extension_blocked_by_next_reservation(
+    reservation_svc: ReservationService, session: Session, time: dict[str, datetime]
+):
+    end = time[NOW] + FIVE_MINUTES
+    end_reservation_at(session, reservation_data.reservation_1.id, end)
+    reserve_seat(
+        session, user_data.root.id, seat_data.monitor_seat_00.id, end + ONE_MINUTE
+    )
+    with pytest.raises(ReservationException):
+        reservation_svc.extend_reservation(
+            user_data.user, reservation_data.reservation_1.id
+        )
+
+
+def test_extension_blocked_by_next_reservation_of_user(
+    reservation_svc: ReservationService, session: Session, time: dict[str, datetime]
+):
+    """Users may not extend into another of their reservations, even of another seat."""
+    end = time[NOW] + FIVE_MINUTES
+    end_reservation_at(session, reservation_data.reservation_1.id, end)
+    reserve_seat(
+        session, user_data.user.id, seat_data.monitor_seat_01.id, end + ONE_MINUTE
+    )
+    details = reservation_svc.get_reservation_extension(
+        user_data.user, reservation_data.reservation_1.id
+    )
+    assert not details.extendable
+
+
+def test_next_reservation_ignores_no_shows(
+    reservation_svc: ReservationService, session: Session, time: dict[str, datetime]
+):
+    """Confirmed reservations past their check-in window no longer hold their seats."""
+    end_reservation_at(session, reservation_data.reservation_1.id, time[AN_HOUR_AGO])
+    no_show_start = time[AN_HOUR_AGO] + FIVE_MINUTES
+    reserve_seat(
+        session, user_data.root.id, seat_data.monitor_seat_00.id, no_show_start
+    )
+    awaited_start = time[NOW] - FIVE_MINUTES
+    reserve_seat(
+        session, user_data.root.id, seat_data.monitor_seat_00.id, awaited_start
+    )
+
+    entity = session.get(ReservationEntity, reservation_data.reservation_1.id)
+    next_start = reservation_svc._next_reservation_start(entity, time[IN_ONE_HOUR])
+    assert_equal_times(awaited_start, next_start)
+
+
+def test_extension_until_xl_closes(
+    reservation_svc: ReservationService, session: Session, time: dict[str, datetime]
+):
+    closes = time[NOW] + THIRTY_MINUTES
+    session.get(OperatingHoursEntity, operating_hours_data.today.id).end = closes
+    end_reservation_at(
+        session, reservation_data.reservation_1.id, time[NOW] + FIVE_MINUTES
+    )
+    details = reservation_svc.get_reservation_extension(
+        user_data.user, reservation_data.reservation_1.id
+    )
+    assert details.extendable
+    assert_equal_times(closes, details.extendable_until)
+
+
+def test_extension_of_inactive_reservation(reservation_svc: ReservationService):
+    details = reservation_svc.get_reservation_extension(
+        user_data.root, reservation_data.reservation_3.id
+    )
+    assert not details.extendable
+    with pytest.raises(ReservationException):
+        reservation_svc.extend_reservation(
+            user_data.root, reservation_data.reservation_3.id
+        )
+
+
+def test_change_reservation_end_extends(
+    reservation_svc: ReservationService, session: Session, time: dict[str, datetime]
+):
+    end = time[NOW] + FIVE_MINUTES
+    end_reservation_at(session, reservation_data.reservation_1.id, end)
+    reservation = reservation_svc.change_reservation(
+        user_data.user,
+        ReservationPartial(
+            id=reservation_data.reservation_1.id, end=end + THIRTY_MINUTES
+        ),
+    )
+    assert_equal_times(end + THIRTY_MINUTES, reservation.end)
+
+
+def test_change_reservation_end_beyond_extendable_until(
+    reservation_svc: ReservationService, session: Session, time: dict[str, datetime]
+):
+    end = time[NOW] + FIVE_MINUTES
+    end_reservation_at(session, reservation_data.reservation_1.id, end)
+    with pytest.raises(ReservationException):
+        reservation_svc.change_reservation(
+            user_data.user,
+            ReservationPartial(
+                id=reservation_data.reservation_1.id, end=end + 2 * ONE_HOUR
+            ),
+        )
@@ -4,7 +4,11 @@ from backend.models.coworking.availability import RoomState
 from backend.models.coworking.reservation import ReservationState
 from datetime import date
 
+from sqlalchemy.orm import Session
+
 from .....services.coworking import ReservationService
+from .....entities import UserEntity
+from .....entities.coworking import ReservationEntity
 
 # Imported fixtures provide dependencies injected for the tests as parameters.
 # Dependent fixtures (seat_svc) are required to be imported in the testing module.
@@ -29,6 +33,8 @@ from .reservation_data import fake_data_fixture as insert_order_4
 
 # Import the fake model data in a namespace for test assertions
 from ...core_data import user_data
+from ... import room_data
+from .. import operating_hours_data
 from .. import seat_data
 from . import reservation_data
 
@@ -42,51 +48,6 @@ __license__ = "MIT"
 SATURDAY, SUNDAY = [5, 6]
 
 
-def test_transform_date_map_for_unavailable_simple(reservation_svc: ReservationService):
-    """
-    Validates the transformation of the date map to indicate unavailable time slots.
-    
-    This test ensures that time slots are appropriately grayed out for all other rooms
-    once a user has made a reservation. For example, if Sally Student reserves room SN135
-    from 1 pm to 3 pm on February 29, she should be prevented from booking any other room
-    during these hours. The function verifies that the data map returned by the endpoint
-    accurately reflects these unavailable slots, enhancing the user experience by
-    preventing double bookings.
-    """
-    
-    sample_date_map_1 = {
-        'SN135': [0, 0, 0, 0],
-        'SN137': [0, 0, 4, 4],
-        'SN139': [0, 0, 0, 0]
-    }
-
-    expected_transformed_date_map_1 = {
-        'SN135': [0, 0, 3, 3],
-        'SN137': [0, 0, 4, 4],
-        'SN139': [0, 0, 3, 3]
-    }
-
-    reservation_svc._transform_date_map_for_unavailable(sample_date_map_1)
-    assert sample_date_map_1 == expected_transformed_date_map_1
-
-
-def test_transform_date_map_for_unavailable_complex(reservation_svc: ReservationService):    
-    sample_date_map_2 = {
-        'SN135': [0, 0, 0, 0, 0, 0, 1, 1, 1, 1],
-        'SN137': [0, 0, 1, 1, 4, 4, 4, 4, 0, 0],
-        'SN139': [0, 4, 4, 1, 1, 0, 0, 0, 0, 0]
-    }
-
-    expected_transformed_date_map_2 = {
-        'SN135': [0, 3, 3, 0, 3, 3, 1, 1, 1, 1],
-        'SN137': [0, 3, 1, 1, 4, 4, 4, 4, 0, 0],
-        'SN139': [0, 4, 4, 1, 1, 3, 3, 3, 0, 0]
-    }
-
-    reservation_svc._transform_date_map_for_unavailable(sample_date_map_2)
-    assert expected_transformed_date_map_2 == sample_date_map_2
-
-
 def test_idx_calculation(reservation_svc: ReservationService):
     time_1 = datetime.now().replace(hour=10, minute=12)
     oh_start = datetime.now().replace(hour=10, minute=0)
@@ -114,14 +75,6 @@ def test_round_idx_calculation(reservation_svc: ReservationService):
     assert rounded_time3.hour == 10 and rounded_time3.minute == 30
     assert rounded_time4.hour == 18 and rounded_time4.minute == 0 
 
-def test_query_confirmed_reservations_by_date_and_room(
-    reservation_svc: ReservationService, time: dict[str, datetime]
-):
-    """Test getting all reservations for a particular date."""
-    reservations = reservation_svc._query_confirmed_reservations_by_date_and_room(time[NOW], None)
-    assert True
-    #TODO: Add in better assert statements here. 
-
 def test_get_reservable_rooms(reservation_svc: ReservationService):
     # Hardcoded for now, and this might change depending on which rooms are labeled as reservable.
     rooms = reservation_svc._get_reservable_rooms()
@@ -131,13 +84,6 @@ def test_get_reservable_rooms(reservation_svc: ReservationService):
     assert rooms[3].id == 'SN141' and rooms[3].reservable is True
 
 
-def test_query_xl_reservations_by_date_for_user(reservation_svc: ReservationService, time: dict[str, datetime]):
-    reservations = reservation_svc._query_xl_reservations_by_date_for_user(time[NOW], user_data.user)
-    assert len(reservations) == 1
-    assert reservations[0].room is None
-    assert reservations[0].users[0].first_name == 'Sally'
-
-
 def test_get_map_reserved_times_by_date(
     reservation_svc: ReservationService, time: dict[str, datetime]
 ):
@@ -157,4 +103,75 @@ def test_get_map_reserved_times_by_date(
         test_time, user_data.root
     )
 
-    assert True
\ No newline at end of file
+    assert True
+
+def test_query_room_map_reservations_by_date(reservation_svc: ReservationService):
+    """Room reservations for every room are fetched in one query with the subject's flagged."""
+    date = reservation_data.reservation_6.start
+    rows = reservation_svc._query_room_map_reservations_by_date(date, user_data.user)
+    assert (
+        reservation_data.reservation_6.room.id,
+        reservation_data.reservation_6.start,
+        reservation_data.reservation_6.end,
+        True,
+    ) in rows
+
+    rows = reservation_svc._query_room_map_reservations_by_date(date, user_data.root)
+    assert all(not is_subject for _, _, _, is_subject in rows)
+
+
+def test_query_room_map_reservations_by_date_includes_subject_xl(
+    reservation_svc: ReservationService, time: dict[str, datetime]
+):
+    rows = reservation_svc._query_room_map_reservations_by_date(
+        time[NOW], user_data.user
+    )
+    xl_rows = [row for row in rows if row[0] is None]
+    assert len(xl_rows) == 1
+    assert xl_rows[0][3] is True
+
+    rows = reservation_svc._query_room_map_reservations_by_date(
+        time[NOW], user_data.user, include_xl=False
+    )
+    assert all(room_id is not None for room_id, _, _, _ in rows)
+
+
+def test_query_room_map_reservations_by_date_subject_xl_reservation(
+    reservation_svc: ReservationService, time: dict[str, datetime]
+):
+    """The subject's XL reservations are returned without a room."""
+    rows = reservation_svc._query_room_map_reservations_by_date(
+        time[NOW], user_data.user
+    )
+    assert (
+        None,
+        reservation_data.reservation_1.start,
+        reservation_data.reservation_1.end,
+        True,
+    ) in rows
+
+
+def test_get_map_reserved_times_by_date_ignores_xl_room_reservations(
+    reservation_svc: ReservationService, session: Session, time: dict[str, datetime]
+):
+    """Only the subject's XL (seat) reservations occupy the XL row and gray out the other
+    rooms, not reservations made for the XL room itself."""
+    date = time[NOW] + 2 * ONE_DAY
+    expected = reservation_svc.get_map_reserved_times_by_date(date, user_data.user)
+
+    session.add(
+        ReservationEntity(
+            start=operating_hours_data.future.start + ONE_HOUR,
+            end=operating_hours_data.future.start + 2 * ONE_HOUR,
+            state=ReservationState.CONFIRMED,
+            walkin=False,
+            room_id=room_data.the_xl.id,
+            users=[session.get(UserEntity, user_data.user.id)],
+            seats=[],
+        )
+    )
+    session.commit()
+
+    assert (
+        reservation_svc.get_map_reserved_times_by_date(date, user_data.user) == expected
+    )
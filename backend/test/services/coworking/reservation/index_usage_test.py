@@ -0,0 +1,188 @@
+"""Regression tests asserting reservation queries are served by their intended indexes.
+
+Each test captures the SQL a service method emits and asks Postgres to EXPLAIN it. The test
+data is far too small for the planner to prefer an index over a sequential scan on its own,
+so sequential scans are disabled for the transaction; a query whose shape no longer matches
+its index then shows up as a plan without that index."""
+
+import asyncio
+from contextlib import contextmanager
+from enum import Enum
+from typing import Callable, Iterator
+from sqlalchemy import event, text
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import NullPool
+
+from .....database import _engine_str
+from .....services.coworking.async_coworking import sync_reservation_svc
+from ...conftest import POSTGRES_DATABASE
+
+from .....services.coworking import ReservationService
+from .....services.coworking.sweeper import ReservationSweeper
+from .....entities.coworking import ReservationEntity
+from .....services.coworking import PolicyService
+
+# Imported fixtures provide dependencies injected for the tests as parameters.
+# Dependent fixtures (seat_svc) are required to be imported in the testing module.
+from ..fixtures import (
+    reservation_svc,
+    permission_svc,
+    seat_svc,
+    policy_svc,
+    operating_hours_svc,
+)
+from ..time import *
+
+# Import the setup_teardown fixture explicitly to load entities in database.
+# The order in which these fixtures run is dependent on their imported alias.
+# Since there are relationship dependencies between the entities, order matters.
+from ...core_data import setup_insert_data_fixture as insert_order_0
+from ..operating_hours_data import fake_data_fixture as insert_order_1
+from ...room_data import fake_data_fixture as insert_order_2
+from ..seat_data import fake_data_fixture as insert_order_3
+from .reservation_data import fake_data_fixture as insert_order_4
+
+# Import the fake model data in a namespace for test assertions
+from ...core_data import user_data
+from ... import room_data
+from .. import seat_data
+from . import reservation_data
+
+__authors__ = ["Kris Jordan"]
+__copyright__ = "Copyright 2023"
+__license__ = "MIT"
+
+
+@contextmanager
+def _explained_plans(session: Session) -> Iterator[list[str]]:
+    """Collect the query plan of each SELECT or UPDATE executed within the context."""
+    statements: list[tuple[str, dict]] = []
+
+    def capture(connection, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith(("SELECT", "UPDATE")):
+            statements.append((statement, parameters))
+
+    engine = session.get_bind()
+    event.listen(engine, "before_cursor_execute", capture)
+    plans: list[str] = []
+    try:
+        yield plans
+    finally:
+        event.remove(engine, "before_cursor_execute", capture)
+
+    session.execute(text("SET LOCAL enable_seqscan = off"))
+    for statement, parameters in statements:
+        rows = session.connection().exec_driver_sql(f"EXPLAIN {statement}", parameters)
+        plans.append("\n".join(row[0] for row in rows))
+
+
+def _uses_index(plans: list[str], index: str) -> bool:
+    return any(index in plan for plan in plans)
+
+
+def test_reservations_for_user_use_user_index(
+    session: Session, reservation_svc: ReservationService
+):
+    with _explained_plans(session) as plans:
+        reservation_svc.get_current_reservations_for_user(
+            user_data.user, user_data.user
+        )
+    assert _uses_index(plans, "coworking__reservation_user_user_idx")
+
+
+def test_seat_reservations_use_seat_index(
+    session: Session, reservation_svc: ReservationService, time: dict[str, datetime]
+):
+    with _explained_plans(session) as plans:
+        reservation_svc._get_seat_reservation_entities(
+            [seat.id for seat in seat_data.seats], time[NOW], time[IN_THREE_HOURS]
+        )
+    assert _uses_index(plans, "coworking__reservation_seat_seat_idx")
+
+
+def test_room_map_and_xl_list_use_indexes(
+    session: Session, reservation_svc: ReservationService, time: dict[str, datetime]
+):
+    with _explained_plans(session) as plans:
+        reservation_svc._query_room_map_reservations_by_date(time[NOW], user_data.user)
+    assert _uses_index(plans, "coworking__reservation_active_end_idx")
+
+    with _explained_plans(session) as plans:
+        reservation_svc.list_all_active_and_upcoming_for_xl(user_data.root)
+    assert _uses_index(plans, "coworking__reservation_room_start_idx")
+
+
+def test_room_map_uses_active_index_under_generic_plan(
+    session: Session, time: dict[str, datetime]
+):
+    """asyncpg sends queries as prepared statements, which Postgres may plan once for any
+    parameters. The partial index must still apply to such a generic plan."""
+    statements = _async_statements(
+        lambda async_session: sync_reservation_svc(
+            async_session
+        )._query_room_map_reservations_by_date(time[NOW], user_data.user)
+    )
+
+    connection = session.connection()
+    connection.exec_driver_sql("SET LOCAL plan_cache_mode = force_generic_plan")
+    connection.exec_driver_sql("SET LOCAL enable_seqscan = off")
+    plans = []
+    for i, (statement, parameters) in enumerate(statements):
+        connection.exec_driver_sql(f"PREPARE generic_{i} AS {statement}")
+        arguments = tuple(
+            parameter.value if isinstance(parameter, Enum) else parameter
+            for parameter in parameters
+        )
+        placeholders = ", ".join(["%s"] * len(arguments))
+        rows = connection.exec_driver_sql(
+            f"EXPLAIN EXECUTE generic_{i}({placeholders})", arguments
+        )
+        plans.append("\n".join(row[0] for row in rows))
+        connection.exec_driver_sql(f"DEALLOCATE generic_{i}")
+    assert any("$" in plan for plan in plans)  # Planned for parameters, not values
+    assert _uses_index(plans, "coworking__reservation_active_end_idx")
+
+
+def _async_statements(
+    operation: Callable[[Session], object]
+) -> list[tuple[str, tuple]]:
+    """Run service code through asyncpg, as AsyncCoworkingService does, and collect the
+    SELECT statements it sends along with their parameters."""
+
+    async def run() -> list[tuple[str, tuple]]:
+        engine = create_async_engine(
+            _engine_str(POSTGRES_DATABASE, "postgresql+asyncpg"), poolclass=NullPool
+        )
+        statements: list[tuple[str, tuple]] = []
+
+        def capture(connection, cursor, statement, parameters, context, executemany):
+            if statement.lstrip().upper().startswith("SELECT"):
+                statements.append((statement, tuple(parameters)))
+
+        event.listen(engine.sync_engine, "before_cursor_execute", capture)
+        try:
+            async with AsyncSession(engine) as async_session:
+                await async_session.run_sync(operation)
+        finally:
+            await engine.dispose()
+        return statements
+
+    return asyncio.run(run())
+
+
+def test_next_reservation_start_uses_start_indexes(
+    session: Session, reservation_svc: ReservationService
+):
+    for reservation in (reservation_data.reservation_1, reservation_data.reservation_6):
+        entity = session.get(ReservationEntity, reservation.id)
+        with _explained_plans(session) as plans:
+            reservation_svc._next_reservation_start(entity, entity.end + ONE_HOUR)
+        assert _uses_index(plans, "coworking__reservation_time_idx")
+
+
+def test_sweeper_uses_draft_index(session: Session, policy_svc: PolicyService):
+    sweeper = ReservationSweeper(policy_svc, ONE_MINUTE)
+    with _explained_plans(session) as plans:
+        sweeper.sweep(session, datetime.now())
+    assert _uses_index(plans, "coworking__reservation_draft_created_at_idx")
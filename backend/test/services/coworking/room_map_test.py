@@ -0,0 +1,56 @@
+"""Unit tests for the RoomSlotMatrix backing the room reservation map."""
+
+from ....models.coworking import RoomState
+from ....services.coworking.room_map import RoomSlotMatrix
+
+__authors__ = ["Kris Jordan", "Yuvraj Jain"]
+__copyright__ = "Copyright 2024"
+__license__ = "MIT"
+
+
+def test_room_slot_matrix_starts_available():
+    room_map = RoomSlotMatrix(["SN135", "SN137"], 4)
+    assert room_map.to_dict() == {"SN135": [0, 0, 0, 0], "SN137": [0, 0, 0, 0]}
+
+
+def test_room_slot_matrix_fill_clamps_to_day():
+    room_map = RoomSlotMatrix(["SN135"], 4)
+    room_map.fill("SN135", -2, 2, RoomState.RESERVED)
+    room_map.fill("SN135", 3, 10, RoomState.UNAVAILABLE)
+    assert room_map.to_dict() == {"SN135": [1, 1, 0, 3]}
+
+
+def test_room_slot_matrix_mask_available_simple():
+    """Once a subject reserves a room, the same time slots are unavailable in all others."""
+    room_map = RoomSlotMatrix(["SN135", "SN137", "SN139"], 4)
+    room_map.fill("SN137", 2, 4, RoomState.SUBJECT_RESERVED)
+    room_map.mask_available([(2, 4)])
+    assert room_map.to_dict() == {
+        "SN135": [0, 0, 3, 3],
+        "SN137": [0, 0, 4, 4],
+        "SN139": [0, 0, 3, 3],
+    }
+
+
+def test_room_slot_matrix_mask_available():
+    """Slots already reserved by others stay reserved rather than unavailable."""
+    room_map = RoomSlotMatrix(["SN135", "SN137", "SN139"], 10)
+    room_map.fill("SN135", 6, 10, RoomState.RESERVED)
+    room_map.fill("SN137", 2, 4, RoomState.RESERVED)
+    room_map.fill("SN137", 4, 8, RoomState.SUBJECT_RESERVED)
+    room_map.fill("SN139", 3, 5, RoomState.RESERVED)
+    room_map.fill("SN139", 1, 3, RoomState.SUBJECT_RESERVED)
+    room_map.mask_available([(4, 8), (1, 3)])
+    assert room_map.to_dict() == {
+        "SN135": [0, 3, 3, 0, 3, 3, 1, 1, 1, 1],
+        "SN137": [0, 3, 1, 1, 4, 4, 4, 4, 0, 0],
+        "SN139": [0, 4, 4, 1, 1, 3, 3, 3, 0, 0],
+    }
+
+
+def test_room_slot_matrix_remove():
+    room_map = RoomSlotMatrix(["SN135", "SN156"], 2)
+    room_map.remove("SN156")
+    room_map.remove("SN999")
+    assert "SN156" not in room_map
+    assert room_map.to_dict() == {"SN135": [0, 0]}
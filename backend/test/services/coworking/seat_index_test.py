@@ -0,0 +1,58 @@
+"""Unit tests for the spatial index over seat positions."""
+
+from math import hypot
+from random import Random
+
+from ....models.coworking import Seat
+from ....services.coworking.seat_index import SeatIndex
+
+__authors__ = ["Kris Jordan"]
+__copyright__ = "Copyright 2023"
+__license__ = "MIT"
+
+
+def seat(id: int, x: int, y: int, has_monitor: bool = True) -> Seat:
+    return Seat(
+        id=id,
+        title=f"Seat {id}",
+        shorthand=f"S{id}",
+        reservable=True,
+        has_monitor=has_monitor,
+        sit_stand=False,
+        x=x,
+        y=y,
+    )
+
+
+def test_nearest_matches_brute_force():
+    random = Random(0)
+    seats = [
+        seat(id, random.randint(0, 60), random.randint(0, 40)) for id in range(300)
+    ]
+    index = SeatIndex(seats)
+    for _ in range(200):
+        x, y = random.uniform(-10, 70), random.uniform(-10, 50)
+        found = index.nearest(x, y, lambda other: other.id % 3 == 0)
+        expected = min(
+            hypot(other.x - x, other.y - y) for other in seats if other.id % 3 == 0
+        )
+        assert found is not None
+        assert found[0].id % 3 == 0
+        assert found[1] == expected
+
+
+def test_nearest_skips_excluded_seats():
+    seats = [seat(1, 0, 0, has_monitor=False), seat(2, 9, 9), seat(3, 20, 0)]
+    index = SeatIndex(seats)
+    assert index.nearest(0, 0) == (seats[0], 0.0)
+    assert index.nearest(0, 0, lambda other: other.has_monitor) == (
+        seats[1],
+        hypot(9, 9),
+    )
+    assert index.nearest(0, 0, lambda _: False) is None
+
+
+def test_empty_index():
+    index = SeatIndex([])
+    assert index.nearest(0, 0) is None
+    assert index.get(1) is None
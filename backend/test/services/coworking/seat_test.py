@@ -1,7 +1,11 @@
 """Tests for Coworking Rooms Service."""
 
-from ....services.coworking import SeatService
+from sqlalchemy import delete
+from sqlalchemy.orm import Session
+
+from ....services.coworking import SeatService, coworking_cache
 from ....models.coworking import SeatDetails
+from ....entities.coworking import SeatEntity
 
 # Imported fixtures provide dependencies injected for the tests as parameters.
 from .fixtures import seat_svc
@@ -22,3 +26,23 @@ def test_list(seat_svc: SeatService):
     seats = seat_svc.list()
     assert len(seats) == len(seat_data.seats)
     assert isinstance(seats[0], SeatDetails)
+
+
+def test_list_shares_snapshot(seat_svc: SeatService, session: Session):
+    """Seats are loaded once and shared until invalidated."""
+    seats = seat_svc.list()
+    session.execute(delete(SeatEntity).where(SeatEntity.id == seats[0].id))
+    session.commit()
+    assert seat_svc.list() is seats
+
+    coworking_cache.invalidate_rooms()
+    assert len(seat_svc.list()) == len(seat_data.seats) - 1
+
+
+def test_index_rebuilt_with_snapshot(seat_svc: SeatService):
+    index = seat_svc.index()
+    assert seat_svc.index() is index
+    assert index.get(seat_data.monitor_seat_00.id) is not None
+
+    coworking_cache.invalidate_rooms()
+    assert seat_svc.index() is not index
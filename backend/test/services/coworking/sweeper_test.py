@@ -0,0 +1,113 @@
+"""Tests for the background ReservationSweeper."""
+
+import asyncio
+import logging
+import pytest
+from sqlalchemy.orm import Session
+
+from ....entities.coworking import ReservationEntity
+from ....models.coworking import ReservationState
+from ....services.coworking import PolicyService
+from ....services.coworking.sweeper import ReservationSweeper
+
+from .fixtures import policy_svc
+from .time import *
+
+# Since there are relationship dependencies between the entities, order matters.
+from ..core_data import setup_insert_data_fixture as insert_order_0
+from .operating_hours_data import fake_data_fixture as insert_order_1
+from ..room_data import fake_data_fixture as insert_order_2
+from .seat_data import fake_data_fixture as insert_order_3
+from .reservation.reservation_data import fake_data_fixture as insert_order_4
+
+from .reservation import reservation_data
+
+__authors__ = ["Kris Jordan"]
+__copyright__ = "Copyright 2023"
+__license__ = "MIT"
+
+
+def _state(session: Session, id: int) -> ReservationState:
+    return session.get(ReservationEntity, id, populate_existing=True).state
+
+
+def test_sweep_noop(
+    session: Session, policy_svc: PolicyService, time: dict[str, datetime]
+):
+    sweeper = ReservationSweeper(policy_svc, ONE_MINUTE)
+    sweep = sweeper.sweep(session, time[NOW])
+    assert sweep.total == 0
+    assert _state(session, reservation_data.reservation_1.id) == (
+        ReservationState.CHECKED_IN
+    )
+
+
+def test_sweep_checks_out_ended_reservations(
+    session: Session, policy_svc: PolicyService
+):
+    sweeper = ReservationSweeper(policy_svc, ONE_MINUTE)
+    sweep = sweeper.sweep(session, reservation_data.reservation_1.end)
+    assert sweep.checked_out == 1
+    assert _state(session, reservation_data.reservation_1.id) == (
+        ReservationState.CHECKED_OUT
+    )
+
+
+def test_sweep_cancels_expired_drafts_and_no_shows(
+    session: Session, policy_svc: PolicyService
+):
+    sweeper = ReservationSweeper(policy_svc, ONE_MINUTE)
+    cutoff = (
+        reservation_data.reservation_4.start
+        + policy_svc.reservation_checkin_timeout()
+        + timedelta(seconds=1)
+    )
+    sweep = sweeper.sweep(session, cutoff)
+    assert sweep.expired_drafts == 1
+    assert sweep.no_shows == 1
+    assert _state(session, reservation_data.reservation_4.id) == (
+        ReservationState.CANCELLED
+    )
+    assert _state(session, reservation_data.reservation_5.id) == (
+        ReservationState.CANCELLED
+    )
+    assert _state(session, reservation_data.reservation_6.id) == (
+        ReservationState.CONFIRMED
+    )
+
+
+def test_tick_records_statistics(session: Session, policy_svc: PolicyService):
+    sweeper = ReservationSweeper(policy_svc, ONE_MINUTE)
+    sweeper.tick(session)
+    sweeper.tick(session)
+    statistics = sweeper.statistics()
+    assert statistics.ticks == 2
+    assert statistics.interval_seconds == 60
+    assert statistics.last_swept_at is not None
+    assert statistics.totals.total == statistics.last_sweep.total
+
+
+def test_run_logs_failed_tick(
+    policy_svc: PolicyService, caplog: pytest.LogCaptureFixture
+):
+    sweeper = ReservationSweeper(policy_svc, ONE_MINUTE)
+
+    def fail(session: Session) -> None:
+        raise RuntimeError("sweep failed")
+
+    sweeper.tick = fail  # type: ignore
+
+    async def run_until_failure() -> None:
+        task = asyncio.create_task(sweeper.run())
+        while sweeper.statistics().failures == 0:
+            await asyncio.sleep(0.01)
+        task.cancel()
+
+    with caplog.at_level(logging.ERROR, logger="backend.services.coworking.sweeper"):
+        asyncio.run(asyncio.wait_for(run_until_failure(), timeout=10))
+
+    assert sweeper.statistics().failures == 1
+    assert any(
+        record.exc_info is not None and "sweep failed" in str(record.exc_info[1])
+        for record in caplog.records
+    )
@@ -2,6 +2,8 @@
 
 # PyTest
 import pytest
+from concurrent.futures import ThreadPoolExecutor
+from threading import Barrier
 from unittest.mock import create_autospec
 from backend.models.pagination import PaginationParams
 
@@ -17,8 +19,17 @@ from ....models.coworking.time_range import TimeRange
 from ..coworking.time import *
 
 # Tested Dependencies
-from ....models import Event, EventDetails, EventPaginationParams
-from ....services import EventService
+from sqlalchemy import event, text
+from sqlalchemy.orm import Session
+from ....entities import EventEntity, EventRegistrationEntity, OrganizationEntity
+from ....models import (
+    Event,
+    EventDetails,
+    EventPaginationParams,
+    RegistrationType,
+    User,
+)
+from ....services import EventService, PermissionService
 
 # Injected Service Fixtures
 from ..fixtures import (
@@ -64,6 +75,29 @@ def test_get_all(event_svc_integration: EventService):
     assert fetched_events[2].is_attendee == True
 
 
+def test_get_all_constant_queries(event_svc_integration: EventService):
+    """Test that listing events loads registrations in bulk rather than per event."""
+    session = event_svc_integration._session
+    statements: list[str] = []
+
+    def count(conn, cursor, statement, parameters, context, executemany):
+        # Savepoints are issued by the test's transactional session, not the service.
+        if not statement.startswith("SAVEPOINT"):
+            statements.append(statement)
+
+    event.listen(session.get_bind(), "before_cursor_execute", count)
+    try:
+        fetched_events = event_svc_integration.all(ambassador)
+    finally:
+        event.remove(session.get_bind(), "before_cursor_execute", count)
+
+    assert len(statements) == 3
+    assert fetched_events == [
+        session.get(EventEntity, fetched.id).to_details_model(ambassador)
+        for fetched in fetched_events
+    ]
+
+
 def test_get_all_unauthenticated(event_svc_integration: EventService):
     """Test that all events can be retrieved."""
     fetched_events = event_svc_integration.all()
@@ -116,6 +150,80 @@ def test_list_filter(event_svc_integration: EventService):
     assert len(fetched_events.items) == 1
 
 
+def test_list_filter_by_organization(event_svc_integration: EventService):
+    """Test that the paginated list filter matches the hosting organization's slug."""
+    pagination_params = EventPaginationParams(filter="cssg")
+    fetched_events = event_svc_integration.get_paginated_events(
+        pagination_params, ambassador
+    )
+    assert len(fetched_events.items) == len(events)
+
+
+def test_search(event_svc_integration: EventService):
+    """Test that events are searched by name, most relevant first."""
+    fetched_events = event_svc_integration.search("workshop", ambassador)
+    assert [event.id for event in fetched_events] == [event_two.id]
+
+
+def test_search_by_prefix_across_organization(event_svc_integration: EventService):
+    """Test that every word of a search must match the event or its organization as a prefix."""
+    fetched_events = event_svc_integration.search("social work", ambassador)
+    assert [event.id for event in fetched_events] == [event_two.id]
+
+
+def test_search_ranks_name_above_organization(event_svc_integration: EventService):
+    """Test that matches in an event's name outrank matches in its organization's name."""
+    fetched_events = event_svc_integration.search("cs")
+    assert [event.id for event in fetched_events] == [
+        event_one.id,
+        event_two.id,
+        event_three.id,
+    ]
+
+
+def test_search_without_words(event_svc_integration: EventService):
+    """Test that a search without any words matches no events."""
+    assert event_svc_integration.search("+&!") == []
+
+
+def test_search_of_stop_words(event_svc_integration: EventService):
+    """Test that a search of only stop words matches events containing it."""
+    fetched_events = event_svc_integration.search("the", ambassador)
+    assert [event.id for event in fetched_events] == [event_one.id]
+
+
+def test_search_follows_organization_rename(
+    session: Session, event_svc_integration: EventService
+):
+    """Test that renaming an organization updates the search vectors of its events."""
+    session.get(OrganizationEntity, event_one.organization_id).name = "Renamed Club"  # type: ignore
+    session.commit()
+    fetched_events = event_svc_integration.search("renamed")
+    assert sorted(event.id for event in fetched_events) == sorted(
+        event.id for event in events
+    )
+
+
+def test_search_uses_index(session: Session, event_svc_integration: EventService):
+    """Test that the event search is served by the search vector's GIN index."""
+    captured: list[str] = []
+
+    def capture(connection, cursor, statement, parameters, context, executemany):
+        if "@@" in statement:
+            captured.append(cursor.mogrify(statement, parameters).decode())
+
+    bind = session.get_bind()
+    event.listen(bind, "before_cursor_execute", capture)
+    try:
+        event_svc_integration.search("workshop")
+    finally:
+        event.remove(bind, "before_cursor_execute", capture)
+
+    session.execute(text("SET LOCAL enable_seqscan = off"))
+    plan = "\n".join(row[0] for row in session.execute(text(f"EXPLAIN {captured[0]}")))
+    assert "event_search_vector_idx" in plan
+
+
 def test_list_unauthenticated(event_svc_integration: EventService):
     """Test that a paginated list of events can be produced for unauthenticated users."""
     pagination_params = EventPaginationParams(
@@ -238,9 +346,11 @@ def test_update_event_organizers_as_root(
     """
     event_svc_integration.update(root, updated_event_three)
     updated_organizers = event_svc_integration.get_by_id(3).organizers
-    assert updated_organizers[0].id == ambassador.id
-    assert updated_organizers[1].id == user.id
-    assert updated_organizers[2].id == root.id
+    assert [organizer.id for organizer in updated_organizers] == [
+        root.id,
+        ambassador.id,
+        user.id,
+    ]
 
     event_svc_integration.update(root, updated_event_three_remove_organizers)
     updated_organizers = event_svc_integration.get_by_id(3).organizers
@@ -249,8 +359,11 @@ def test_update_event_organizers_as_root(
 
     event_svc_integration.update(root, updated_event_three)
     updated_organizers = event_svc_integration.get_by_id(3).organizers
-    assert updated_organizers[0].id == user.id
-    assert updated_organizers[1].id == ambassador.id
+    assert [organizer.id for organizer in updated_organizers] == [
+        root.id,
+        ambassador.id,
+        user.id,
+    ]
 
 
 def test_update_event_organizers_as_user(
@@ -530,6 +643,97 @@ def test_register_to_full_event(
         event_svc_integration.register(user, user, event_details)
 
 
+def test_register_to_full_event_keeps_session_changes(
+    session: Session, event_svc_integration: EventService
+):
+    """Tests that a full event only rolls back the attempted registration, not the session."""
+    event_details = event_svc_integration.get_by_id(event_three.id)  # type: ignore
+    entity = session.get(EventEntity, event_one.id)
+    entity.location = "Fetzer Gym"  # type: ignore
+    session.flush()
+
+    with pytest.raises(EventRegistrationException):
+        event_svc_integration.register(user, user, event_details)
+
+    session.expire_all()
+    assert session.get(EventEntity, event_one.id).location == "Fetzer Gym"  # type: ignore
+
+
+def test_register_to_full_event_with_stale_details(
+    event_svc_integration: EventService,
+):
+    """Tests that capacity is enforced from the database, not the EventDetails passed in."""
+    event_details = event_svc_integration.get_by_id(event_three.id)  # type: ignore
+    stale_details = event_details.model_copy(update={"registration_count": 0})
+
+    with pytest.raises(EventRegistrationException):
+        event_svc_integration.register(user, user, stale_details)
+
+
+def test_register_to_full_event_when_already_registered(
+    event_svc_integration: EventService,
+):
+    """Tests that an existing registration is returned even once the event is full."""
+    event_details = event_svc_integration.get_by_id(event_three.id)  # type: ignore
+    registration = event_svc_integration.register(ambassador, ambassador, event_details)
+    assert registration.id == ambassador.id
+
+
+@pytest.mark.committed
+def test_register_concurrently_respects_limit(
+    session: Session, event_svc_integration: EventService
+):
+    """Tests that simultaneous registrations cannot exceed the registration limit."""
+    session.get(EventEntity, event_two.id).registration_limit = 1  # type: ignore
+    session.commit()
+    event_details = event_svc_integration.get_by_id(event_two.id)  # type: ignore
+    attendees = [root, ambassador, user]
+    barrier = Barrier(len(attendees))
+
+    def register(attendee: User) -> bool:
+        with Session(session.get_bind()) as attendee_session:
+            event_svc = EventService(
+                attendee_session, PermissionService(attendee_session)
+            )
+            barrier.wait()
+            try:
+                event_svc.register(attendee, attendee, event_details)
+                return True
+            except EventRegistrationException:
+                return False
+
+    with ThreadPoolExecutor(len(attendees)) as executor:
+        admitted = list(executor.map(register, attendees))
+
+    assert admitted.count(True) == 1
+    assert event_svc_integration.get_by_id(event_two.id).registration_count == 1  # type: ignore
+
+
+@pytest.mark.committed
+def test_register_for_different_events_does_not_block(
+    session: Session, event_svc_integration: EventService
+):
+    """Tests that registrations for different events do not wait on one another."""
+    event_details = event_svc_integration.get_by_id(event_two.id)  # type: ignore
+    with Session(session.get_bind()) as first, Session(session.get_bind()) as second:
+        first.add(
+            EventRegistrationEntity(
+                event_id=event_one.id,
+                user_id=root.id,
+                registration_type=RegistrationType.ATTENDEE,
+            )
+        )
+        first.flush()
+
+        # The first registration is still uncommitted; the second must not wait for it.
+        second.execute(text("SET lock_timeout = '1s'"))
+        event_svc = EventService(second, PermissionService(second))
+        event_svc.register(user, user, event_details)
+        first.rollback()
+
+    assert event_svc_integration.get_by_id(event_two.id).registration_count == 1  # type: ignore
+
+
 def test_get_registered_users_of_event(event_svc_integration: EventService):
     """Tests querying for registered users of events as a paginated list"""
     pagination_params = PaginationParams(
@@ -544,6 +748,24 @@ def test_get_registered_users_of_event(event_svc_integration: EventService):
     assert page.items[0].id == ambassador.id
 
 
+def test_get_paginated_events_cursor(event_svc_integration: EventService):
+    """Tests that following cursors walks every event once, in descending time order."""
+    pagination_params = EventPaginationParams(
+        order_by="time", ascending="false", page_size=2
+    )
+    first_page = event_svc_integration.get_paginated_events(pagination_params, root)
+    second_page = event_svc_integration.get_paginated_events(
+        pagination_params.model_copy(update={"cursor": first_page.next_cursor}), root
+    )
+
+    assert first_page.length == len(events)
+    assert second_page.length is None
+    assert second_page.next_cursor is None
+    walked = first_page.items + second_page.items
+    expected = sorted(events, key=lambda event: (event.time, event.id), reverse=True)
+    assert [event.id for event in walked] == [event.id for event in expected]
+
+
 def test_organizer_get_registered_users_of_event(event_svc_integration: EventService):
     """Tests that organizers for an event can retrieve registered users"""
     # Setup to test permission enforcement on the PermissionService.
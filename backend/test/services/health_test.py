@@ -2,18 +2,89 @@
 
 # Tested Dependencies
 from ...services.health import HealthService
+from ...services import PermissionService
+from ...services.exceptions import UserPermissionException
+from ...services.coworking.sweeper import reservation_sweeper
+from ...database import engine, async_engine
 
 # Library Requirements
+import asyncio
+import pytest
 from datetime import datetime, timezone
+from sqlalchemy import text
 from sqlalchemy.orm import Session
 
+# Data Setup and Injected Service Fixtures
+from .core_data import setup_insert_data_fixture
+from .fixtures import permission_svc
+from .user_data import root, user
+
 __authors__ = ["Kris Jordan"]
 __copyright__ = "Copyright 2023"
 __license__ = "MIT"
 
 
-def test_health_check(session: Session):
-    health_service = HealthService(session)
+def test_health_check(session: Session, permission_svc: PermissionService):
+    health_service = HealthService(session, permission_svc)
     now = str(datetime.now(tz=timezone.utc))[:16]
     result = health_service.check()
     assert f"OK @ {now}" in health_service.check()
+
+
+def test_pool_statistics(session: Session, permission_svc: PermissionService):
+    health_service = HealthService(session, permission_svc)
+    before = health_service.pool(root)
+
+    with engine.connect() as connection:
+        connection.execute(text("SELECT 1"))
+        during = health_service.pool(root).sync_pool
+    after = health_service.pool(root).sync_pool
+
+    assert during.checkouts == before.sync_pool.checkouts + 1
+    assert during.checked_out == before.sync_pool.checked_out + 1
+    assert after.checked_out == before.sync_pool.checked_out
+    assert after.checked_in >= 1
+    assert after.average_wait_ms <= after.max_wait_ms
+
+
+def test_async_pool_statistics(session: Session, permission_svc: PermissionService):
+    health_service = HealthService(session, permission_svc)
+    before = health_service.pool(root).async_pool
+
+    async def query():
+        async with async_engine.connect() as connection:
+            await connection.execute(text("SELECT 1"))
+            during = health_service.pool(root).async_pool
+        after = health_service.pool(root).async_pool
+        # Pooled asyncpg connections are bound to this event loop.
+        await async_engine.dispose()
+        return during, after
+
+    during, after = asyncio.run(query())
+    assert during.checkouts == before.checkouts + 1
+    assert during.checked_out == before.checked_out + 1
+    assert after.checked_out == before.checked_out
+    assert after.checked_in >= 1
+
+
+def test_pool_statistics_enforces_permission(
+    session: Session, permission_svc: PermissionService
+):
+    health_service = HealthService(session, permission_svc)
+    with pytest.raises(UserPermissionException):
+        health_service.pool(user)
+
+
+def test_reservation_sweeper_statistics(
+    session: Session, permission_svc: PermissionService
+):
+    health_service = HealthService(session, permission_svc)
+    assert health_service.reservation_sweeper(root) == reservation_sweeper.statistics()
+
+
+def test_reservation_sweeper_statistics_enforces_permission(
+    session: Session, permission_svc: PermissionService
+):
+    health_service = HealthService(session, permission_svc)
+    with pytest.raises(UserPermissionException):
+        health_service.reservation_sweeper(user)
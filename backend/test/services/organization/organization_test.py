@@ -60,6 +60,35 @@ def test_get_by_slug(organization_svc_integration: OrganizationService):
 # Test `OrganizationService.create()`
 
 
+def test_search(organization_svc_integration: OrganizationService):
+    """Test that organizations can be searched by shorthand."""
+    fetched_organizations = organization_svc_integration.search("cssg")
+    assert [organization.slug for organization in fetched_organizations] == ["cssg"]
+
+
+def test_search_ranks_names_first(organization_svc_integration: OrganizationService):
+    """Test that matches in an organization's name outrank matches in its descriptions."""
+    fetched_organizations = organization_svc_integration.search("team")
+    assert fetched_organizations[0].slug == "app-team"
+
+
+def test_search_of_stop_words(organization_svc_integration: OrganizationService):
+    """Test that a search of only stop words matches organizations containing it."""
+    fetched_organizations = organization_svc_integration.search("The")
+    assert len(fetched_organizations) > 0
+    for organization in fetched_organizations:
+        assert (
+            "the"
+            in f"{organization.short_description} {organization.long_description}".lower()
+        )
+
+
+def test_search_no_match(organization_svc_integration: OrganizationService):
+    """Test that a search with no matches produces no organizations."""
+    assert organization_svc_integration.search("xyz") == []
+    assert organization_svc_integration.search("") == []
+
+
 def test_create_enforces_permission(organization_svc_integration: OrganizationService):
     """Test that the service enforces permissions when attempting to create an organization."""
 
@@ -0,0 +1,90 @@
+"""Tests for the compiled PermissionMatcher."""
+
+from ...services.permission_matcher import PermissionMatcher, glob_match
+
+__authors__ = ["Kris Jordan"]
+__copyright__ = "Copyright 2023"
+__license__ = "MIT"
+
+
+def test_glob_match():
+    assert glob_match("*", "anything/at/all")
+    assert glob_match("checkin", "checkin")
+    assert glob_match("checkin*", "checkin/1")
+    assert glob_match("user/*/profile", "user/12/profile")
+    assert not glob_match("checkin", "checkin/1")
+    assert not glob_match("user/*/profile", "user/12/settings")
+
+
+def test_glob_match_literal_characters():
+    """Characters other than `*` match literally rather than as regular expressions."""
+    assert glob_match("coworking.reservation.*", "coworking.reservation.read")
+    assert not glob_match("coworking.reservation.*", "coworkingXreservation.read")
+
+
+def test_matcher_exact_grant():
+    matcher = PermissionMatcher([("checkin.create", "checkin")])
+    assert matcher.matches("checkin.create", "checkin")
+    assert not matcher.matches("checkin.create", "checkin/1")
+    assert not matcher.matches("checkin.delete", "checkin")
+
+
+def test_matcher_wildcard_grants():
+    matcher = PermissionMatcher(
+        [
+            ("coworking.reservation.*", "*"),
+            ("checkin.delete", "checkin/*"),
+            ("organization.*", "organization/cads"),
+        ]
+    )
+    assert matcher.matches("coworking.reservation.read", "user/1")
+    assert matcher.matches("checkin.delete", "checkin/12")
+    assert not matcher.matches("checkin.delete", "checkin")
+    assert matcher.matches("organization.update", "organization/cads")
+    assert not matcher.matches("organization.update", "organization/acm")
+    assert not matcher.matches("coworking.operating_hours.create", "*")
+
+
+def test_matcher_catch_all():
+    matcher = PermissionMatcher([("*", "*")])
+    assert matcher.matches("permission.grant", "*")
+    assert matcher.matches("permission.grant", "checkin")
+    assert matcher.matches("permission.revoke", "checkin.*")
+    assert matcher.matches("checkin.delete", "checkin/1")
+    assert matcher.matches("", "")
+
+
+def test_matcher_no_grants():
+    assert not PermissionMatcher([]).matches("user.list", "user/")
+
+
+def test_matcher_catch_all_resource():
+    """All resources of an action can be granted using `*`."""
+    matcher = PermissionMatcher([("permission.grant", "*")])
+    assert matcher.matches("permission.grant", "*")
+    assert matcher.matches("permission.grant", "checkin")
+    assert not matcher.matches("permission.revoke", "checkin.*")
+    assert not matcher.matches("checkin.delete", "checkin/1")
+
+
+def test_matcher_specific_resource():
+    matcher = PermissionMatcher([("permission.grant", "checkin*")])
+    assert not matcher.matches("permission.grant", "*")
+    assert matcher.matches("permission.grant", "checkin")
+    assert not matcher.matches("permission.revoke", "checkin.*")
+    assert not matcher.matches("checkin.delete", "checkin/1")
+
+
+def test_matcher_specific_permission():
+    matcher = PermissionMatcher([("checkin.delete", "checkin/*")])
+    assert matcher.matches("checkin.delete", "checkin/1")
+    assert matcher.matches("checkin.delete", "checkin/12")
+    assert not matcher.matches("checkin.create", "checkin/12")
+    assert not matcher.matches("permission.revoke", "checkin.*")
+
+
+def test_compile_is_cached():
+    grants = [("checkin.create", "checkin"), ("*", "user/1")]
+    assert PermissionMatcher.compile(grants) is PermissionMatcher.compile(
+        reversed(grants)
+    )
@@ -7,6 +7,7 @@ from backend.services.exceptions import (
 )
 from backend.services.permission import PermissionService
 from ...services import RoomService
+from ...services.coworking import coworking_cache
 from ...models import RoomDetails
 
 # Imported fixtures provide dependencies injected for the tests as parameters.
@@ -81,6 +82,17 @@ def test_update_as_root(room_svc: RoomService):
     assert room.id == room_data.edited_xl.id
 
 
+def test_update_invalidates_coworking_snapshots(room_svc: RoomService):
+    room_svc._permission_svc = create_autospec(PermissionService)
+    coworking_cache.reservable_rooms.set(None, ())
+    coworking_cache.seats.set(None, ())
+
+    room_svc.update(user_data.root, room_data.edited_xl)
+
+    assert coworking_cache.reservable_rooms.get(None) is None
+    assert coworking_cache.seats.get(None) is None
+
+
 def test_update_as_root_not_found(room_svc: RoomService):
     permission_svc = create_autospec(PermissionService)
     room_svc._permission_svc = permission_svc
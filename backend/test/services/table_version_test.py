@@ -0,0 +1,81 @@
+"""Tests for the TableVersionService and the triggers maintaining table versions."""
+
+import pytest
+from sqlalchemy.orm import Session
+
+from ...models import RegistrationType
+from ...models.event_registration import NewEventRegistration
+from ...entities import EventRegistrationEntity
+from ...services import OrganizationService
+from ...services.table_version import TableVersionService
+from .organization.organization_test_data import to_add
+
+# Injected Service Fixtures
+from .fixtures import organization_svc_integration
+
+# Explicitly import Data Fixture to load entities in database
+from .core_data import setup_insert_data_fixture
+
+# Data Models for Fake Data Inserted in Setup
+from .user_data import root, user
+from .event.event_test_data import event_two
+
+__authors__ = ["Kris Jordan"]
+__copyright__ = "Copyright 2023"
+__license__ = "MIT"
+
+
+@pytest.fixture()
+def table_version_svc(session: Session) -> TableVersionService:
+    return TableVersionService(session)
+
+
+def _versions(table_version_svc: TableVersionService) -> dict[str, int]:
+    return {
+        version.table_name: version.version
+        for version in table_version_svc.get(["event", "organization"])
+    }
+
+
+def test_insert_data_bumps_versions(table_version_svc: TableVersionService):
+    versions = _versions(table_version_svc)
+    assert versions["organization"] > 0
+    assert versions["event"] > 0
+
+
+def test_mutation_bumps_version_of_its_table_only(
+    table_version_svc: TableVersionService,
+    organization_svc_integration: OrganizationService,
+):
+    before = table_version_svc.get(["event", "organization"])
+    organization_svc_integration.create(root, to_add)
+    after = table_version_svc.get(["event", "organization"])
+
+    assert after[0] == before[0]
+    assert after[1].table_name == "organization"
+    assert after[1].version == before[1].version + 1
+    assert after[1].modified_at > before[1].modified_at
+
+
+def test_registration_changes_fingerprint(
+    session: Session, table_version_svc: TableVersionService
+):
+    before = table_version_svc.get(["event_organizer", "event_registration"])
+    registration = NewEventRegistration(
+        event_id=event_two.id | 0,
+        user_id=user.id | 0,
+        registration_type=RegistrationType.ATTENDEE,
+    )
+    session.add(EventRegistrationEntity.from_new_model(registration))
+    session.flush()
+    after = table_version_svc.get(["event_organizer", "event_registration"])
+
+    assert after[0] == before[0]
+    assert after[1].table_name == "event_registration"
+    assert after[1].version != before[1].version
+    assert after[1].modified_at is None
+
+
+def test_get_unversioned_table(table_version_svc: TableVersionService):
+    with pytest.raises(ValueError):
+        table_version_svc.get(["coworking__reservation"])
@@ -1,12 +1,18 @@
 """Tests for the UserService class."""
 
 import pytest
+from sqlalchemy import select, text
+from sqlalchemy.orm import Session
 
 # Tested Dependencies
 from ...models.user import User, NewUser
 from ...models.pagination import PaginationParams
+from ...entities import UserEntity
 from ...services import UserService, PermissionService
-from ...services.exceptions import ResourceNotFoundException
+from ...services.exceptions import ResourceNotFoundException, InvalidCursorException
+from ...services.pagination import encode_cursor
+from ...services import user_cache
+from ...services.user_cache import registered_users
 
 # Data Setup and Injected Service Fixtures
 from .core_data import setup_insert_data_fixture
@@ -110,17 +116,61 @@ def test_search_no_match(user_svc: UserService):
     assert len(users) == 0
 
 
+def test_search_wildcards_match_literally(user_svc: UserService):
+    """Test that LIKE wildcards in a query only match themselves."""
+    assert user_svc.search(ambassador, "%") == []
+    assert user_svc.search(ambassador, "_") == []
+    assert user_svc.search(ambassador, "\\") == []
+
+
 def test_search_by_pid_does_not_exist(user_svc: UserService):
     """Test searching for a partial PID that does not exist."""
     users = user_svc.search(ambassador, "123")
     assert len(users) == 0
 
+
 def test_search_by_pid_rhonda(user_svc: UserService):
     """Test searching for a partial PID that does exist."""
     users = user_svc.search(ambassador, "999")
     assert len(users) == 1
     assert users[0] == root
 
+
+@pytest.fixture()
+def trigram_search(session: Session):
+    """Skip tests of trigram search where the database server lacks pg_trgm."""
+    installed = session.scalar(
+        text("SELECT EXISTS (SELECT 1 FROM pg_extension WHERE extname = 'pg_trgm')")
+    )
+    if not installed:
+        pytest.skip("pg_trgm is not available on this database server")
+
+
+def test_search_ranks_by_similarity(
+    session: Session, user_svc: UserService, trigram_search
+):
+    """Test that closer matches are returned first when trigram search is available."""
+    stan = UserEntity(
+        id=4, pid=222222222, onyen="stan", email="stan@unc.edu", first_name="Stan"
+    )
+    session.add(stan)
+    session.commit()
+    users = user_svc.search(ambassador, "stan")
+    assert [user.id for user in users] == [stan.id, ambassador.id]
+
+
+def test_search_uses_trigram_indexes(
+    session: Session, user_svc: UserService, trigram_search
+):
+    """Test that the substring search is served by the trigram indexes."""
+    statement = select(UserEntity).where(user_svc._search_criteria("stan"))
+    sql = statement.compile(session.get_bind(), compile_kwargs={"literal_binds": True})
+    session.execute(text("SET LOCAL enable_seqscan = off"))
+    plan = "\n".join(row[0] for row in session.execute(text(f"EXPLAIN {sql}")))
+    for column in ("first_name", "last_name", "onyen", "email", "pid"):
+        assert f"user_{column}_trgm_idx" in plan
+
+
 def test_list(user_svc: UserService):
     """Test that a paginated list of users can be produced."""
     pagination_params = PaginationParams(page=0, page_size=2, order_by="id", filter="")
@@ -168,6 +218,76 @@ def test_list_filter(user_svc: UserService):
     assert users.items[0].id == ambassador.id
 
 
+def test_list_filter_ignores_email_and_pid(user_svc: UserService):
+    """Test that the list filter matches names and onyens only, unlike search."""
+    for filter in ("amam", str(ambassador.pid)):
+        pagination_params = PaginationParams(
+            page=0, page_size=3, order_by="id", filter=filter
+        )
+        assert user_svc.list(ambassador, pagination_params).items == []
+
+
+def test_list_cursor(user_svc: UserService):
+    """Test that following cursors walks every user exactly once, in order."""
+    pagination_params = PaginationParams(page_size=2, order_by="first_name")
+    first_page = user_svc.list(ambassador, pagination_params)
+    assert first_page.length == len(user_data.users)
+    assert first_page.next_cursor is not None
+
+    second_page = user_svc.list(
+        ambassador,
+        pagination_params.model_copy(update={"cursor": first_page.next_cursor}),
+    )
+    assert second_page.length is None
+    assert second_page.next_cursor is None
+
+    expected = sorted(user_data.users, key=lambda user: (user.first_name, user.id))
+    walked = first_page.items + second_page.items
+    assert [user.id for user in walked] == [user.id for user in expected]
+
+
+def test_list_cursor_matches_offset_pages(user_svc: UserService):
+    """Test that a cursor page contains the same users as the equivalent offset page."""
+    pagination_params = PaginationParams(page_size=1, order_by="id")
+    first_page = user_svc.list(ambassador, pagination_params)
+    cursor_page = user_svc.list(
+        ambassador,
+        pagination_params.model_copy(update={"cursor": first_page.next_cursor}),
+    )
+    offset_page = user_svc.list(
+        ambassador, pagination_params.model_copy(update={"page": 1})
+    )
+    assert cursor_page.items == offset_page.items
+
+
+def test_list_invalid_cursor(user_svc: UserService):
+    """Test that malformed cursors, cursors of another ordering, and cursors whose sort key
+    is not of the sort column's type are rejected."""
+    first_page = user_svc.list(
+        ambassador, PaginationParams(page_size=1, order_by="first_name")
+    )
+    with pytest.raises(InvalidCursorException):
+        user_svc.list(
+            ambassador, PaginationParams(order_by="id", cursor="not-a-cursor")
+        )
+    with pytest.raises(InvalidCursorException):
+        user_svc.list(
+            ambassador, PaginationParams(order_by="id", cursor=first_page.next_cursor)
+        )
+    with pytest.raises(InvalidCursorException):
+        user_svc.list(
+            ambassador,
+            PaginationParams(order_by="id", cursor=encode_cursor("id", "1", 1)),
+        )
+    with pytest.raises(InvalidCursorException):
+        user_svc.list(
+            ambassador,
+            PaginationParams(
+                order_by="first_name", cursor=encode_cursor("first_name", 1, 1)
+            ),
+        )
+
+
 def test_list_enforces_permission(
     user_svc: UserService, permission_svc_mock: PermissionService
 ):
@@ -247,6 +367,47 @@ def test_update_user_enforces_permission(
     )
 
 
+def test_update_user_invalidates_registered_user_cache(
+    user_svc: UserService, permission_svc_mock: PermissionService
+):
+    """Test that updating a user discards their cached authentication entry."""
+    permission_svc_mock.get_permissions.return_value = []
+    user_details = user_svc.get(ambassador.pid)
+    assert user_details is not None
+    registered_users.set("ambassador-token", ({"pid": ambassador.pid}, user_details))
+    registered_users.set(
+        "root-token",
+        ({"pid": root.pid}, user_details.model_copy(update={"id": root.id})),
+    )
+    user_svc.update(ambassador, user_details)
+    assert registered_users.get("ambassador-token") is None
+    assert registered_users.get("root-token") is not None
+    registered_users.clear()
+
+
+def test_user_invalidated_while_resolving_is_not_cached(
+    user_svc: UserService, permission_svc_mock: PermissionService
+):
+    """Test that a user resolved before an invalidation of them is not written back stale."""
+    permission_svc_mock.get_permissions.return_value = []
+    since = user_cache.generation()
+    user_details = user_svc.get(ambassador.pid)
+    assert user_details is not None
+
+    user_cache.invalidate_user(root.id)
+    assert user_cache.cache_user("ambassador-token", {}, user_details, since)
+
+    user_cache.invalidate_user(ambassador.id)
+    assert not user_cache.cache_user("ambassador-token", {}, user_details, since)
+    assert registered_users.get("ambassador-token") is None
+
+    since = user_cache.generation()
+    assert user_cache.cache_user("ambassador-token", {}, user_details, since)
+    user_cache.invalidate_user()
+    assert not user_cache.cache_user("ambassador-token", {}, user_details, since)
+    assert len(registered_users) == 0
+
+
 def test_new_user_accepted_agreement_is_false(user_svc: UserService):
     """Test that makes sure newly registered users have not accepted the agreement"""
     new_user = NewUser(pid=123456789, onyen="new_user", email="new_user@unc.edu")
@@ -4,7 +4,7 @@ import { Profile } from 'src/app/profile/profile.service';
 import { UserAdminService } from 'src/app/admin/users/user-admin.service';
 import { permissionGuard } from 'src/app/permission.guard';
 
-import { Paginated } from 'src/app/pagination';
+import { Paginated, paginatorLength } from 'src/app/pagination';
 import { PageEvent } from '@angular/material/paginator';
 
 @Component({
@@ -49,6 +49,10 @@ export class AdminUsersListComponent {
     this.page = data.page;
   }
 
+  get pageLength(): number {
+    return paginatorLength(this.page);
+  }
+
   onClick(user: Profile) {
     this.router.navigate(['admin', 'users', user.id]);
   }
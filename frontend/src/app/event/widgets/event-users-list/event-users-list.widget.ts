@@ -9,7 +9,7 @@
 
 import { Component, Input, OnInit } from '@angular/core';
 import { PageEvent } from '@angular/material/paginator';
-import { Paginated } from 'src/app/pagination';
+import { Paginated, paginatorLength } from 'src/app/pagination';
 import { Profile } from 'src/app/models.module';
 import { EventService } from '../../event.service';
 import { Event } from '../../event.model';
@@ -34,6 +34,10 @@ export class EventUsersList implements OnInit {
 
   constructor(private eventService: EventService) {}
 
+  get pageLength(): number {
+    return paginatorLength(this.page);
+  }
+
   ngOnInit() {
     this.eventService
       .getRegisteredUsersForEvent(
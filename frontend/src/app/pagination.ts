@@ -3,6 +3,7 @@ export interface PaginationParams {
   page_size: number;
   order_by: string;
   filter: string;
+  cursor?: string;
 }
 
 export interface EventPaginationParams {
@@ -15,12 +16,29 @@ export interface EventPaginationParams {
 
 export interface Paginated<T> {
   items: T[];
-  length: number;
+  length: number | null;
   params: PaginationParams;
+  next_cursor: string | null;
 }
 
 export interface PaginatedEvent<T> {
   items: T[];
-  length: number;
+  length: number | null;
   params: EventPaginationParams;
+  next_cursor: string | null;
+}
+
+/**
+ * Returns the number of items a paginator should report for a page.
+ *
+ * Cursor pages do not count the unpaginated results, so their `length` is null. The length
+ * is then estimated from the items up to and including this page, plus one more page when
+ * there is a next cursor.
+ */
+export function paginatorLength<T>(page: Paginated<T>): number {
+  if (page.length !== null) {
+    return page.length;
+  }
+  const seen = page.params.page * page.params.page_size + page.items.length;
+  return page.next_cursor !== null ? seen + page.params.page_size : seen;
 }